@@ -0,0 +1,5 @@
+"""Benchmark inti kimia (parsing, massa, komposisi) dan rerun halaman Streamlit.
+
+Jalankan ``python -m benchmarks run -o hasil.json`` lalu bandingkan dengan
+baseline lewat ``python -m benchmarks compare baseline.json hasil.json``.
+"""
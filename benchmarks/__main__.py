@@ -0,0 +1,136 @@
+"""CLI benchmark: ``python -m benchmarks run`` dan ``python -m benchmarks compare``.
+
+``run`` mengukur setiap benchmark dengan ``timeit`` (jumlah iterasi dipilih
+otomatis, lalu diulang ``--repeat`` kali) dan menyimpan median serta minimum
+per panggilan ke JSON. ``compare`` membandingkan median hasil dengan baseline
+dan keluar dengan kode 1 bila ada yang lebih lambat dari ambang.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+# Perlambatan median relatif yang dianggap regresi
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_REPEAT = 5
+# Benchmark halaman jauh lebih lambat; iterasi per ulangan dibatasi
+PAGE_NUMBER = 1
+
+
+def _environment():
+    import numpy
+    import streamlit
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__,
+        "streamlit": streamlit.__version__,
+    }
+
+
+def measure(func, repeat=DEFAULT_REPEAT, number=None):
+    """Waktu per panggilan (detik): median dan minimum dari ``repeat`` ulangan"""
+    timer = timeit.Timer(func)
+    if number is None:
+        number, _ = timer.autorange()
+    timings = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {"median": statistics.median(timings), "min": min(timings), "number": number, "repeat": repeat}
+
+
+def run(args):
+    from . import micro, pages
+
+    sources = []
+    if args.suite in ("all", "micro"):
+        sources.append((micro.iter_benchmarks(args.filter), None))
+    if args.suite in ("all", "pages"):
+        sources.append((pages.iter_benchmarks(args.filter), PAGE_NUMBER))
+
+    results = {}
+    for benchmarks, number in sources:
+        for name, func, items, error in benchmarks:
+            result = measure(func, args.repeat, number)
+            result["per_item"] = result["median"] / items
+            if error:
+                result["error"] = error
+            results[name] = result
+            print(f"{name:40} {result['median'] * 1000:10.3f} ms{'  ⚠ ' + error if error else ''}", file=sys.stderr)
+
+    report = {"environment": _environment(), "results": results}
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        json.dump(report, out, indent=2, ensure_ascii=False)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def compare(args):
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)["results"]
+    with open(args.current, encoding="utf-8") as handle:
+        current = json.load(handle)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':40} {'baseline':>12} {'sekarang':>12} {'rasio':>7}")
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current or name not in baseline:
+            print(f"{name:40} {'(hanya di ' + ('baseline' if name in baseline else 'hasil') + ')':>33}")
+            continue
+        before, after = baseline[name]["median"], current[name]["median"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESI"
+            regressions += 1
+        elif ratio < 1 - args.threshold:
+            flag = "  lebih cepat"
+        print(f"{name:40} {before * 1000:10.3f}ms {after * 1000:10.3f}ms {ratio:7.2f}{flag}")
+
+    print(f"\n{regressions} regresi (ambang {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark molcalc dan halaman aplikasi.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="jalankan benchmark dan tulis hasil JSON")
+    run_parser.add_argument("--suite", choices=("all", "micro", "pages"), default="all")
+    run_parser.add_argument("-k", "--filter", action="append",
+                            help="hanya benchmark yang namanya memuat teks ini (boleh diulang)")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("-o", "--output", default="-", help="file JSON keluaran; '-' untuk stdout")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="bandingkan hasil dengan baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="perlambatan relatif yang dianggap regresi (bawaan: 0.15)")
+    compare_parser.set_defaults(handler=compare)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
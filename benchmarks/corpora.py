@@ -0,0 +1,51 @@
+"""Korpus rumus tetap untuk benchmark.
+
+Korpus dibangun secara deterministik (tanpa bilangan acak) sehingga hasil
+antar-commit dapat dibandingkan langsung.
+"""
+
+SHORT = (
+    "H2O", "NaCl", "CO2", "NH3", "CH4", "O2", "HCl", "NaOH", "KCl", "CaO",
+    "H2SO4", "HNO3", "H3PO4", "CaCO3", "NaHCO3", "KMnO4", "C2H5OH", "CH3COOH", "C6H12O6", "C12H22O11",
+    "Fe2O3", "Al2O3", "SiO2", "MgCl2", "CuSO4", "ZnSO4", "AgNO3", "BaCl2", "K2Cr2O7", "Na2S2O3",
+    "C6H6", "C8H18", "C3H8", "C2H4", "C2H2", "CH3OH", "C6H5OH", "C7H6O2", "C9H8O4", "C8H10N4O2",
+    "NH4Cl", "NH4NO3", "KBr", "LiF", "MgO", "SO2", "NO2", "N2O", "H2O2", "O3",
+)
+
+HYDRATES = (
+    "CuSO4·5H2O", "MgSO4·7H2O", "Na2CO3·10H2O", "CaSO4·2H2O", "FeSO4·7H2O",
+    "CoCl2·6H2O", "Al2(SO4)3·18H2O", "Na2B4O7·10H2O", "KAl(SO4)2·12H2O", "ZnSO4·7H2O",
+    "BaCl2·2H2O", "NiSO4·6H2O", "Na2SO4·10H2O", "CaCl2·6H2O", "MnSO4·4H2O",
+    "(NH4)2Fe(SO4)2·6H2O", "Cu(NO3)2·3H2O", "Fe(NO3)3·9H2O", "Na3PO4·12H2O", "Mg(NO3)2·6H2O",
+)
+
+_NESTED_UNITS = ("CH3", "NO2", "SO4", "PO4", "C6H5", "OH", "CN", "NH2")
+
+
+def _nested(depth, offset):
+    """Rumus dengan ``depth`` tingkat kurung bersarang, misalnya ``((CH3)2NO2)3``"""
+    formula = _NESTED_UNITS[offset % len(_NESTED_UNITS)]
+    for level in range(1, depth + 1):
+        unit = _NESTED_UNITS[(offset + level) % len(_NESTED_UNITS)]
+        formula = f"({formula}{unit}){level % 4 + 2}"
+    return f"Fe{formula}"
+
+
+NESTED = tuple(_nested(depth, offset) for depth in range(2, 12) for offset in range(4))
+
+_POLYMER_UNITS = ("CH2", "CH(CH3)", "C6H4", "O", "CO", "NH", "CF2", "C(CH3)2", "Si(CH3)2O")
+
+
+def _polymer(length):
+    """Rantai panjang gabungan unit monomer, misalnya ``CH2CH(CH3)C6H4O...``"""
+    return "".join(_POLYMER_UNITS[i % len(_POLYMER_UNITS)] for i in range(length))
+
+
+POLYMERS = tuple(_polymer(length) for length in (100, 500, 1000, 2500, 5000))
+
+CORPORA = {
+    "short": SHORT,
+    "nested": NESTED,
+    "hydrates": HYDRATES,
+    "polymers": POLYMERS,
+}
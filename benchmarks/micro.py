@@ -0,0 +1,75 @@
+"""Micro-benchmark parsing, massa molar, dan komposisi per korpus.
+
+Parsing diukur dua kali: ``cold`` mengosongkan cache LRU parser sebelum setiap
+lintasan korpus, ``warm`` memakai cache yang sudah terisi. Massa dan komposisi
+memakai hasil parsing yang sudah disiapkan sehingga hanya fungsi itu yang
+diukur.
+"""
+from molcalc.composition import calculate_composition, molar_mass
+from molcalc.parser import clear_parse_cache, parse_formula
+
+from .corpora import CORPORA
+
+
+def _parse_cold(corpus):
+    def run():
+        clear_parse_cache()
+        for formula in corpus:
+            parse_formula(formula)
+    return run
+
+
+def _parse_warm(corpus):
+    for formula in corpus:
+        parse_formula(formula)
+
+    def run():
+        for formula in corpus:
+            parse_formula(formula)
+    return run
+
+
+def _mass(corpus):
+    parsed = [parse_formula(formula).elements for formula in corpus]
+
+    def run():
+        for elements in parsed:
+            molar_mass(elements)
+    return run
+
+
+def _composition(corpus):
+    parsed = [(parse_formula(formula).elements, molar_mass(parse_formula(formula).elements)) for formula in corpus]
+
+    def run():
+        for elements, mass in parsed:
+            calculate_composition(elements, mass)
+    return run
+
+
+def _batch(corpus):
+    from molcalc.batch import evaluate_formulas
+
+    def run():
+        clear_parse_cache()
+        evaluate_formulas(corpus)
+    return run
+
+
+CASES = {
+    "parse.cold": _parse_cold,
+    "parse.warm": _parse_warm,
+    "mass": _mass,
+    "composition": _composition,
+    "batch": _batch,
+}
+
+
+def iter_benchmarks(selected=None):
+    """``(nama, fungsi, jumlah rumus, error)`` untuk setiap kasus × korpus"""
+    for case, build in CASES.items():
+        for corpus_name, corpus in CORPORA.items():
+            name = f"micro.{case}.{corpus_name}"
+            if selected and not any(pattern in name for pattern in selected):
+                continue
+            yield name, build(corpus), len(corpus), None
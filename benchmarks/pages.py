@@ -0,0 +1,40 @@
+"""Waktu rerun seluruh skrip per halaman menu lewat ``streamlit.testing.v1.AppTest``.
+
+Setiap halaman dijalankan sekali untuk pemanasan (import, cache resource),
+lalu setiap ``AppTest.run()`` berikutnya diukur sebagai satu rerun penuh.
+Riwayat ditulis ke direktori data sementara agar tidak mengotori data pengguna.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+APP_FILE = Path(__file__).resolve().parent.parent / "streamlit_app.py"
+RUN_TIMEOUT = 120
+
+PAGES = (
+    "🏠 Dashboard",
+    "🧪 Kalkulator",
+    "📊 Analisis",
+    "🔍 Database",
+    "📈 Visualisasi",
+    "📚 Pembelajaran",
+    "⚗️ Laboratorium",
+    "📋 Riwayat",
+    "ℹ️ Tentang",
+)
+
+
+def iter_benchmarks(selected=None):
+    """``(nama, fungsi, 1, error)`` untuk setiap halaman; fungsi memicu satu rerun"""
+    os.environ.setdefault("MOLCALC_DATA_DIR", tempfile.mkdtemp(prefix="molcalc-bench-"))
+    from streamlit.testing.v1 import AppTest
+
+    for page in PAGES:
+        name = f"page.{page.split(' ', 1)[1].lower()}"
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        app = AppTest.from_file(str(APP_FILE), default_timeout=RUN_TIMEOUT)
+        app.session_state["menu"] = page
+        app.run()
+        error = "; ".join(str(exception.value) for exception in app.exception) or None
+        yield name, app.run, 1, error
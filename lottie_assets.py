@@ -0,0 +1,175 @@
+"""Cache aset animasi Lottie di disk yang tidak pernah memblokir render.
+
+``LottieCache.get`` selalu langsung mengembalikan data dari memori, cache disk,
+atau salinan bawaan di ``assets/lottie``. Pengambilan dari jaringan berjalan di
+thread latar; kegagalan dicatat dengan TTL negative-cache yang berlipat setiap
+kali gagal sehingga host tanpa internet tidak terus mencoba.
+
+Salinan bawaan per animasi dapat diletakkan di ``assets/lottie/<nama>.json``;
+bila tidak ada, ``fallback.json`` dipakai. Cache disk dapat diisi lebih dulu
+dengan ``python lottie_assets.py --prefetch``.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+
+LOTTIE_URLS = {
+    "sidebar": "https://lottie.host/a64c7ff9-346e-4e72-b656-e337097d3bde/yHrJbTdVlE.json",
+    "dashboard": "https://lottie.host/b592895d-f9e1-43b1-bf8e-dea5b80b8a25/h9K58rIqKT.json",
+    "calculator": "https://lottie.host/5ee6c7e7-3c7b-473f-b75c-df412fe210cc/kF9j77AAsG.json",
+    "empty": "https://lottie.host/4a584f69-29b5-40a0-a133-a15f4775ec6d/O3pamPxHLp.json",
+    "about": "https://lottie.host/49626c27-b23c-475e-8505-981d510c0e61/lag9aGftQv.json",
+}
+
+BUNDLED_DIR = Path(__file__).resolve().parent / "assets" / "lottie"
+CACHE_DIR = Path(os.environ.get("MOLCALC_CACHE_DIR", Path.home() / ".cache" / "molcalc")) / "lottie"
+
+FETCH_TIMEOUT = 5
+# Umur maksimum salinan disk sebelum diperbarui di latar
+MAX_AGE = 7 * 24 * 3600
+# TTL negative-cache: 60 detik, berlipat tiap kegagalan, maksimal 1 jam
+NEGATIVE_TTL = 60
+MAX_NEGATIVE_TTL = 3600
+
+
+def _fetch_json(url, timeout):
+    import requests
+
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+class LottieCache:
+    """Cache animasi Lottie tiga tingkat: memori, disk, dan salinan bawaan."""
+
+    def __init__(self, urls=None, cache_dir=CACHE_DIR, bundled_dir=BUNDLED_DIR, fetch=_fetch_json):
+        self.urls = dict(LOTTIE_URLS if urls is None else urls)
+        self.cache_dir = Path(cache_dir)
+        self.bundled_dir = Path(bundled_dir)
+        self._fetch = fetch
+        self._memory = {}
+        self._inflight = {}
+        self._failures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lottie-fetch")
+
+    def _path(self, name, suffix):
+        digest = hashlib.sha1(self.urls[name].encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{name}-{digest}{suffix}"
+
+    def get(self, name):
+        """Data animasi ``name`` tanpa menunggu jaringan (None bila tidak ada sama sekali)"""
+        with self._lock:
+            entry = self._memory.get(name)
+        if entry is None:
+            entry = self._load_local(name)
+            with self._lock:
+                self._memory.setdefault(name, entry)
+        data, fresh = entry
+        if not fresh:
+            self._schedule(name)
+        return data
+
+    def _load_local(self, name):
+        path = self._path(name, ".json")
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return data, time.time() - path.stat().st_mtime < MAX_AGE
+        except (OSError, ValueError):
+            pass
+        for bundled in (self.bundled_dir / f"{name}.json", self.bundled_dir / "fallback.json"):
+            try:
+                return json.loads(bundled.read_text(encoding="utf-8")), False
+            except (OSError, ValueError):
+                continue
+        return None, False
+
+    def failure_state(self, name):
+        """``(jumlah gagal, waktu boleh mencoba lagi)`` dari negative-cache"""
+        state = self._failures.get(name)
+        if state is None:
+            try:
+                stored = json.loads(self._path(name, ".fail.json").read_text(encoding="utf-8"))
+                state = (stored["failures"], stored["retry_at"])
+            except (OSError, ValueError, KeyError):
+                state = (0, 0.0)
+            self._failures[name] = state
+        return state
+
+    def _schedule(self, name):
+        with self._lock:
+            future = self._inflight.get(name)
+            if future is not None:
+                return future
+            if self.failure_state(name)[1] > time.time():
+                return None
+            future = self._executor.submit(self._refresh, name)
+            self._inflight[name] = future
+            return future
+
+    def _refresh(self, name):
+        try:
+            data = self._fetch(self.urls[name], FETCH_TIMEOUT)
+            if not isinstance(data, dict) or "layers" not in data:
+                raise ValueError("bukan animasi Lottie")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(name, ".json")
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temporary, path)
+            self._path(name, ".fail.json").unlink(missing_ok=True)
+            with self._lock:
+                self._memory[name] = (data, True)
+                self._failures[name] = (0, 0.0)
+            return True
+        except Exception:
+            # Baca dan perbarui negative-cache secara atomik (failure_state tidak mengunci sendiri)
+            with self._lock:
+                failures = self.failure_state(name)[0] + 1
+                ttl = min(NEGATIVE_TTL * 2 ** (failures - 1), MAX_NEGATIVE_TTL)
+                retry_at = time.time() + ttl
+                self._failures[name] = (failures, retry_at)
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._path(name, ".fail.json").write_text(
+                    json.dumps({"failures": failures, "retry_at": retry_at}), encoding="utf-8"
+                )
+            except OSError:
+                pass
+            return False
+        finally:
+            with self._lock:
+                self._inflight.pop(name, None)
+
+    def prefetch(self, wait_timeout=None):
+        """Jadwalkan pengambilan animasi yang belum segar; tunggu bila ``wait_timeout`` diberikan"""
+        futures = {}
+        for name in self.urls:
+            if not self._load_local(name)[1]:
+                future = self._schedule(name)
+                if future is not None:
+                    futures[name] = future
+        if wait_timeout is not None and futures:
+            wait(futures.values(), timeout=wait_timeout)
+        return futures
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--prefetch" not in sys.argv[1:]:
+        sys.exit("Pemakaian: python lottie_assets.py --prefetch")
+    cache = LottieCache()
+    futures = cache.prefetch(wait_timeout=FETCH_TIMEOUT * 3)
+    for name in cache.urls:
+        future = futures.get(name)
+        if future is None:
+            status = "segar" if cache._load_local(name)[1] else "ditunda (negative-cache)"
+        else:
+            status = "ok" if future.done() and future.result() else "gagal"
+        print(f"{name}: {status}")
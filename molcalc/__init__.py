@@ -0,0 +1,8 @@
+"""Inti perhitungan kimia Advanced Molecular Mass Calculator.
+
+Paket ini tidak mengimpor Streamlit, Plotly, Pandas, maupun NumPy saat diimpor;
+modul batch/paralel/streaming yang memakai NumPy dimuat terpisah.
+"""
+from .composition import calculate_composition, calculate_empirical_formula, format_formula, molar_mass
+from .elements import ELEMENTS, ElementTable, massa_atom, massa_atom_data
+from .parser import ParseResult, normalize_formula, parse_formula
@@ -0,0 +1,116 @@
+"""API batch massa molar berbasis matriks.
+
+Sejumlah N rumus di-parse (memakai cache parser), lalu disusun menjadi matriks
+jumlah atom senyawa × unsur. Semua massa molar didapat dari satu perkalian
+matriks–vektor terhadap kolom massa tabel ``ELEMENTS``, dan persentase
+komposisi dari satu operasi broadcasting.
+"""
+from itertools import chain
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .composition import calculate_composition
+from .elements import ELEMENTS
+from .parser import parse_formula
+
+# Urutan kolom baku mengikuti urutan tabel unsur (nomor atom)
+_SYMBOL_ORDER = ELEMENTS.by_symbol
+_MASS_VECTOR = np.frombuffer(ELEMENTS.mass, dtype=np.float64)
+
+
+def atomic_mass_vector(symbols):
+    """Vektor massa atom untuk urutan simbol yang diberikan"""
+    return _MASS_VECTOR[[_SYMBOL_ORDER[s] for s in symbols]]
+
+
+class BatchResult(NamedTuple):
+    """Hasil evaluasi batch: satu baris per rumus, satu kolom per unsur."""
+    formulas: Tuple[str, ...]
+    symbols: Tuple[str, ...]
+    counts: np.ndarray
+    masses: np.ndarray
+    errors: Tuple[Optional[str], ...]
+
+    @property
+    def valid(self):
+        """Mask baris yang berhasil di-parse"""
+        return ~np.isnan(self.masses)
+
+    def element_masses(self):
+        """Kontribusi massa tiap unsur (g/mol), matriks N × E"""
+        return self.counts * atomic_mass_vector(self.symbols)
+
+    def percentages(self):
+        """Persentase massa tiap unsur, matriks N × E"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.element_masses() / self.masses[:, None] * 100
+
+    def composition(self, row):
+        """Komposisi baris ``row`` dalam format ``calculate_composition``"""
+        if self.errors[row] is not None:
+            return None
+        elements = parse_formula(self.formulas[row]).elements
+        return calculate_composition(elements, float(self.masses[row]))
+
+
+def count_matrix(formulas: Sequence[str]):
+    """Parse semua rumus dan susun matriks jumlah atom senyawa × unsur"""
+    row_lengths, symbols_seen, values = [], [], []
+    errors = []
+
+    for formula in formulas:
+        result = parse_formula(formula)
+        elements = result.elements
+        errors.append(result.error)
+        row_lengths.append(len(elements))
+        symbols_seen.extend(elements)
+        values.extend(elements.values())
+
+    # Indeks kolom dalam urutan tabel unsur, hanya untuk unsur yang muncul
+    table_columns = np.fromiter(map(_SYMBOL_ORDER.__getitem__, symbols_seen), dtype=np.intp,
+                                count=len(symbols_seen))
+    present, columns = np.unique(table_columns, return_inverse=True)
+    symbols = tuple(ELEMENTS.symbol[index] for index in present.tolist())
+
+    rows = np.repeat(np.arange(len(formulas), dtype=np.intp), row_lengths)
+    counts = np.zeros((len(formulas), len(symbols)), dtype=np.float64)
+    counts[rows, columns] = values
+    return symbols, counts, tuple(errors)
+
+
+def evaluate_formulas(formulas: Sequence[str]):
+    """Hitung massa molar semua rumus sekaligus; baris gagal bernilai NaN"""
+    formulas = tuple(formulas)
+    symbols, counts, errors = count_matrix(formulas)
+    masses = counts @ atomic_mass_vector(symbols)
+    failed = [row for row, error in enumerate(errors) if error is not None]
+    if failed:
+        masses[failed] = np.nan
+    return BatchResult(formulas, symbols, counts, masses, errors)
+
+
+def merge_results(results):
+    """Gabungkan beberapa ``BatchResult`` berurutan menjadi satu"""
+    results = list(results)
+    if len(results) == 1:
+        return results[0]
+    if not results:
+        return evaluate_formulas(())
+
+    symbols = tuple(sorted(set().union(*(r.symbols for r in results)), key=_SYMBOL_ORDER.__getitem__))
+    column = {symbol: index for index, symbol in enumerate(symbols)}
+    counts = np.zeros((sum(len(r.formulas) for r in results), len(symbols)), dtype=np.float64)
+    start = 0
+    for result in results:
+        end = start + len(result.formulas)
+        counts[start:end, [column[s] for s in result.symbols]] = result.counts
+        start = end
+
+    return BatchResult(
+        tuple(chain.from_iterable(r.formulas for r in results)),
+        symbols,
+        counts,
+        np.concatenate([r.masses for r in results]),
+        tuple(chain.from_iterable(r.errors for r in results))
+    )
@@ -0,0 +1,147 @@
+"""Antarmuka baris perintah: ``python -m molcalc``.
+
+Membaca rumus dari stdin atau file (satu per baris, atau CSV) dan menulis
+massa molar serta komposisi sebagai CSV atau JSON lines. Dengan ``--balance``
+setiap baris adalah persamaan reaksi yang disetarakan. Jalur bawaan hanya
+memakai modul standar dan inti molcalc agar start proses tetap cepat; NumPy
+baru dimuat bila ``--workers`` lebih dari 1.
+"""
+import argparse
+import csv
+import json
+import sys
+
+from .composition import calculate_composition, molar_mass
+from .equations import balance_equations
+from .parser import parse_formula
+from .sources import iter_formulas
+
+CSV_FIELDS = ("formula", "mass", "composition", "error")
+BALANCE_FIELDS = ("equation", "balanced", "coefficients", "error")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m molcalc",
+        description="Hitung massa molar dan komposisi rumus kimia."
+    )
+    parser.add_argument("files", nargs="*", default=["-"],
+                        help="file input (satu rumus per baris, atau CSV); '-' untuk stdin")
+    parser.add_argument("-f", "--format", choices=("csv", "jsonl"), default="csv",
+                        help="format keluaran (bawaan: csv)")
+    parser.add_argument("-o", "--output", default="-", help="file keluaran; '-' untuk stdout")
+    parser.add_argument("--csv", action="store_true",
+                        help="perlakukan input sebagai CSV (otomatis untuk file *.csv)")
+    parser.add_argument("--precision", type=int, default=4, help="jumlah desimal keluaran CSV")
+    parser.add_argument("--no-composition", dest="composition", action="store_false",
+                        help="jangan sertakan komposisi persentase")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="jumlah proses untuk input besar (bawaan: 1)")
+    parser.add_argument("--balance", action="store_true",
+                        help="setarakan persamaan reaksi (satu per baris) alih-alih menghitung massa")
+    return parser
+
+
+def iter_input(paths, force_csv=False):
+    """Rumus dari semua file input secara berurutan"""
+    for path in paths:
+        if path == "-":
+            yield from iter_formulas(sys.stdin, csv_format=force_csv)
+            continue
+        with open(path, newline="", encoding="utf-8") as lines:
+            yield from iter_formulas(lines, csv_format=force_csv or path.lower().endswith(".csv"))
+
+
+def iter_records(formulas, workers=1):
+    """Hasilkan (rumus, massa, komposisi, error) untuk setiap rumus"""
+    if workers > 1:
+        from .streaming import evaluate_stream
+
+        for result in evaluate_stream(formulas, workers=workers):
+            for row, formula in enumerate(result.formulas):
+                error = result.errors[row]
+                if error is not None:
+                    yield formula, None, None, error
+                else:
+                    yield formula, float(result.masses[row]), result.composition(row), None
+        return
+
+    for formula in formulas:
+        result = parse_formula(formula)
+        if not result.ok:
+            yield formula, None, None, result.error
+            continue
+        mass = molar_mass(result.elements)
+        yield formula, mass, calculate_composition(result.elements, mass), None
+
+
+def write_csv(records, out, precision=4, with_composition=True):
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    failed = 0
+    for formula, mass, composition, error in records:
+        if error is not None:
+            failed += 1
+            writer.writerow((formula, "", "", error))
+            continue
+        composition_text = ""
+        if with_composition:
+            composition_text = " ".join(
+                f"{el}:{data['percentage']:.{precision}f}" for el, data in composition.items()
+            )
+        writer.writerow((formula, f"{mass:.{precision}f}", composition_text, ""))
+    return failed
+
+
+def write_jsonl(records, out, with_composition=True):
+    failed = 0
+    for formula, mass, composition, error in records:
+        record = {"formula": formula, "mass": mass, "error": error}
+        if error is not None:
+            failed += 1
+        else:
+            record["elements"] = {el: data['count'] for el, data in composition.items()}
+            if with_composition:
+                record["composition"] = {el: data['percentage'] for el, data in composition.items()}
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+    return failed
+
+
+def write_balanced(results, out, fmt="csv"):
+    writer = csv.writer(out) if fmt == "csv" else None
+    if writer:
+        writer.writerow(BALANCE_FIELDS)
+    failed = 0
+    for result in results:
+        failed += not result.ok
+        coefficients = list(result.coefficients)
+        if writer:
+            writer.writerow((result.equation, result.balanced, " ".join(map(str, coefficients)), result.error or ""))
+            continue
+        record = {"equation": result.equation, "balanced": result.balanced or None,
+                  "coefficients": coefficients, "error": result.error}
+        if result.basis:
+            record["basis"] = [list(vector) for vector in result.basis]
+        out.write(json.dumps(record, ensure_ascii=False))
+        out.write("\n")
+    return failed
+
+
+def main(argv=None):
+    """Jalankan CLI; kode keluar 1 bila ada rumus yang gagal di-parse atau disetarakan"""
+    args = build_parser().parse_args(argv)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        if args.balance:
+            failed = write_balanced(balance_equations(iter_input(args.files, args.csv)), out, args.format)
+        else:
+            records = iter_records(iter_input(args.files, args.csv), args.workers)
+            if args.format == "jsonl":
+                failed = write_jsonl(records, out, args.composition)
+            else:
+                failed = write_csv(records, out, args.precision, args.composition)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
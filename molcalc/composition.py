@@ -0,0 +1,77 @@
+"""Massa molar, komposisi persentase, dan rumus empiris.
+
+Hanya memakai Python murni dan tabel unsur sehingga dapat diimpor oleh job
+batch, CLI, dan tes tanpa biaya start Streamlit maupun NumPy.
+"""
+import math
+
+from .elements import massa_atom
+
+# Simpangan maksimum rasio mol (setelah dikali) dari bilangan bulat
+EMPIRICAL_TOLERANCE = 0.1
+MAX_MULTIPLIER = 10
+
+
+def molar_mass(elements):
+    """Massa molar dari hasil parsing ``{unsur: jumlah}``"""
+    return sum(massa_atom[el] * count for el, count in elements.items())
+
+
+def format_formula(elements):
+    """Tulis ``{unsur: jumlah}`` sebagai rumus, misalnya ``{'C': 1, 'H': 2}`` → ``CH2``"""
+    return "".join(f"{el}{count if count != 1 else ''}" for el, count in elements.items() if count)
+
+
+def hill_order(elements):
+    """Urutkan unsur menurut sistem Hill: C, H, lalu alfabetis (alfabetis penuh bila tanpa C)"""
+    if elements.get("C"):
+        head = [el for el in ("C", "H") if elements.get(el)]
+    else:
+        head = []
+    rest = sorted(el for el, count in elements.items() if count and el not in head)
+    return {el: elements[el] for el in head + rest}
+
+
+# Fungsi untuk menghitung persentase komposisi
+def calculate_composition(elements, total_mass):
+    """Hitung persentase komposisi setiap unsur"""
+    composition = {}
+    for element, count in elements.items():
+        element_mass = massa_atom[element] * count
+        percentage = (element_mass / total_mass) * 100
+        composition[element] = {
+            'count': count,
+            'mass': element_mass,
+            'percentage': percentage
+        }
+    return composition
+
+
+# Fungsi untuk menghitung rumus empiris
+def calculate_empirical_formula(composition, tolerance=EMPIRICAL_TOLERANCE, max_multiplier=MAX_MULTIPLIER):
+    """Hitung rumus empiris dari persentase komposisi"""
+    # Konversi persentase ke mol
+    moles = {}
+    for element, data in composition.items():
+        if data['percentage'] > 0:
+            moles[element] = data['percentage'] / massa_atom[element]
+    
+    # Cari rasio terkecil
+    min_moles = min(moles.values())
+    ratios = {el: moles[el] / min_moles for el in moles}
+    
+    # Pengali bulat terkecil yang membuat semua rasio mendekati bilangan bulat
+    # (1.5 → ×2, 1.33 → ×3); bila tidak ada, pakai pengali dengan simpangan terkecil
+    best_multiplier, best_deviation = 1, math.inf
+    for multiplier in range(1, max_multiplier + 1):
+        deviation = max(abs(r * multiplier - round(r * multiplier)) for r in ratios.values())
+        if deviation < best_deviation:
+            best_multiplier, best_deviation = multiplier, deviation
+        if deviation <= tolerance:
+            break
+    
+    empirical = {}
+    for element, ratio in ratios.items():
+        empirical[element] = round(ratio * best_multiplier)
+    
+    return empirical
@@ -0,0 +1,196 @@
+"""Tabel data unsur kimia yang dipakai bersama oleh seluruh aplikasi.
+
+Data 118 unsur dimuat sekali dari ``data/elements.csv`` ke dalam kolom
+``array.array`` yang ringkas (satu kolom per properti, satu baris per unsur
+berurutan menurut nomor atom). Indeks simbol, nomor atom, golongan, periode,
+dan kategori dihitung sekali saat dimuat. Isotop dari ``data/isotopes.csv``
+baru dimuat saat pertama kali dibutuhkan.
+
+``massa_atom`` (simbol → massa) dan ``massa_atom_data`` (simbol → dict) tetap
+tersedia untuk kode lama; ``massa_atom_data`` kini hanya tampilan baca-saja di
+atas tabel kolom.
+"""
+import csv
+import hashlib
+import math
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+ELEMENTS_FILE = DATA_DIR / "elements.csv"
+ISOTOPES_FILE = DATA_DIR / "isotopes.csv"
+
+# Kolom bilangan real (NaN bila tidak diketahui) dan bulat (0 bila tidak ada)
+FLOAT_COLUMNS = ("mass", "electronegativity", "atomic_radius", "covalent_radius")
+INT_COLUMNS = ("number", "group", "period")
+TEXT_COLUMNS = ("symbol", "name", "category")
+
+
+class Isotope(NamedTuple):
+    """Satu isotop: nomor massa, massa (u), dan kelimpahan alami (fraksi)."""
+    mass_number: int
+    mass: float
+    abundance: float
+
+
+def _index(values):
+    """Peta nilai → tuple baris, dalam urutan kemunculan"""
+    index = {}
+    for row, value in enumerate(values):
+        if value:
+            index.setdefault(value, []).append(row)
+    return {value: tuple(rows) for value, rows in index.items()}
+
+
+class ElementTable:
+    """Tabel unsur berbentuk kolom dengan indeks yang dihitung sekali."""
+
+    def __init__(self, path=ELEMENTS_FILE, isotopes_path=ISOTOPES_FILE):
+        self._isotopes_path = Path(isotopes_path)
+        self._isotopes = None
+        digest = hashlib.sha1()
+
+        self.mass = array("d")
+        # Setengah satuan digit terakhir massa atom di tabel (batas pembulatan)
+        self.mass_tolerance = array("d")
+        self.electronegativity = array("d")
+        self.atomic_radius = array("d")
+        self.covalent_radius = array("d")
+        self.number = array("H")
+        self.group = array("B")
+        self.period = array("B")
+        symbols, names, categories = [], [], []
+
+        raw = Path(path).read_bytes()
+        digest.update(raw)
+        for record in csv.DictReader(raw.decode("utf-8").splitlines()):
+            for column in FLOAT_COLUMNS:
+                getattr(self, column).append(float(record[column]) if record[column] else math.nan)
+            for column in INT_COLUMNS:
+                getattr(self, column).append(int(record[column]) if record[column] else 0)
+            decimals = record["mass"].partition(".")[2]
+            self.mass_tolerance.append(0.5 * 10.0 ** -len(decimals))
+            symbols.append(record["symbol"])
+            names.append(record["name"])
+            categories.append(record["category"])
+
+        self.symbol = tuple(symbols)
+        self.name = tuple(names)
+        self.category = tuple(categories)
+
+        self.by_symbol = {symbol: row for row, symbol in enumerate(self.symbol)}
+        self.by_number = {number: row for row, number in enumerate(self.number)}
+        self.by_group = _index(self.group)
+        self.by_period = _index(self.period)
+        self.by_category = _index(self.category)
+
+        if self._isotopes_path.exists():
+            digest.update(self._isotopes_path.read_bytes())
+        # Berubah setiap kali file data berubah; dipakai sebagai kunci cache
+        self.version = digest.hexdigest()[:12]
+
+    def __len__(self):
+        return len(self.symbol)
+
+    def __contains__(self, symbol):
+        return symbol in self.by_symbol
+
+    @property
+    def categories(self):
+        """Kategori unsur dalam urutan kemunculan"""
+        return tuple(self.by_category)
+
+    @property
+    def periods(self):
+        return tuple(sorted(self.by_period))
+
+    @property
+    def groups(self):
+        return tuple(sorted(self.by_group))
+
+    def row(self, symbol):
+        """Properti satu unsur sebagai dict (format lama ``massa_atom_data``)"""
+        index = self.by_symbol[symbol]
+        record = {
+            "mass": self.mass[index],
+            "name": self.name[index],
+            "symbol": self.symbol[index],
+            "number": self.number[index],
+            "group": self.group[index] or None,
+            "period": self.period[index],
+            "category": self.category[index],
+        }
+        for column in FLOAT_COLUMNS[1:]:
+            value = getattr(self, column)[index]
+            record[column] = None if math.isnan(value) else value
+        return record
+
+    def name_of(self, symbol, default=None):
+        index = self.by_symbol.get(symbol)
+        return default if index is None else self.name[index]
+
+    def columns(self, rows=None):
+        """Kolom tabel (seluruhnya atau baris ``rows``) sebagai dict list, siap untuk DataFrame"""
+        if rows is None:
+            rows = range(len(self))
+        data = {}
+        for column in INT_COLUMNS + TEXT_COLUMNS + FLOAT_COLUMNS:
+            values = getattr(self, column)
+            data[column] = [values[row] for row in rows]
+        data["group"] = [group or None for group in data["group"]]
+        return data
+
+    def _load_isotopes(self):
+        # Disimpan ala CSR: isotop unsur baris i ada di offsets[i]:offsets[i + 1]
+        grouped = {}
+        with open(self._isotopes_path, newline="", encoding="utf-8") as handle:
+            for record in csv.DictReader(handle):
+                grouped.setdefault(record["symbol"], []).append(
+                    (int(record["mass_number"]), float(record["mass"]), float(record["abundance"]))
+                )
+        offsets = array("I", [0])
+        mass_numbers, masses, abundances = array("H"), array("d"), array("d")
+        for symbol in self.symbol:
+            for mass_number, mass, abundance in grouped.get(symbol, ()):
+                mass_numbers.append(mass_number)
+                masses.append(mass)
+                abundances.append(abundance)
+            offsets.append(len(masses))
+        self._isotopes = (offsets, mass_numbers, masses, abundances)
+
+    def isotopes(self, symbol):
+        """Isotop unsur ``symbol``; unsur radioaktif hanya punya isotop paling stabil"""
+        if self._isotopes is None:
+            self._load_isotopes()
+        offsets, mass_numbers, masses, abundances = self._isotopes
+        index = self.by_symbol[symbol]
+        return tuple(
+            Isotope(mass_numbers[i], masses[i], abundances[i])
+            for i in range(offsets[index], offsets[index + 1])
+        )
+
+
+class _ElementDataView(Mapping):
+    """Tampilan baca-saja simbol → dict di atas ``ElementTable``."""
+
+    def __init__(self, table):
+        self._table = table
+
+    def __getitem__(self, symbol):
+        if symbol not in self._table.by_symbol:
+            raise KeyError(symbol)
+        return self._table.row(symbol)
+
+    def __iter__(self):
+        return iter(self._table.symbol)
+
+    def __len__(self):
+        return len(self._table)
+
+
+ELEMENTS = ElementTable()
+
+massa_atom = dict(zip(ELEMENTS.symbol, ELEMENTS.mass))
+massa_atom_data = _ElementDataView(ELEMENTS)
@@ -0,0 +1,189 @@
+"""Penentuan rumus empiris dan rumus molekul dari analisis unsur secara batch.
+
+Setiap baris input berisi persentase massa unsur (atau massa CO2/H2O dari
+analisis pembakaran) dan opsional massa molar. Semua baris diselesaikan
+sekaligus dengan NumPy: persentase → mol → rasio terhadap mol terkecil, lalu
+dicari pengali bulat terkecil (1..``max_multiplier``) yang membuat semua rasio
+berada dalam ``tolerance`` dari bilangan bulat. Bila massa molar diketahui,
+rumus molekul adalah rumus empiris × round(massa molar / massa empiris).
+
+Oksigen dari selisih 100% (``oxygen_by_difference``) hanya dipakai bila diminta:
+pada sampel tanpa oksigen, galat pengukuran CHN akan terbaca sebagai O palsu.
+"""
+import csv
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .batch import atomic_mass_vector
+from .composition import EMPIRICAL_TOLERANCE, MAX_MULTIPLIER, format_formula, hill_order
+from .elements import ELEMENTS
+
+# Selisih relatif maksimum antara massa molar dan kelipatan massa empiris
+MOLAR_MASS_TOLERANCE = 0.02
+# Sisa di bawah nilai ini tidak dianggap oksigen
+MIN_OXYGEN_PERCENT = 0.5
+
+_C_IN_CO2 = ELEMENTS.mass[ELEMENTS.by_symbol["C"]] / (
+    ELEMENTS.mass[ELEMENTS.by_symbol["C"]] + 2 * ELEMENTS.mass[ELEMENTS.by_symbol["O"]]
+)
+_H_IN_H2O = 2 * ELEMENTS.mass[ELEMENTS.by_symbol["H"]] / (
+    2 * ELEMENTS.mass[ELEMENTS.by_symbol["H"]] + ELEMENTS.mass[ELEMENTS.by_symbol["O"]]
+)
+
+COMBUSTION_COLUMNS = ("sample_mg", "co2_mg", "h2o_mg")
+
+
+class EmpiricalResult(NamedTuple):
+    """Hasil batch: satu baris per sampel, satu kolom per unsur."""
+    symbols: Tuple[str, ...]
+    counts: np.ndarray
+    multipliers: np.ndarray
+    deviations: np.ndarray
+    empirical_masses: np.ndarray
+    molecular_counts: Optional[np.ndarray]
+    molecular_deviations: Optional[np.ndarray]
+    errors: Tuple[Optional[str], ...]
+
+    def formulas(self, molecular=False):
+        """Rumus (empiris, atau molekul bila tersedia) dalam urutan Hill; '' untuk baris tanpa unsur
+
+        Baris dengan peringatan di ``errors`` tetap diberi rumus terbaiknya.
+        """
+        counts = self.molecular_counts if molecular and self.molecular_counts is not None else self.counts
+        return [
+            format_formula(hill_order({s: c for s, c in zip(self.symbols, row) if c}))
+            for row in counts.tolist()
+        ]
+
+
+def combustion_percentages(sample_mass, co2_mass, h2o_mass):
+    """Persentase C dan H dari massa sampel, CO2, dan H2O (satuan massa sama, boleh berupa array)"""
+    sample_mass = np.asarray(sample_mass, dtype=np.float64)
+    carbon = np.asarray(co2_mass, dtype=np.float64) * _C_IN_CO2 / sample_mass * 100
+    hydrogen = np.asarray(h2o_mass, dtype=np.float64) * _H_IN_H2O / sample_mass * 100
+    return carbon, hydrogen
+
+
+def oxygen_by_difference(symbols, percentages, minimum=MIN_OXYGEN_PERCENT):
+    """Tambahkan kolom O = 100 − jumlah persentase lain (0 bila sisa < ``minimum``)"""
+    percentages = np.asarray(percentages, dtype=np.float64)
+    remainder = 100 - np.nansum(percentages, axis=1)
+    remainder[remainder < minimum] = 0.0
+    if "O" in symbols:
+        column = symbols.index("O")
+        percentages = percentages.copy()
+        missing = np.isnan(percentages[:, column])
+        percentages[missing, column] = remainder[missing]
+        return tuple(symbols), percentages
+    return tuple(symbols) + ("O",), np.column_stack([percentages, remainder])
+
+
+def solve_empirical(symbols, percentages, molar_masses=None, tolerance=EMPIRICAL_TOLERANCE,
+                    max_multiplier=MAX_MULTIPLIER):
+    """Selesaikan rumus empiris (dan molekul) untuk matriks persentase N × E sekaligus"""
+    symbols = tuple(symbols)
+    for symbol in symbols:
+        if symbol not in ELEMENTS:
+            raise ValueError(f"Unsur '{symbol}' tidak dikenali")
+    percentages = np.nan_to_num(np.atleast_2d(np.asarray(percentages, dtype=np.float64)), nan=0.0)
+    masses = atomic_mass_vector(symbols)
+    rows = len(percentages)
+
+    errors = [None] * rows
+    moles = np.where(percentages > 0, percentages / masses, 0.0)
+    present = moles > 0
+    min_moles = np.where(present, moles, np.inf).min(axis=1)
+    for row in np.flatnonzero(~np.isfinite(min_moles)).tolist():
+        errors[row] = "Tidak ada persentase unsur yang positif"
+    min_moles[~np.isfinite(min_moles)] = 1.0
+    if (percentages < 0).any():
+        for row in np.flatnonzero((percentages < 0).any(axis=1)).tolist():
+            errors[row] = "Persentase tidak boleh negatif"
+    ratios = moles / min_moles[:, None]
+
+    # Simpangan dari bilangan bulat untuk setiap pengali: N × K
+    multipliers = np.arange(1, max_multiplier + 1, dtype=np.float64)
+    scaled = ratios[:, None, :] * multipliers[None, :, None]
+    deviation = np.abs(scaled - np.rint(scaled)).max(axis=2)
+    within = deviation <= tolerance
+    chosen = np.where(within.any(axis=1), within.argmax(axis=1), deviation.argmin(axis=1))
+    picked = np.arange(rows)
+    counts = np.rint(scaled[picked, chosen]).astype(np.int64)
+    counts[~present] = 0
+    chosen_deviation = deviation[picked, chosen]
+    for row in np.flatnonzero(chosen_deviation > tolerance).tolist():
+        if errors[row] is None:
+            errors[row] = f"Tidak ada pengali ≤ {max_multiplier} dalam toleransi {tolerance}"
+
+    empirical_masses = counts @ masses
+    molecular_counts = molecular_deviations = None
+    if molar_masses is not None:
+        molar_masses = np.asarray(molar_masses, dtype=np.float64).reshape(rows)
+        known = np.isfinite(molar_masses) & (molar_masses > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factors = np.where(known, np.maximum(np.rint(molar_masses / empirical_masses), 1), 1)
+            molecular_deviations = np.where(
+                known, np.abs(molar_masses - factors * empirical_masses) / molar_masses, np.nan
+            )
+        molecular_counts = counts * factors.astype(np.int64)[:, None]
+        for row in np.flatnonzero(molecular_deviations > MOLAR_MASS_TOLERANCE).tolist():
+            if errors[row] is None:
+                errors[row] = "Massa molar bukan kelipatan massa empiris"
+
+    return EmpiricalResult(
+        symbols, counts, multipliers[chosen].astype(np.int64), chosen_deviation,
+        empirical_masses, molecular_counts, molecular_deviations, tuple(errors)
+    )
+
+
+def read_analysis_table(lines):
+    """Baca CSV analisis unsur
+
+    Kolom yang dikenali: simbol unsur (persen massa), ``sample_mg``/``co2_mg``/
+    ``h2o_mg`` (analisis pembakaran), ``molar_mass``, dan ``name``/``sampel``.
+    Kembalikan ``(nama, simbol, matriks persen, massa molar atau None)``.
+    """
+    reader = csv.reader(lines)
+    header = [column.strip() for column in next(reader, [])]
+    if not header:
+        raise ValueError("File kosong")
+    lowered = [column.lower() for column in header]
+    element_columns = [i for i, column in enumerate(header) if column in ELEMENTS]
+    name_column = next((i for i, c in enumerate(lowered) if c in ("name", "nama", "sampel", "sample")), None)
+    molar_column = next((i for i, c in enumerate(lowered) if c in ("molar_mass", "massa_molar", "mr")), None)
+    combustion = [lowered.index(c) if c in lowered else None for c in COMBUSTION_COLUMNS]
+    if not element_columns and None in combustion:
+        raise ValueError("CSV harus memiliki kolom unsur (mis. C, H, O) atau sample_mg, co2_mg, h2o_mg")
+
+    def number(row, index):
+        if index is None or index >= len(row) or not row[index].strip():
+            return np.nan
+        return float(row[index])
+
+    names, values, molar, burn = [], [], [], []
+    for line_number, row in enumerate(reader, start=2):
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            values.append([number(row, i) for i in element_columns])
+            molar.append(number(row, molar_column))
+            burn.append([number(row, i) for i in combustion])
+        except ValueError:
+            raise ValueError(f"Nilai bukan angka pada baris {line_number}")
+        names.append(row[name_column].strip() if name_column is not None else str(len(names) + 1))
+
+    symbols = [header[i] for i in element_columns]
+    percentages = np.array(values, dtype=np.float64).reshape(len(names), len(symbols))
+    if None not in combustion:
+        burn = np.array(burn, dtype=np.float64)
+        carbon, hydrogen = combustion_percentages(burn[:, 0], burn[:, 1], burn[:, 2])
+        for symbol, column in (("C", carbon), ("H", hydrogen)):
+            if symbol in symbols:
+                index = symbols.index(symbol)
+                percentages[:, index] = np.where(np.isnan(percentages[:, index]), column, percentages[:, index])
+            else:
+                symbols.append(symbol)
+                percentages = np.column_stack([percentages, column])
+    molar = np.array(molar, dtype=np.float64)
+    return names, tuple(symbols), percentages, (molar if np.isfinite(molar).any() else None)
@@ -0,0 +1,261 @@
+"""Penyetaraan persamaan reaksi kimia dengan aritmetika bilangan bulat eksak.
+
+Setiap spesies menjadi satu kolom matriks komposisi (baris = unsur, ditambah
+baris muatan bila ada ion); kolom produk diberi tanda negatif. Koefisien
+setara adalah ruang nol (nullspace) matriks tersebut, dihitung dengan eliminasi
+Gauss bebas pecahan: baris dikombinasikan secara silang lalu dibagi FPB-nya,
+sehingga semua entri tetap bilangan bulat kecil tanpa galat floating point.
+
+- dimensi ruang nol 0: reaksi tidak dapat disetarakan;
+- dimensi 1: koefisien unik (dinormalisasi menjadi bilangan bulat terkecil);
+- dimensi > 1: reaksi tidak tertentu (gabungan beberapa reaksi independen).
+
+Hasil ruang nol di-cache berdasarkan kunci kanonik reaksi (komposisi spesies
+terurut per sisi), jadi penulisan ulang spesies atau urutannya tidak dihitung
+ulang.
+
+Spesies dipisah dengan `` + `` (spasi di kedua sisi), sisi dengan ``->``,
+``=``, ``→`` atau ``⇌``. Muatan ditulis ``Fe^3+``, ``Fe{3+}``, ``Fe+3``,
+``NH4+`` atau ``SO4^2-``; elektron ``e-``. Koefisien dan keadaan fisik
+(``(aq)``, ``(s)``, ...) pada input diabaikan.
+"""
+import math
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+from .composition import molar_mass
+from .parser import parse_formula
+
+# Jumlah reaksi kanonik berbeda yang disimpan di cache
+BALANCE_CACHE_SIZE = 8192
+
+_ARROW_RE = re.compile(r"\s*(?:<=>|<->|⇌|⟶|→|->|=>|=)\s*")
+_PLUS_RE = re.compile(r"\s+\+\s+")
+_STATE_RE = re.compile(r"\((?:s|l|g|aq)\)$")
+_COEFFICIENT_RE = re.compile(r"^(\d+)\s*(?=[A-Z(e])")
+_CHARGE_RE = re.compile(
+    r"(?:\^(\d*)([+-])|\{(\d*)([+-])\}|\[(\d*)([+-])\]|([+-])(\d+)|(\++|-+))$"
+)
+_ELECTRON = ("e", "e-", "e^-", "e{-}", "e[-]")
+
+
+class Species(NamedTuple):
+    """Satu spesies reaksi: rumus netral dan muatannya."""
+    text: str
+    formula: str
+    elements: Mapping[str, int]
+    charge: int
+
+    @property
+    def label(self):
+        """Rumus dengan muatan, misalnya ``SO4^2-``"""
+        if not self.charge:
+            return self.formula
+        magnitude = abs(self.charge)
+        return f"{self.formula}^{magnitude if magnitude != 1 else ''}{'+' if self.charge > 0 else '-'}"
+
+    @property
+    def mass(self):
+        return molar_mass(self.elements)
+
+    @property
+    def key(self):
+        return tuple(sorted(self.elements.items())), self.charge
+
+
+class BalanceResult(NamedTuple):
+    """Hasil penyetaraan; ``coefficients`` kosong bila gagal."""
+    equation: str
+    reactants: Tuple[Species, ...] = ()
+    products: Tuple[Species, ...] = ()
+    coefficients: Tuple[int, ...] = ()
+    error: Optional[str] = None
+    basis: Tuple[Tuple[int, ...], ...] = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    @property
+    def species(self):
+        return self.reactants + self.products
+
+    @property
+    def balanced(self):
+        """Persamaan setara, misalnya ``2 H2 + O2 → 2 H2O``"""
+        if not self.ok:
+            return ""
+        terms = [
+            f"{coefficient} {species.label}" if coefficient != 1 else species.label
+            for coefficient, species in zip(self.coefficients, self.species)
+        ]
+        split = len(self.reactants)
+        return " + ".join(terms[:split]) + " → " + " + ".join(terms[split:])
+
+
+def parse_species(text):
+    """Parse satu spesies (dengan muatan) menjadi ``Species``; ``ValueError`` bila gagal"""
+    raw = text
+    text = _STATE_RE.sub("", text.strip())
+    text = _COEFFICIENT_RE.sub("", text)
+    if text in _ELECTRON:
+        return Species(raw, "e", {}, -1)
+
+    charge = 0
+    match = _CHARGE_RE.search(text)
+    if match and match.start() > 0:
+        groups = match.groups()
+        if groups[8]:
+            charge = len(groups[8]) * (1 if groups[8][0] == "+" else -1)
+        elif groups[6]:
+            charge = int(groups[7]) * (1 if groups[6] == "+" else -1)
+        else:
+            digits, sign = next((groups[i], groups[i + 1]) for i in (0, 2, 4) if groups[i + 1])
+            charge = (int(digits) if digits else 1) * (1 if sign == "+" else -1)
+        text = text[:match.start()]
+
+    result = parse_formula(text)
+    if not result.ok:
+        raise ValueError(f"{raw.strip()}: {result.error}")
+    return Species(raw, result.formula, result.elements, charge)
+
+
+def parse_equation(equation):
+    """Pisahkan persamaan menjadi ``(reaktan, produk)`` berupa tuple ``Species``"""
+    sides = _ARROW_RE.split(equation.strip())
+    if len(sides) != 2 or not all(side.strip() for side in sides):
+        raise ValueError("Persamaan harus memiliki tepat satu tanda panah (->) dengan reaktan dan produk")
+    reactants, products = (
+        tuple(parse_species(item) for item in _PLUS_RE.split(side.strip())) for side in sides
+    )
+    return reactants, products
+
+
+def _normalize(vector):
+    """Bilangan bulat terkecil dengan arah yang sama (pecahan → bulat, bagi FPB)"""
+    scale = math.lcm(*(value.denominator for value in vector))
+    integers = [int(value * scale) for value in vector]
+    divisor = math.gcd(*integers) or 1
+    return tuple(value // divisor for value in integers)
+
+
+def nullspace(matrix, columns):
+    """Basis bilangan bulat ruang nol ``matrix`` lewat eliminasi bebas pecahan
+
+    Kembalikan ``(rank, basis)`` dengan satu vektor per kolom bebas.
+    """
+    rows = [list(row) for row in matrix if any(row)]
+    pivots = []
+    for column in range(columns):
+        rank = len(pivots)
+        pivot = next((i for i in range(rank, len(rows)) if rows[i][column]), None)
+        if pivot is None:
+            continue
+        rows[rank], rows[pivot] = rows[pivot], rows[rank]
+        pivot_row = rows[rank]
+        pivot_value = pivot_row[column]
+        for i, row in enumerate(rows):
+            factor = row[column]
+            if i == rank or not factor:
+                continue
+            combined = [pivot_value * a - factor * b for a, b in zip(row, pivot_row)]
+            divisor = math.gcd(*combined)
+            rows[i] = [value // divisor for value in combined] if divisor > 1 else combined
+        pivots.append(column)
+        if len(pivots) == len(rows):
+            break
+
+    basis = []
+    for free in (c for c in range(columns) if c not in pivots):
+        vector = [Fraction(0)] * columns
+        vector[free] = Fraction(1)
+        for row, column in zip(rows, pivots):
+            vector[column] = Fraction(-row[free], row[column])
+        basis.append(_normalize(vector))
+    return len(pivots), tuple(basis)
+
+
+@lru_cache(maxsize=BALANCE_CACHE_SIZE)
+def _solve(left, right):
+    """Ruang nol untuk reaksi kanonik; ``left``/``right`` berisi kunci spesies terurut"""
+    keys = left + right
+    symbols = sorted({symbol for elements, _ in keys for symbol, _ in elements})
+    matrix = []
+    for symbol in symbols:
+        matrix.append([dict(elements).get(symbol, 0) for elements, _ in keys])
+    if any(charge for _, charge in keys):
+        matrix.append([charge for _, charge in keys])
+    for row in matrix:
+        for column in range(len(left), len(keys)):
+            row[column] = -row[column]
+    return nullspace(matrix, len(keys))[1]
+
+
+def _canonical_basis(reactants, products):
+    """Basis ruang nol dari cache, dipetakan kembali ke urutan spesies input"""
+    keys = [species.key for species in reactants + products]
+    split = len(reactants)
+    left = sorted(range(split), key=keys.__getitem__)
+    right = sorted(range(split, len(keys)), key=keys.__getitem__)
+    left_keys, right_keys = tuple(keys[i] for i in left), tuple(keys[i] for i in right)
+    # Reaksi A → B dan B → A memiliki ruang nol yang sama (berbeda tanda)
+    if right_keys < left_keys:
+        left, right, left_keys, right_keys = right, left, right_keys, left_keys
+    order = left + right
+    basis = []
+    for canonical in _solve(left_keys, right_keys):
+        vector = [0] * len(keys)
+        for position, value in zip(order, canonical):
+            vector[position] = value
+        basis.append(tuple(vector))
+    return tuple(basis)
+
+
+def balance_equation(equation):
+    """Setarakan ``equation``; kesalahan dikembalikan di ``BalanceResult.error``"""
+    try:
+        reactants, products = parse_equation(equation)
+    except ValueError as exc:
+        return BalanceResult(equation, error=str(exc))
+
+    basis = _canonical_basis(reactants, products)
+    species = reactants + products
+    if not basis:
+        return BalanceResult(equation, reactants, products, error="Reaksi tidak dapat disetarakan")
+    if len(basis) > 1:
+        return BalanceResult(
+            equation, reactants, products,
+            error=f"Reaksi tidak tertentu: {len(basis)} kombinasi koefisien independen",
+            basis=basis,
+        )
+
+    vector = basis[0]
+    if sum(value < 0 for value in vector) > len(vector) / 2:
+        vector = tuple(-value for value in vector)
+    missing = [species[i].label for i, value in enumerate(vector) if value == 0]
+    if missing:
+        return BalanceResult(
+            equation, reactants, products, error=f"Spesies tidak ikut bereaksi: {', '.join(missing)}"
+        )
+    wrong_side = [species[i].label for i, value in enumerate(vector) if value < 0]
+    if wrong_side:
+        return BalanceResult(
+            equation, reactants, products,
+            error=f"Spesies harus dipindah ke sisi lain: {', '.join(wrong_side)}"
+        )
+    return BalanceResult(equation, reactants, products, vector)
+
+
+def balance_equations(lines):
+    """Setarakan satu persamaan per baris; baris kosong dan ``#`` komentar dilewati"""
+    for line in lines:
+        equation = line.strip()
+        if equation and not equation.startswith("#"):
+            yield balance_equation(equation)
+
+
+def balance_cache_info():
+    """Statistik cache penyetaraan (hits, misses, maxsize, currsize)"""
+    return _solve.cache_info()
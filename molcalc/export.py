@@ -0,0 +1,147 @@
+"""Export riwayat perhitungan secara streaming ke CSV, Parquet, atau Arrow IPC.
+
+Riwayat dibaca per batch dan setiap batch langsung ditulis ke file keluaran,
+sehingga tidak ada DataFrame atau string CSV utuh di memori. Komposisi
+disimpan sebagai kolom, bukan dict yang dijadikan string:
+
+- ``wide``: satu kolom jumlah atom per unsur (0 bila tidak ada);
+- ``long``: satu baris per (perhitungan, unsur).
+
+File Arrow ditulis dalam format IPC *file* sehingga dapat dibuka dengan
+``pyarrow.memory_map`` tanpa menyalin data. PyArrow baru diimpor saat format
+Parquet/Arrow dipakai.
+"""
+import csv
+
+from .elements import ELEMENTS
+
+FORMATS = {
+    "csv": {"label": "CSV", "extension": ".csv", "mime": "text/csv"},
+    "parquet": {"label": "Parquet", "extension": ".parquet", "mime": "application/vnd.apache.parquet"},
+    "arrow": {"label": "Arrow IPC", "extension": ".arrow", "mime": "application/vnd.apache.arrow.file"},
+}
+LAYOUTS = ("wide", "long")
+BASE_COLUMNS = ("id", "formula", "mass", "timestamp")
+
+
+def collect_elements(batches):
+    """Unsur yang muncul di semua batch, dalam urutan tabel periodik"""
+    seen = set()
+    for batch in batches:
+        for entry in batch:
+            seen.update(entry.composition)
+    return tuple(sorted(seen, key=lambda symbol: ELEMENTS.by_symbol.get(symbol, len(ELEMENTS))))
+
+
+def _columns(batch, layout, elements):
+    """Kolom Python untuk satu batch (dict nama → list)"""
+    if layout == "wide":
+        columns = {
+            "id": [entry.id for entry in batch],
+            "formula": [entry.formula for entry in batch],
+            "mass": [entry.mass for entry in batch],
+            "timestamp": [entry.timestamp for entry in batch],
+        }
+        for symbol in elements:
+            columns[symbol] = [entry.composition.get(symbol, 0) for entry in batch]
+        return columns
+
+    columns = {name: [] for name in BASE_COLUMNS + ("element", "count")}
+    for entry in batch:
+        for symbol, count in entry.composition.items():
+            columns["id"].append(entry.id)
+            columns["formula"].append(entry.formula)
+            columns["mass"].append(entry.mass)
+            columns["timestamp"].append(entry.timestamp)
+            columns["element"].append(symbol)
+            columns["count"].append(count)
+    return columns
+
+
+def _column_names(layout, elements):
+    return BASE_COLUMNS + (tuple(elements) if layout == "wide" else ("element", "count"))
+
+
+def _write_csv(batches, out, layout, elements):
+    writer = csv.writer(out)
+    writer.writerow(_column_names(layout, elements))
+    rows = 0
+    for batch in batches:
+        columns = _columns(batch, layout, elements)
+        rows_in_batch = list(zip(*columns.values()))
+        writer.writerows(rows_in_batch)
+        rows += len(rows_in_batch)
+    return rows
+
+
+def _arrow_schema(layout, elements):
+    import pyarrow as pa
+
+    fields = [
+        pa.field("id", pa.int64()),
+        pa.field("formula", pa.string()),
+        pa.field("mass", pa.float64()),
+        pa.field("timestamp", pa.timestamp("s")),
+    ]
+    if layout == "wide":
+        fields += [pa.field(symbol, pa.int64()) for symbol in elements]
+    else:
+        fields += [pa.field("element", pa.dictionary(pa.int8(), pa.string())), pa.field("count", pa.int64())]
+    return pa.schema(fields)
+
+
+def _record_batches(batches, layout, elements, schema):
+    import pyarrow as pa
+
+    symbols = pa.array(ELEMENTS.symbol, pa.string())
+    for batch in batches:
+        columns = _columns(batch, layout, elements)
+        # Stempel waktu "YYYY-MM-DD HH:MM:SS" di-cast oleh Arrow, bukan per baris di Python
+        columns["timestamp"] = pa.array(columns["timestamp"], pa.string()).cast(pa.timestamp("s"))
+        if layout == "long":
+            # Kamus tetap (semua simbol unsur) dipakai bersama semua batch; kamus per batch
+            # membuat file Arrow IPC gagal ditulis ("Dictionary replacement detected")
+            indices = pa.array([ELEMENTS.by_symbol[symbol] for symbol in columns["element"]], pa.int8())
+            columns["element"] = pa.DictionaryArray.from_arrays(indices, symbols)
+        yield pa.record_batch([columns[name] for name in schema.names], schema=schema)
+
+
+def _write_parquet(batches, out, layout, elements):
+    import pyarrow.parquet as pq
+
+    schema = _arrow_schema(layout, elements)
+    rows = 0
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        for record_batch in _record_batches(batches, layout, elements, schema):
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    return rows
+
+
+def _write_arrow(batches, out, layout, elements):
+    import pyarrow as pa
+
+    schema = _arrow_schema(layout, elements)
+    rows = 0
+    with pa.ipc.new_file(out, schema) as writer:
+        for record_batch in _record_batches(batches, layout, elements, schema):
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+    return rows
+
+
+_WRITERS = {"csv": _write_csv, "parquet": _write_parquet, "arrow": _write_arrow}
+
+
+def export_history(batches, out, fmt="csv", layout="wide", elements=None):
+    """Tulis batch ``HistoryEntry`` ke ``out``; kembalikan jumlah baris yang ditulis
+
+    ``out`` adalah file teks untuk CSV dan file biner untuk Parquet/Arrow. Untuk
+    layout ``wide`` daftar ``elements`` menentukan kolom unsur (lihat
+    ``collect_elements``).
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Format export tidak dikenal: {fmt!r}")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout export tidak dikenal: {layout!r}")
+    return _WRITERS[fmt](batches, out, layout, tuple(elements or ()))
@@ -0,0 +1,171 @@
+"""Penyimpanan riwayat perhitungan dan senyawa favorit di SQLite.
+
+Setiap baris riwayat hanya ditambahkan (append-only); "hapus semua" dicatat
+sebagai penanda batas ``id`` sehingga tidak ada baris yang diubah. Riwayat
+diindeks per sesi menurut ``id``, rumus, dan waktu, dan dibaca per halaman
+sehingga memori sesi tidak bertambah seiring panjang riwayat.
+
+Lokasi basis data: ``$MOLCALC_DATA_DIR/history.sqlite3`` (bawaan
+``~/.local/share/molcalc``).
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Mapping, NamedTuple
+
+DATA_DIR = Path(os.environ.get("MOLCALC_DATA_DIR", Path.home() / ".local" / "share" / "molcalc"))
+DEFAULT_PATH = DATA_DIR / "history.sqlite3"
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+EXPORT_BATCH_SIZE = 10000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session TEXT NOT NULL,
+    formula TEXT NOT NULL,
+    mass REAL NOT NULL,
+    composition TEXT NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_session_id ON history (session, id);
+CREATE INDEX IF NOT EXISTS history_session_formula ON history (session, formula);
+CREATE INDEX IF NOT EXISTS history_session_timestamp ON history (session, timestamp);
+CREATE TABLE IF NOT EXISTS history_clears (
+    session TEXT NOT NULL,
+    last_id INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_clears_session ON history_clears (session, last_id);
+CREATE TABLE IF NOT EXISTS favorites (
+    session TEXT NOT NULL,
+    formula TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    PRIMARY KEY (session, formula)
+);
+"""
+
+# Baris yang terlihat: milik sesi dan lebih baru dari penanda "hapus semua" terakhir
+_VISIBLE = """session = :session AND id > coalesce(
+    (SELECT max(last_id) FROM history_clears WHERE session = :session), 0)"""
+
+
+class HistoryEntry(NamedTuple):
+    """Satu perhitungan tersimpan."""
+    id: int
+    formula: str
+    mass: float
+    composition: Mapping[str, int]
+    timestamp: str
+
+
+def _entry(row):
+    return HistoryEntry(row[0], row[1], row[2], json.loads(row[3]), row[4])
+
+
+class HistoryStore:
+    """Riwayat dan favorit per sesi; satu koneksi SQLite per thread."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            if self.path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def append(self, session, formula, mass, composition, timestamp=None):
+        """Tambahkan satu perhitungan; kembalikan ``id`` barisnya"""
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "INSERT INTO history (session, formula, mass, composition, timestamp) VALUES (?, ?, ?, ?, ?)",
+                (session, formula, float(mass), json.dumps(dict(composition)), timestamp)
+            )
+        return cursor.lastrowid
+
+    def clear(self, session):
+        """Sembunyikan seluruh riwayat sesi saat ini tanpa menghapus baris"""
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO history_clears (session, last_id, timestamp) "
+                "SELECT ?, coalesce(max(id), 0), ? FROM history",
+                (session, datetime.now().strftime(TIMESTAMP_FORMAT))
+            )
+
+    def count(self, session, formula=None):
+        """Jumlah perhitungan sesi, atau perhitungan untuk ``formula`` saja"""
+        query = f"SELECT count(*) FROM history WHERE {_VISIBLE}"
+        if formula is not None:
+            query += " AND formula = :formula"
+        return self._connection().execute(
+            query, {"session": session, "formula": formula}
+        ).fetchone()[0]
+
+    def page(self, session, limit, offset=0, formula=None):
+        """Perhitungan terbaru lebih dulu, ``limit`` baris mulai dari ``offset``"""
+        query = f"SELECT id, formula, mass, composition, timestamp FROM history WHERE {_VISIBLE}"
+        if formula is not None:
+            query += " AND formula = :formula"
+        rows = self._connection().execute(
+            query + " ORDER BY id DESC LIMIT :limit OFFSET :offset",
+            {"session": session, "limit": limit, "offset": offset, "formula": formula}
+        )
+        return [_entry(row) for row in rows]
+
+    def recent(self, session, limit=5):
+        return self.page(session, limit)
+
+    def find_formula(self, session, formula, limit=50):
+        """Perhitungan terbaru untuk rumus ``formula``"""
+        return self.page(session, limit, formula=formula)
+
+    def iter_batches(self, session, batch_size=EXPORT_BATCH_SIZE):
+        """Semua perhitungan dari yang terlama sebagai list per ``batch_size`` baris"""
+        last_id = 0
+        while True:
+            rows = self._connection().execute(
+                f"SELECT id, formula, mass, composition, timestamp FROM history WHERE {_VISIBLE} "
+                "AND id > :after ORDER BY id LIMIT :limit",
+                {"session": session, "after": last_id, "limit": batch_size}
+            ).fetchall()
+            if not rows:
+                return
+            yield [_entry(row) for row in rows]
+            last_id = rows[-1][0]
+
+    def iter_entries(self, session, batch_size=EXPORT_BATCH_SIZE):
+        """Semua perhitungan dari yang terlama, dibaca per batch"""
+        for batch in self.iter_batches(session, batch_size):
+            yield from batch
+
+    def add_favorite(self, session, formula):
+        """Tambahkan rumus ke favorit; False bila sudah ada"""
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO favorites (session, formula, timestamp) VALUES (?, ?, ?)",
+                (session, formula, datetime.now().strftime(TIMESTAMP_FORMAT))
+            )
+        return cursor.rowcount == 1
+
+    def favorites(self, session):
+        return [row[0] for row in self._connection().execute(
+            "SELECT formula FROM favorites WHERE session = ? ORDER BY timestamp, rowid", (session,)
+        )]
+
+    def favorite_count(self, session):
+        return self._connection().execute(
+            "SELECT count(*) FROM favorites WHERE session = ?", (session,)
+        ).fetchone()[0]
@@ -0,0 +1,155 @@
+"""Parsing inkremental untuk pratinjau rumus saat diketik.
+
+``IncrementalParser`` mem-parse dari kiri ke kanan dengan mesin status
+(tumpukan kurung berisi jumlah atom, koefisien bagian) dan menyimpan salinan
+statusnya setiap ``CHECKPOINT_INTERVAL`` karakter. Saat rumus berubah, parsing
+dilanjutkan dari checkpoint terakhir di dalam awalan yang tidak berubah,
+sehingga satu perubahan di ujung rumus ribuan karakter hanya memproses ekornya.
+
+Hasilnya ``ParseResult`` yang sama dengan ``parser.parse_formula``, termasuk
+pesan kesalahan; posisi kesalahan selalu menunjuk token yang salah di rumus
+yang sudah dinormalisasi.
+"""
+from bisect import bisect_right
+from types import MappingProxyType
+
+from .elements import massa_atom
+from .parser import _TOKEN_RE, ParseResult, _failure, _unrecognized, normalize_formula
+
+# Jarak minimum (karakter) antar-checkpoint status parsing
+CHECKPOINT_INTERVAL = 32
+
+
+def common_prefix_length(a, b):
+    """Panjang awalan bersama dua string (perbandingan potongan di C, O(n log n))"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class _State:
+    """Status mesin parsing setelah sejumlah token utuh."""
+    __slots__ = ("total", "frames", "coefficient", "part_start")
+
+    def __init__(self):
+        self.total = {}
+        # Frame terdalam di akhir: (jumlah atom di dalam kurung, posisi kurung buka)
+        self.frames = [({}, None)]
+        self.coefficient = 1
+        self.part_start = True
+
+    def copy(self):
+        state = _State.__new__(_State)
+        state.total = dict(self.total)
+        state.frames = [(dict(counts), position) for counts, position in self.frames]
+        state.coefficient = self.coefficient
+        state.part_start = self.part_start
+        return state
+
+    def close_part(self):
+        counts, _ = self.frames[0]
+        for element, count in counts.items():
+            self.total[element] = self.total.get(element, 0) + count * self.coefficient
+        self.frames = [({}, None)]
+        self.coefficient = 1
+        self.part_start = True
+
+
+class IncrementalParser:
+    """Parser satu rumus yang berubah sedikit demi sedikit (satu objek per sesi)."""
+
+    def __init__(self, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.checkpoint_interval = checkpoint_interval
+        self.formula = None
+        self.result = None
+        # (posisi batas token, status setelah token sebelum posisi itu), terurut
+        self._checkpoints = [(0, _State())]
+        # Jumlah karakter yang dipakai ulang dan diproses pada panggilan terakhir
+        self.reused = 0
+        self.parsed = 0
+
+    def parse(self, formula):
+        """``ParseResult`` untuk ``formula``, melanjutkan dari awalan yang sama"""
+        formula = normalize_formula(formula)
+        if formula == self.formula:
+            self.reused, self.parsed = len(formula), 0
+            return self.result
+
+        if self.formula is None:
+            common = 0
+        else:
+            common = common_prefix_length(formula, self.formula)
+        # Token yang berakhir di posisi p bergantung pada karakter ke-p (mis. 'H' → 'He',
+        # '2' → '23'), jadi checkpoint p hanya sah bila karakter itu juga tidak berubah
+        positions = [position for position, _ in self._checkpoints]
+        index = max(bisect_right(positions, common - 1) - 1, 0)
+        del self._checkpoints[index + 1:]
+        start, state = self._checkpoints[index]
+
+        self.formula = formula
+        self.reused, self.parsed = start, len(formula) - start
+        self.result = self._run(formula, start, state.copy())
+        return self.result
+
+    def _run(self, formula, pos, state):
+        if not formula:
+            return _failure(formula, "Formula kosong", 0)
+
+        match = _TOKEN_RE.match
+        length = len(formula)
+        frames = state.frames
+        last_checkpoint = self._checkpoints[-1][0]
+
+        while pos < length:
+            m = match(formula, pos)
+            if m is None:
+                return _unrecognized(formula, pos)
+            element, count, opening, closing, multiplier, dot, coefficient = m.groups()
+
+            if element:
+                if element not in massa_atom:
+                    return _failure(formula, f"Unsur '{element}' tidak dikenali", pos)
+                counts = frames[-1][0]
+                counts[element] = counts.get(element, 0) + (int(count) if count else 1)
+                state.part_start = False
+            elif opening:
+                frames.append(({}, pos))
+                state.part_start = False
+            elif closing:
+                if len(frames) == 1:
+                    return _failure(formula, "Kurung tutup ')' tanpa pasangan", pos)
+                inner, _ = frames.pop()
+                factor = int(multiplier) if multiplier else 1
+                counts = frames[-1][0]
+                for name, value in inner.items():
+                    counts[name] = counts.get(name, 0) + value * factor
+                state.part_start = False
+            elif dot:
+                if len(frames) > 1:
+                    return _failure(formula, "Kurung buka '(' tidak ditutup", frames[-1][1])
+                state.close_part()
+                frames = state.frames
+            else:
+                # Koefisien hanya sah di awal bagian dan harus diikuti unsur atau kurung
+                next_pos = m.end()
+                if not state.part_start or next_pos >= length or not (
+                    formula[next_pos] == "(" or formula[next_pos].isupper()
+                ):
+                    return _unrecognized(formula, pos)
+                state.coefficient = int(coefficient)
+                state.part_start = False
+            pos = m.end()
+
+            if pos - last_checkpoint >= self.checkpoint_interval and pos < length:
+                self._checkpoints.append((pos, state.copy()))
+                last_checkpoint = pos
+
+        if len(frames) > 1:
+            return _failure(formula, "Kurung buka '(' tidak ditutup", frames[-1][1])
+        state.close_part()
+        return ParseResult(formula, MappingProxyType(state.total))
@@ -0,0 +1,171 @@
+"""Pola isotop dan massa monoisotopik dari rumus kimia.
+
+Distribusi isotop setiap unsur dinyatakan sebagai polinom atas massa nominal:
+koefisien ke-k berisi peluang dan peluang × massa (untuk centroid) dari semua
+kombinasi isotop bermassa nominal ``start + k``. Distribusi ``n`` atom didapat
+dengan pemangkatan biner (perkalian polinom berulang), lalu distribusi antar
+unsur dikonvolusikan. Setelah setiap perkalian, puncak di tepi yang lebih kecil
+dari ``threshold`` × puncak tertinggi dibuang lalu sisanya dinormalisasi ulang
+ke total 1, sehingga panjang polinom tetap kecil bahkan untuk ribuan atom tanpa
+kelimpahan total ikut menyusut di setiap langkah. Konvolusi memakai FFT bila kedua polinom
+panjang.
+
+Puncak hasil dikelompokkan per massa nominal (bin 1 Da) dengan massa centroid,
+seperti yang terlihat pada spektrometer massa resolusi rendah.
+"""
+from functools import lru_cache
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from .elements import ELEMENTS
+from .parser import parse_formula
+
+# Ambang relatif terhadap puncak tertinggi
+DEFAULT_THRESHOLD = 1e-6
+FFT_MIN_SIZE = 64
+
+
+class IsotopePattern(NamedTuple):
+    """Distribusi isotop satu rumus: satu puncak per massa nominal."""
+    formula: str
+    nominal: np.ndarray
+    masses: np.ndarray
+    abundances: np.ndarray
+    monoisotopic_mass: float
+
+    @property
+    def relative(self):
+        """Kelimpahan relatif terhadap puncak tertinggi (%)"""
+        return self.abundances / self.abundances.max() * 100
+
+    @property
+    def most_abundant_mass(self):
+        return float(self.masses[np.argmax(self.abundances)])
+
+    @property
+    def average_mass(self):
+        return float(self.masses @ self.abundances / self.abundances.sum())
+
+
+def _convolve(a, b):
+    if min(len(a), len(b)) < FFT_MIN_SIZE:
+        return np.convolve(a, b)
+    size = len(a) + len(b) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    result = np.fft.irfft(np.fft.rfft(a, fft_size) * np.fft.rfft(b, fft_size), fft_size)[:size]
+    # Sisa pembulatan FFT bisa sedikit negatif
+    return np.maximum(result, 0.0)
+
+
+def _prune(start, probabilities, weighted, threshold):
+    keep = np.flatnonzero(probabilities >= probabilities.max() * threshold)
+    low, high = keep[0], keep[-1] + 1
+    probabilities, weighted = probabilities[low:high], weighted[low:high]
+    # Ekor yang dibuang dibagikan ulang secara proporsional; centroid (weighted / p) tetap
+    scale = 1.0 / probabilities.sum()
+    return start + int(low), probabilities * scale, weighted * scale
+
+
+def _multiply(left, right, threshold):
+    """Perkalian dua distribusi ``(start, peluang, peluang × massa)``"""
+    start = left[0] + right[0]
+    probabilities = _convolve(left[1], right[1])
+    weighted = _convolve(left[2], right[1]) + _convolve(left[1], right[2])
+    return _prune(start, probabilities, weighted, threshold)
+
+
+@lru_cache(maxsize=None)
+def _element_distribution(symbol):
+    isotopes = ELEMENTS.isotopes(symbol)
+    if not isotopes:
+        raise ValueError(f"Data isotop untuk '{symbol}' tidak tersedia")
+    start = min(isotope.mass_number for isotope in isotopes)
+    probabilities = np.zeros(max(isotope.mass_number for isotope in isotopes) - start + 1)
+    weighted = np.zeros_like(probabilities)
+    for isotope in isotopes:
+        probabilities[isotope.mass_number - start] += isotope.abundance
+        weighted[isotope.mass_number - start] += isotope.abundance * isotope.mass
+    total = probabilities.sum()
+    return start, probabilities / total, weighted / total
+
+
+@lru_cache(maxsize=8192)
+def _element_power(symbol, count, threshold):
+    """Distribusi ``count`` atom ``symbol`` lewat pemangkatan biner"""
+    square = _element_distribution(symbol)
+    result = None
+    while count:
+        if count & 1:
+            result = square if result is None else _multiply(result, square, threshold)
+        count >>= 1
+        if count:
+            square = _multiply(square, square, threshold)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _principal_isotope_mass(symbol):
+    return max(ELEMENTS.isotopes(symbol), key=lambda isotope: isotope.abundance).mass
+
+
+def monoisotopic_mass(elements):
+    """Jumlah massa isotop paling melimpah dari setiap unsur"""
+    return sum(_principal_isotope_mass(symbol) * count for symbol, count in elements.items())
+
+
+def monoisotopic_masses(result):
+    """Massa monoisotopik setiap baris ``BatchResult`` (NaN untuk baris gagal)"""
+    vector = np.array([_principal_isotope_mass(symbol) for symbol in result.symbols], dtype=np.float64)
+    masses = result.counts @ vector
+    masses[~result.valid] = np.nan
+    return masses
+
+
+def isotope_pattern(formula, threshold=DEFAULT_THRESHOLD):
+    """Pola isotop rumus ``formula``; ``ValueError`` bila rumus tidak valid"""
+    result = parse_formula(formula)
+    if not result.ok:
+        raise ValueError(result.error)
+    return pattern_from_elements(result.elements, threshold, formula)
+
+
+def pattern_from_elements(elements, threshold=DEFAULT_THRESHOLD, formula=""):
+    """Pola isotop dari dict unsur → jumlah atom"""
+    distribution = None
+    for symbol, count in elements.items():
+        if count <= 0:
+            continue
+        power = _element_power(symbol, int(count), threshold)
+        distribution = power if distribution is None else _multiply(distribution, power, threshold)
+    if distribution is None:
+        raise ValueError("Formula kosong")
+
+    start, probabilities, weighted = distribution
+    keep = probabilities >= probabilities.max() * threshold
+    nominal = np.arange(start, start + len(probabilities))[keep]
+    abundances = probabilities[keep]
+    return IsotopePattern(
+        formula,
+        nominal,
+        weighted[keep] / abundances,
+        abundances / abundances.sum(),
+        monoisotopic_mass(elements),
+    )
+
+
+def isotope_patterns(formulas: Sequence[str], threshold=DEFAULT_THRESHOLD):
+    """Pola isotop untuk banyak rumus: ``(pola, error)`` dengan ``None`` untuk yang gagal"""
+    patterns, errors = [], []
+    for formula in formulas:
+        try:
+            patterns.append(isotope_pattern(formula, threshold))
+            errors.append(None)
+        except ValueError as exc:
+            patterns.append(None)
+            errors.append(str(exc))
+    return tuple(patterns), tuple(errors)
+
+
+def pattern_cache_clear():
+    _element_power.cache_clear()
@@ -0,0 +1,78 @@
+"""Eksekusi multi-core untuk batch rumus berukuran besar.
+
+Batch dipecah menjadi unit kerja berukuran tetap yang dievaluasi oleh
+``evaluate_formulas`` di pool proses, lalu hasilnya digabung kembali sesuai
+urutan input. Satu pool dibuat per jumlah worker dan dipakai ulang oleh semua
+pemanggil (tidak pernah dimatikan saat pemanggil lain meminta ukuran berbeda,
+jadi pekerjaan sesi lain tidak ikut dibatalkan); input kecil tetap dihitung
+di proses sendiri agar biaya start pool tidak membebani pekerjaan singkat.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import evaluate_formulas, merge_results
+
+# Di bawah jumlah rumus ini batch selalu dihitung di proses sendiri
+PARALLEL_THRESHOLD = 20000
+WORK_UNIT_SIZE = 5000
+# Batas unit kerja yang menunggu per worker agar memori tetap terbatas
+MAX_PENDING_PER_WORKER = 2
+
+# Pool proses per jumlah worker
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    """Jumlah worker bawaan: semua core CPU"""
+    return os.cpu_count() or 1
+
+
+def _get_pool(workers):
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # forkserver/spawn aman dipakai dari thread script Streamlit, fork tidak
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return pool
+
+
+def shutdown_pool():
+    """Hentikan semua pool proses yang sudah dibuat"""
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_pool)
+
+
+def imap_evaluate(chunks, workers=None):
+    """Evaluasi potongan rumus di pool proses, hasil berurutan sesuai input"""
+    workers = workers or default_workers()
+    pool = _get_pool(workers)
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(evaluate_formulas, chunk))
+        if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def evaluate_parallel(formulas, workers=None, unit_size=WORK_UNIT_SIZE, threshold=PARALLEL_THRESHOLD):
+    """Seperti ``evaluate_formulas``, tetapi dibagi ke beberapa core bila batch besar"""
+    formulas = tuple(formulas)
+    workers = workers or default_workers()
+    if workers <= 1 or len(formulas) < threshold:
+        return evaluate_formulas(formulas)
+    chunks = (formulas[start:start + unit_size] for start in range(0, len(formulas), unit_size))
+    return merge_results(imap_evaluate(chunks, workers))
@@ -0,0 +1,145 @@
+"""Mesin parsing rumus kimia.
+
+Tokenizer dikompilasi sekali, parsing berjalan dalam satu lintasan linear
+tanpa menyalin potongan string, dan hasilnya disimpan di cache LRU terbatas
+berdasarkan rumus yang sudah dinormalisasi. Modul ini tidak memanggil
+Streamlit: kesalahan dikembalikan sebagai ``ParseResult`` berisi pesan dan
+posisinya.
+"""
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+from .elements import massa_atom
+
+# Jumlah rumus berbeda yang disimpan di cache parsing
+PARSE_CACHE_SIZE = 4096
+
+# Satu regex untuk semua token: unsur+jumlah, kurung buka, kurung tutup+pengali,
+# pemisah hidrat, dan koefisien di awal bagian
+_TOKEN_RE = re.compile(r"([A-Z][a-z]?)(\d*)|(\()|(\))(\d*)|(\.)|(\d+)")
+# Jalur cepat untuk rumus datar tanpa kurung, hidrat, atau koefisien
+_FLAT_RE = re.compile(r"(?:[A-Z][a-z]?\d*)+")
+_FLAT_TOKEN_RE = re.compile(r"([A-Z][a-z]?)(\d*)")
+
+_ELEMENT, _OPEN, _CLOSE, _PART = range(4)
+_EMPTY = MappingProxyType({})
+
+
+class ParseResult(NamedTuple):
+    """Hasil parsing yang tidak dapat diubah."""
+    formula: str
+    elements: Mapping[str, int]
+    error: Optional[str] = None
+    position: Optional[int] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def normalize_formula(formula):
+    """Samakan penulisan titik hidrat dan buang spasi"""
+    return formula.replace("·", ".").replace("•", ".").replace(" ", "")
+
+
+def _failure(formula, message, position):
+    return ParseResult(formula, _EMPTY, message, position)
+
+
+def _unrecognized(formula, position):
+    end = formula.find(".", position)
+    rest = formula[position:] if end < 0 else formula[position:end]
+    return _failure(formula, f"Format tidak dikenali: '{rest}'", position)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_normalized(formula):
+    if not formula:
+        return _failure(formula, "Formula kosong", 0)
+
+    if _FLAT_RE.fullmatch(formula):
+        counts = {}
+        for m in _FLAT_TOKEN_RE.finditer(formula):
+            element, count = m.groups()
+            if element not in massa_atom:
+                return _failure(formula, f"Unsur '{element}' tidak dikenali", m.start())
+            counts[element] = counts.get(element, 0) + (int(count) if count else 1)
+        return ParseResult(formula, MappingProxyType(counts))
+
+    match = _TOKEN_RE.match
+    length = len(formula)
+    tokens = [(_PART, None, 1)]
+    group_multipliers = {}
+    open_brackets = []
+    pos = 0
+
+    # Lintasan 1: tokenisasi dan pencocokan kurung
+    while pos < length:
+        m = match(formula, pos)
+        if m is None:
+            return _unrecognized(formula, pos)
+        element, count, opening, closing, multiplier, dot, coefficient = m.groups()
+
+        if element:
+            if element not in massa_atom:
+                return _failure(formula, f"Unsur '{element}' tidak dikenali", pos)
+            tokens.append((_ELEMENT, element, int(count) if count else 1))
+        elif opening:
+            open_brackets.append((len(tokens), pos))
+            tokens.append((_OPEN, None, 1))
+        elif closing:
+            if not open_brackets:
+                return _failure(formula, "Kurung tutup ')' tanpa pasangan", pos)
+            index, _ = open_brackets.pop()
+            group_multipliers[index] = int(multiplier) if multiplier else 1
+            tokens.append((_CLOSE, None, 1))
+        elif dot:
+            if open_brackets:
+                return _failure(formula, "Kurung buka '(' tidak ditutup", open_brackets[-1][1])
+            tokens.append((_PART, None, 1))
+        else:
+            # Koefisien hanya sah di awal bagian dan harus diikuti unsur atau kurung
+            next_pos = m.end()
+            if tokens[-1][0] != _PART or next_pos >= length or not (
+                formula[next_pos] == "(" or formula[next_pos].isupper()
+            ):
+                return _unrecognized(formula, pos)
+            tokens[-1] = (_PART, None, int(coefficient))
+        pos = m.end()
+
+    if open_brackets:
+        return _failure(formula, "Kurung buka '(' tidak ditutup", open_brackets[-1][1])
+
+    # Lintasan 2: akumulasi jumlah atom dengan pengali berjalan
+    counts = {}
+    scale = 1
+    stack = []
+    for index, (kind, element, count) in enumerate(tokens):
+        if kind == _ELEMENT:
+            counts[element] = counts.get(element, 0) + count * scale
+        elif kind == _OPEN:
+            stack.append(scale)
+            scale *= group_multipliers[index]
+        elif kind == _CLOSE:
+            scale = stack.pop()
+        else:
+            scale = count
+
+    return ParseResult(formula, MappingProxyType(counts))
+
+
+def parse_formula(formula):
+    """Parse rumus kimia menjadi ``ParseResult`` (hasil di-cache)"""
+    return _parse_normalized(normalize_formula(formula))
+
+
+def parse_cache_info():
+    """Statistik cache parsing (hits, misses, maxsize, currsize)"""
+    return _parse_normalized.cache_info()
+
+
+def clear_parse_cache():
+    """Kosongkan cache parsing, misalnya setelah tabel unsur berubah"""
+    _parse_normalized.cache_clear()
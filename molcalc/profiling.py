@@ -0,0 +1,247 @@
+"""Profil ringan per rerun: span waktu, counter panggilan, dan ekspor metrik.
+
+Setiap rerun skrip dibuka dengan ``PROFILER.begin_run`` dan ditutup dengan
+``end_run``. Selama rerun yang diprofilkan, ``span(nama)`` mencatat durasi dan
+kedalaman blok kode, dan fungsi yang dibungkus ``timed`` juga menambah counter
+``<nama>.calls``. Semua data rerun disimpan thread-local, jadi sesi lain yang
+berjalan bersamaan tidak ikut terhitung; rerun yang tidak diprofilkan hanya
+membayar pembacaan thread-local (objek no-op bersama). Statistik cache LRU
+(parse, penyetaraan reaksi) bersifat seluruh proses: tidak masuk rekaman
+rerun, tetapi dibaca lewat ``caches`` (panel debug) dan diekspor ke ``/metrics``.
+
+Rerun yang selesai disimpan di buffer melingkar dan diagregasi ke histogram
+per span. Keduanya dapat diambil lewat endpoint HTTP lokal:
+
+- ``GET /metrics``     format teks Prometheus
+- ``GET /runs.jsonl``  rerun terakhir sebagai JSON lines
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .equations import balance_cache_info
+from .parser import parse_cache_info
+
+ENABLED_BY_DEFAULT = os.environ.get("MOLCALC_PROFILE", "") not in ("", "0")
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = int(os.environ.get("MOLCALC_METRICS_PORT", "9464"))
+RECENT_RUNS = 200
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _Span:
+    __slots__ = ("run", "name", "start", "depth")
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.depth = len(self.run["stack"])
+        self.run["stack"].append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.run["stack"].remove(self)
+        self.run["spans"].append(
+            (self.name, self.start - self.run["origin"], time.perf_counter() - self.start, self.depth)
+        )
+        return False
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Profiler:
+    """Pencatat span per rerun (per thread) dan agregat seluruh proses."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._reruns = 0
+        self._sequence = 0
+        self.caches = {"parse": parse_cache_info, "balance": balance_cache_info}
+        self.recent = deque(maxlen=RECENT_RUNS)
+        self._server = None
+
+    # Pencatatan per rerun
+
+    def begin_run(self, label="", enabled=ENABLED_BY_DEFAULT, **fields):
+        """Mulai rerun baru di thread ini; rerun sebelumnya yang tidak ditutup dicatat terputus"""
+        if getattr(self._local, "run", None) is not None:
+            self.end_run(interrupted=True)
+        if not enabled:
+            self._local.run = None
+            return
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+        self._local.run = {
+            "run": sequence,
+            "label": label,
+            "fields": fields,
+            "timestamp": time.time(),
+            "origin": time.perf_counter(),
+            "counters": {},
+            "stack": [],
+            "spans": [],
+        }
+
+    def end_run(self, interrupted=False):
+        """Tutup rerun di thread ini; kembalikan rekamannya (dict) atau ``None``"""
+        run = getattr(self._local, "run", None)
+        self._local.run = None
+        if run is None:
+            return None
+        now = time.perf_counter()
+        # Span yang masih terbuka (mis. karena st.stop) ditutup di sini
+        for span in reversed(run["stack"]):
+            run["spans"].append((span.name, span.start - run["origin"], now - span.start, span.depth))
+        record = {
+            "run": run["run"],
+            "label": run["label"],
+            **run["fields"],
+            "timestamp": round(run["timestamp"], 3),
+            "duration": now - run["origin"],
+            "interrupted": interrupted,
+            "spans": [
+                {"name": name, "start": start, "duration": duration, "depth": depth}
+                for name, start, duration, depth in sorted(run["spans"], key=lambda span: span[1])
+            ],
+            "counters": run["counters"],
+        }
+        with self._lock:
+            self._reruns += 1
+            self._observe("rerun", record["duration"])
+            for span in record["spans"]:
+                self._observe(span["name"], span["duration"])
+            self.recent.append(record)
+        return record
+
+    @property
+    def active(self):
+        """Apakah thread ini sedang berada di rerun yang diprofilkan"""
+        return getattr(self._local, "run", None) is not None
+
+    def span(self, name):
+        """Context manager pencatat durasi; no-op bila rerun ini tidak diprofilkan"""
+        run = getattr(self._local, "run", None)
+        if run is None:
+            return _NO_SPAN
+        return _Span(run, name)
+
+    def timed(self, name):
+        """Dekorator: setiap panggilan fungsi menjadi satu span dan menambah ``<nama>.calls``"""
+        def decorate(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                run = getattr(self._local, "run", None)
+                if run is None:
+                    return func(*args, **kwargs)
+                counters = run["counters"]
+                counters[f"{name}.calls"] = counters.get(f"{name}.calls", 0) + 1
+                with _Span(run, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    # Agregasi dan ekspor
+
+    def _observe(self, name, seconds):
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = [[0] * len(BUCKETS), 0, 0.0]
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                histogram[0][index] += 1
+        histogram[1] += 1
+        histogram[2] += seconds
+
+    def prometheus(self):
+        """Metrik dalam format teks Prometheus"""
+        lines = [
+            "# HELP molcalc_span_seconds Durasi span per rerun Streamlit.",
+            "# TYPE molcalc_span_seconds histogram",
+        ]
+        with self._lock:
+            for name, (buckets, count, total) in sorted(self._histograms.items()):
+                label = _escape(name)
+                for bound, value in zip(BUCKETS, buckets):
+                    lines.append(f'molcalc_span_seconds_bucket{{span="{label}",le="{bound}"}} {value}')
+                lines.append(f'molcalc_span_seconds_bucket{{span="{label}",le="+Inf"}} {count}')
+                lines.append(f'molcalc_span_seconds_sum{{span="{label}"}} {total}')
+                lines.append(f'molcalc_span_seconds_count{{span="{label}"}} {count}')
+            reruns = self._reruns
+        lines += [
+            "# HELP molcalc_reruns_total Rerun yang diprofilkan.",
+            "# TYPE molcalc_reruns_total counter",
+            f"molcalc_reruns_total {reruns}",
+        ]
+        stats = {cache: info() for cache, info in self.caches.items()}
+        for metric, kind, field, text in (
+            ("molcalc_cache_hits_total", "counter", "hits", "Cache hit per cache LRU (seluruh proses)."),
+            ("molcalc_cache_misses_total", "counter", "misses", "Cache miss per cache LRU (seluruh proses)."),
+            ("molcalc_cache_size", "gauge", "currsize", "Jumlah entri cache."),
+        ):
+            lines += [f"# HELP {metric} {text}", f"# TYPE {metric} {kind}"]
+            lines += [f'{metric}{{cache="{cache}"}} {getattr(info, field)}' for cache, info in stats.items()]
+        return "\n".join(lines) + "\n"
+
+    def jsonl(self):
+        """Rerun terakhir sebagai JSON lines"""
+        with self._lock:
+            records = list(self.recent)
+        return "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+    def serve(self, host=METRICS_HOST, port=METRICS_PORT):
+        """Jalankan endpoint metrik di thread latar (sekali per proses); kembalikan alamatnya"""
+        if self._server is None:
+            profiler = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path == "/metrics":
+                        body, content_type = profiler.prometheus(), "text/plain; version=0.0.4"
+                    elif self.path == "/runs.jsonl":
+                        body, content_type = profiler.jsonl(), "application/x-ndjson"
+                    else:
+                        self.send_error(404)
+                        return
+                    payload = body.encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+
+                def log_message(self, *args):
+                    pass
+
+            self._server = ThreadingHTTPServer((host, port), Handler)
+            self._server.daemon_threads = True
+            threading.Thread(target=self._server.serve_forever, name="molcalc-metrics", daemon=True).start()
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+PROFILER = Profiler()
@@ -0,0 +1,245 @@
+"""Pencarian balik: rumus kandidat untuk massa terukur dalam toleransi tertentu.
+
+Unsur dibagi menjadi dua kelompok (meet-in-the-middle). Semua kombinasi
+kelompok "indeks" dihitung sekali menjadi larik massa terurut yang di-cache per
+rentang unsur. Kelompok lainnya dienumerasi unsur demi unsur dengan
+branch-and-bound: cabang yang massa parsialnya tidak mungkin lagi masuk jendela
+target (dengan massa minimum/maksimum sisa unsur) langsung dipangkas. Setiap
+massa parsial yang tersisa dicocokkan ke indeks lewat ``searchsorted``.
+
+Rentang unsur ditulis seperti ``"C0-30 H0-60 N0-5 O0-10 Cl2"`` (``Cl2`` berarti
+0–2).
+"""
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+
+from .composition import format_formula, hill_order
+from .elements import ELEMENTS
+from .isotopes import monoisotopic_mass
+
+DEFAULT_RANGES = "C0-40 H0-80 N0-8 O0-15 P0-2 S0-3 F0-4 Cl0-3 Br0-2 I0-1"
+# Ukuran maksimum indeks massa yang dihitung di muka
+INDEX_MAX_SIZE = 500_000
+MAX_CANDIDATES = 100_000
+
+# Pergeseran massa ion terhadap molekul netral (u)
+ADDUCTS = {
+    "M": 0.0,
+    "[M+H]+": 1.007276,
+    "[M+Na]+": 22.989218,
+    "[M+K]+": 38.963158,
+    "[M+NH4]+": 18.033823,
+    "[M-H]-": -1.007276,
+}
+
+# Valensi untuk menghitung DBE (double bond equivalent)
+VALENCES = {
+    "H": 1, "Li": 1, "Na": 1, "K": 1, "F": 1, "Cl": 1, "Br": 1, "I": 1,
+    "O": 2, "S": 2, "Se": 2, "B": 3, "N": 3, "P": 3, "As": 3, "C": 4, "Si": 4, "Ge": 4,
+}
+
+_RANGE_RE = re.compile(r"([A-Z][a-z]?)(\d+)(?:-(\d+))?")
+
+
+class Candidate(NamedTuple):
+    """Satu rumus kandidat untuk massa target."""
+    formula: str
+    elements: Dict[str, int]
+    mass: float
+    error_mda: float
+    error_ppm: float
+    dbe: Optional[float]
+
+
+def parse_ranges(text):
+    """``"C0-30 H0-60 Cl2"`` → ``(('C', 0, 30), ('H', 0, 60), ('Cl', 0, 2))``"""
+    ranges = []
+    for token in text.replace(",", " ").split():
+        match = _RANGE_RE.fullmatch(token)
+        if match is None:
+            raise ValueError(f"Rentang unsur tidak dikenali: '{token}'")
+        symbol, low, high = match.groups()
+        if symbol not in ELEMENTS:
+            raise ValueError(f"Unsur '{symbol}' tidak dikenali")
+        low, high = (0, int(low)) if high is None else (int(low), int(high))
+        if low > high:
+            raise ValueError(f"Rentang {symbol} terbalik: {low}-{high}")
+        ranges.append((symbol, low, high))
+    if not ranges:
+        raise ValueError("Rentang unsur kosong")
+    if len({symbol for symbol, _, _ in ranges}) != len(ranges):
+        raise ValueError("Unsur dalam rentang tidak boleh berulang")
+    return tuple(ranges)
+
+
+def element_mass(symbol, mode="monoisotopic"):
+    """Massa satu atom: isotop utama (``monoisotopic``) atau massa atom rata-rata"""
+    if mode == "monoisotopic":
+        return monoisotopic_mass({symbol: 1})
+    if mode == "average":
+        return ELEMENTS.mass[ELEMENTS.by_symbol[symbol]]
+    raise ValueError(f"Mode massa tidak dikenal: {mode!r}")
+
+
+def _split(ranges):
+    """Bagi rentang menjadi (enumerasi, indeks) dengan ukuran seimbang"""
+    enumerated, indexed = [], []
+    enumerated_size = indexed_size = 1
+    for item in sorted(ranges, key=lambda r: r[2] - r[1], reverse=True):
+        size = item[2] - item[1] + 1
+        if not indexed or (indexed_size <= enumerated_size and indexed_size * size <= INDEX_MAX_SIZE):
+            indexed.append(item)
+            indexed_size *= size
+        else:
+            enumerated.append(item)
+            enumerated_size *= size
+    # Unsur berat dienumerasi lebih dulu agar pemangkasan bekerja lebih awal
+    enumerated.sort(key=lambda r: element_mass(r[0]), reverse=True)
+    return tuple(enumerated), tuple(indexed)
+
+
+@lru_cache(maxsize=64)
+def _mass_index(indexed, mode):
+    """Massa terurut dan jumlah atom semua kombinasi unsur ``indexed``"""
+    masses = np.zeros(1)
+    counts = np.zeros((1, 0), dtype=np.int32)
+    for symbol, low, high in indexed:
+        values = np.arange(low, high + 1, dtype=np.int32)
+        masses = (masses[:, None] + values[None, :] * element_mass(symbol, mode)).ravel()
+        counts = np.hstack([
+            np.repeat(counts, len(values), axis=0),
+            np.tile(values, len(counts))[:, None],
+        ])
+    order = np.argsort(masses, kind="stable")
+    return masses[order], counts[order]
+
+
+def _enumerate(enumerated, mode, lower, upper, rest_min, rest_max):
+    """Branch-and-bound atas unsur ``enumerated``; kembalikan massa parsial dan jumlah atom"""
+    masses = np.zeros(1)
+    counts = np.zeros((1, 0), dtype=np.int32)
+    element_masses = [element_mass(symbol, mode) for symbol, _, _ in enumerated]
+    remaining_min = rest_min + sum(m * low for m, (_, low, _) in zip(element_masses, enumerated))
+    remaining_max = rest_max + sum(m * high for m, (_, _, high) in zip(element_masses, enumerated))
+
+    for mass, (symbol, low, high) in zip(element_masses, enumerated):
+        remaining_min -= mass * low
+        remaining_max -= mass * high
+        values = np.arange(low, high + 1, dtype=np.int32)
+        grown = masses[:, None] + values[None, :] * mass
+        keep = (grown + remaining_min <= upper) & (grown + remaining_max >= lower)
+        rows, columns = np.nonzero(keep)
+        masses = grown[rows, columns]
+        counts = np.hstack([counts[rows], values[columns][:, None]])
+        if not len(masses):
+            break
+    return masses, counts
+
+
+def find_formulas(target, ranges=DEFAULT_RANGES, tolerance=5.0, unit="ppm", mode="monoisotopic",
+                  ion="M", dbe_range=None, integer_dbe=False, limit=None):
+    """Semua rumus dalam ``ranges`` yang massanya dalam toleransi dari ``target``
+
+    ``unit`` adalah ``"ppm"`` atau ``"mDa"``; ``ion`` salah satu kunci ``ADDUCTS``
+    (massa target dianggap m/z ion bermuatan satu). Hasil terurut dari galat
+    absolut terkecil.
+    """
+    if isinstance(ranges, str):
+        ranges = parse_ranges(ranges)
+    if ion not in ADDUCTS:
+        raise ValueError(f"Jenis ion tidak dikenal: {ion!r}")
+    neutral = float(target) - ADDUCTS[ion]
+    if neutral <= 0:
+        raise ValueError("Massa target harus lebih besar dari massa ion")
+    if unit == "ppm":
+        window = neutral * tolerance * 1e-6
+    elif unit == "mDa":
+        window = tolerance / 1000
+    else:
+        raise ValueError(f"Satuan toleransi tidak dikenal: {unit!r}")
+    lower, upper = neutral - window, neutral + window
+
+    enumerated, indexed = _split(ranges)
+    index_masses, index_counts = _mass_index(indexed, mode)
+    partial_masses, partial_counts = _enumerate(
+        enumerated, mode, lower, upper, float(index_masses[0]), float(index_masses[-1])
+    )
+
+    # Cocokkan setiap massa parsial ke jendela di indeks terurut
+    starts = np.searchsorted(index_masses, lower - partial_masses, side="left")
+    stops = np.searchsorted(index_masses, upper - partial_masses, side="right")
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total > MAX_CANDIDATES:
+        raise ValueError(f"Terlalu banyak kandidat ({total:,}); persempit toleransi atau rentang unsur")
+    partial_rows = np.repeat(np.arange(len(partial_masses)), lengths)
+    index_rows = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+
+    symbols = tuple(symbol for symbol, _, _ in enumerated + indexed)
+    counts = np.hstack([partial_counts[partial_rows], index_counts[index_rows]])
+    masses = partial_masses[partial_rows] + index_masses[index_rows]
+    keep = counts.sum(axis=1) > 0
+
+    dbe = None
+    if all(symbol in VALENCES for symbol in symbols):
+        dbe = 1 + counts @ np.array([(VALENCES[s] - 2) / 2 for s in symbols])
+    elif dbe_range is not None or integer_dbe:
+        unknown = [s for s in symbols if s not in VALENCES]
+        raise ValueError(f"Valensi unsur {', '.join(unknown)} tidak diketahui untuk filter DBE")
+    if dbe is not None:
+        if dbe_range is not None:
+            keep &= (dbe >= dbe_range[0]) & (dbe <= dbe_range[1])
+        if integer_dbe:
+            keep &= dbe == np.floor(dbe)
+
+    errors = masses - neutral
+    order = np.flatnonzero(keep)[np.argsort(np.abs(errors[keep]), kind="stable")]
+    if limit is not None:
+        order = order[:limit]
+
+    candidates = []
+    for row in order.tolist():
+        elements = hill_order({s: int(c) for s, c in zip(symbols, counts[row].tolist()) if c})
+        candidates.append(Candidate(
+            format_formula(elements),
+            elements,
+            float(masses[row]) + ADDUCTS[ion],
+            float(errors[row]) * 1000,
+            float(errors[row]) / neutral * 1e6,
+            None if dbe is None else float(dbe[row]),
+        ))
+    return candidates
+
+
+def find_formulas_batch(targets, ranges=DEFAULT_RANGES, **options):
+    """``find_formulas`` untuk banyak massa: list ``(kandidat, error)`` per target"""
+    if isinstance(ranges, str):
+        ranges = parse_ranges(ranges)
+    results = []
+    for target in targets:
+        try:
+            results.append((find_formulas(target, ranges, **options), None))
+        except ValueError as exc:
+            results.append(([], str(exc)))
+    return results
+
+
+def read_masses(lines):
+    """Massa dari baris teks (satu per baris atau kolom pertama CSV); ``(massa, error)`` per baris
+
+    Baris pertama yang bukan angka dianggap header dan dilewati.
+    """
+    first = True
+    for line in lines:
+        text = line.strip().split(",")[0].strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            yield float(text), None
+        except ValueError:
+            if not first:
+                yield None, f"Bukan angka: '{text}'"
+        first = False
@@ -0,0 +1,125 @@
+"""Indeks pencarian nama dan simbol: trie awalan/substring dan pencocokan fuzzy.
+
+Setiap entri adalah pasangan ``(baris, istilah)``. Istilah disimpan dalam dua
+trie: trie kata untuk awalan dan pencocokan fuzzy (jarak Levenshtein dihitung
+sambil menelusuri trie), serta trie sufiks agar pencarian substring — perilaku
+kotak cari semula — cukup menelusuri sepanjang kueri tanpa memindai tabel.
+"""
+from functools import lru_cache
+
+# Peringkat hasil: simbol persis, awalan kata, substring
+EXACT, PREFIX, SUBSTRING = 0, 1, 2
+
+
+class _Node:
+    __slots__ = ("children", "rows", "terminal")
+
+    def __init__(self):
+        self.children = {}
+        # Baris yang melewati simpul ini dan baris yang katanya berakhir di sini
+        self.rows = set()
+        self.terminal = set()
+
+
+def _insert(root, text, row):
+    node = root
+    node.rows.add(row)
+    for char in text:
+        node = node.children.setdefault(char, _Node())
+        node.rows.add(row)
+    return node
+
+
+def _walk(root, text):
+    node = root
+    for char in text:
+        node = node.children.get(char)
+        if node is None:
+            return None
+    return node
+
+
+def max_distance_for(query):
+    """Jarak edit yang masih dianggap salah ketik untuk panjang kueri ini"""
+    if len(query) <= 2:
+        return 0
+    return 1 if len(query) <= 5 else 2
+
+
+class SearchIndex:
+    """Indeks trie atas istilah (nama, simbol) untuk setiap baris."""
+
+    def __init__(self, entries):
+        self._words = _Node()
+        self._suffixes = _Node()
+        self._exact = {}
+        for row, terms in entries:
+            for term in terms:
+                term = term.lower()
+                self._exact.setdefault(term, set()).add(row)
+                for word in term.split():
+                    _insert(self._words, word, row).terminal.add(row)
+                for start in range(len(term)):
+                    _insert(self._suffixes, term[start:], row)
+
+    def prefix(self, query):
+        """Baris dengan kata yang diawali ``query``"""
+        node = _walk(self._words, query.lower())
+        return set() if node is None else set(node.rows)
+
+    def contains(self, query):
+        """Baris dengan istilah yang memuat ``query``"""
+        node = _walk(self._suffixes, query.lower())
+        return set() if node is None else set(node.rows)
+
+    def fuzzy(self, query, max_distance=None):
+        """Baris → jarak edit terkecil untuk kata dalam ``max_distance`` dari ``query``"""
+        query = query.lower()
+        if max_distance is None:
+            max_distance = max_distance_for(query)
+        matches = {}
+        first_row = list(range(len(query) + 1))
+
+        # Baris DP Levenshtein diteruskan ke anak; cabang dipangkas bila min > batas
+        stack = [(child, char, first_row) for char, child in self._words.children.items()]
+        while stack:
+            node, char, previous = stack.pop()
+            current = [previous[0] + 1]
+            for column in range(1, len(query) + 1):
+                cost = 0 if query[column - 1] == char else 1
+                current.append(min(current[column - 1] + 1, previous[column] + 1,
+                                   previous[column - 1] + cost))
+            if current[-1] <= max_distance:
+                for row in node.terminal:
+                    if current[-1] < matches.get(row, max_distance + 1):
+                        matches[row] = current[-1]
+            if min(current) <= max_distance:
+                stack.extend((child, next_char, current) for next_char, child in node.children.items())
+        return matches
+
+    def search(self, query):
+        """Daftar ``(baris, peringkat)`` untuk kecocokan persis, awalan, lalu substring"""
+        query = query.strip().lower()
+        if not query:
+            return []
+        ranked = {row: SUBSTRING for row in self.contains(query)}
+        for row in self.prefix(query):
+            ranked[row] = PREFIX
+        for row in self._exact.get(query, ()):
+            ranked[row] = EXACT
+        return sorted(ranked.items(), key=lambda item: (item[1], item[0]))
+
+    def suggest(self, query, max_distance=None):
+        """Baris kecocokan fuzzy, terurut dari jarak edit terkecil"""
+        matches = self.fuzzy(query.strip(), max_distance)
+        return [row for row, _ in sorted(matches.items(), key=lambda item: (item[1], item[0]))]
+
+
+@lru_cache(maxsize=None)
+def element_index():
+    """Indeks nama dan simbol ``ELEMENTS``, dibangun sekali"""
+    from .elements import ELEMENTS
+
+    return SearchIndex(
+        (row, (ELEMENTS.symbol[row], ELEMENTS.name[row])) for row in range(len(ELEMENTS))
+    )
@@ -0,0 +1,355 @@
+"""Layanan JSON lokal berbasis asyncio untuk massa molar dan komposisi.
+
+Jalankan dengan ``python -m molcalc.service``. Endpoint:
+
+- ``POST /mass``         ``{"formula": "H2O"}``
+- ``POST /composition``  ``{"formula": "H2O"}``
+- ``POST /empirical``    ``{"percentages": {"C": 40.0, "H": 6.7, "O": 53.3}}`` atau ``{"formula": ...}``;
+  ``"oxygen_by_difference": true`` menambahkan O dari selisih 100% (opt-in)
+- ``POST /batch``        ``{"formulas": ["H2O", "NaCl"]}``
+- ``GET /metrics``       statistik latensi per endpoint
+- ``GET /health``
+
+Permintaan ``/mass`` dan ``/composition`` yang datang bersamaan dikumpulkan
+menjadi micro-batch dan dievaluasi sekali lewat ``evaluate_formulas``. Semua
+perhitungan memakai tabel unsur yang sama dengan aplikasi Streamlit.
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from urllib.parse import parse_qs, urlsplit
+
+from .batch import evaluate_formulas
+from .composition import calculate_composition, calculate_empirical_formula, format_formula, molar_mass
+from .elements import massa_atom
+from .empirical import oxygen_by_difference
+from .parser import parse_formula
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BATCH_SIZE = 1024
+# Batas jumlah rumus per permintaan /batch
+MAX_BATCH_FORMULAS = 100000
+# Waktu tunggu untuk mengumpulkan permintaan sebelum batch dievaluasi
+BATCH_WINDOW = 0.002
+MAX_BODY_SIZE = 16 * 1024 * 1024
+LATENCY_WINDOW = 2048
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """Kesalahan input yang dilaporkan ke klien sebagai HTTP 4xx."""
+
+    def __init__(self, message, status=400, position=None):
+        super().__init__(message)
+        self.status = status
+        self.position = position
+
+
+class LatencyStats:
+    """Latensi per endpoint dalam jendela berukuran tetap."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self._window = window
+        self._samples = {}
+        self._counts = {}
+
+    def record(self, endpoint, seconds):
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self._window)
+        samples.append(seconds)
+        self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def snapshot(self):
+        report = {}
+        for endpoint, samples in self._samples.items():
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            report[endpoint] = {
+                "count": self._counts[endpoint],
+                "mean_ms": sum(ordered) / len(ordered) * 1000,
+                "p50_ms": ordered[last // 2] * 1000,
+                "p95_ms": ordered[int(last * 0.95)] * 1000,
+                "max_ms": ordered[last] * 1000,
+            }
+        return report
+
+
+class MicroBatcher:
+    """Kumpulkan rumus dari permintaan bersamaan lalu evaluasi dalam satu batch."""
+
+    def __init__(self, max_batch=MAX_BATCH_SIZE, window=BATCH_WINDOW):
+        self.max_batch = max_batch
+        self.window = window
+        self.batches = 0
+        self.items = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, formula):
+        """Kembalikan ``(BatchResult, baris)`` untuk rumus ini"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((formula, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            pending = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch:
+                await asyncio.sleep(self.window)
+            while len(pending) < self.max_batch and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            try:
+                # Evaluasi di thread executor agar event loop tetap melayani permintaan lain
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, evaluate_formulas, [formula for formula, _ in pending]
+                )
+            except Exception as exc:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.batches += 1
+            self.items += len(pending)
+            for row, (_, future) in enumerate(pending):
+                if not future.done():
+                    future.set_result((result, row))
+
+
+def _require_formula(payload):
+    formula = payload.get("formula")
+    if not isinstance(formula, str) or not formula.strip():
+        raise RequestError("Field 'formula' wajib diisi")
+    return formula.strip()
+
+
+def _batch_items(formulas, include_composition):
+    result = evaluate_formulas(formulas)
+    items = []
+    for row, formula in enumerate(result.formulas):
+        error = result.errors[row]
+        if error is not None:
+            items.append({"formula": formula, "mass": None, "error": error})
+            continue
+        item = {"formula": formula, "mass": float(result.masses[row]), "error": None}
+        if include_composition:
+            item["composition"] = result.composition(row)
+        items.append(item)
+    return items
+
+
+def _raise_parse_error(formula, error):
+    raise RequestError(error, position=parse_formula(formula).position)
+
+
+class MolcalcService:
+    """Router endpoint dan server HTTP/1.1 minimal di atas asyncio."""
+
+    def __init__(self, batcher=None):
+        self.batcher = batcher or MicroBatcher()
+        self.latency = LatencyStats()
+        self.routes = {
+            ("POST", "/mass"): self.handle_mass,
+            ("POST", "/composition"): self.handle_composition,
+            ("POST", "/empirical"): self.handle_empirical,
+            ("POST", "/batch"): self.handle_batch,
+            ("GET", "/metrics"): self.handle_metrics,
+            ("GET", "/health"): self.handle_health,
+        }
+
+    async def handle_mass(self, payload):
+        formula = _require_formula(payload)
+        result, row = await self.batcher.submit(formula)
+        if result.errors[row] is not None:
+            _raise_parse_error(formula, result.errors[row])
+        return {
+            "formula": formula,
+            "mass": float(result.masses[row]),
+            "elements": dict(parse_formula(formula).elements),
+        }
+
+    async def handle_composition(self, payload):
+        formula = _require_formula(payload)
+        result, row = await self.batcher.submit(formula)
+        if result.errors[row] is not None:
+            _raise_parse_error(formula, result.errors[row])
+        return {
+            "formula": formula,
+            "mass": float(result.masses[row]),
+            "composition": result.composition(row),
+        }
+
+    async def handle_empirical(self, payload):
+        percentages = payload.get("percentages")
+        if percentages is None:
+            formula = _require_formula(payload)
+            parsed = parse_formula(formula)
+            if not parsed.ok:
+                raise RequestError(parsed.error, position=parsed.position)
+            if not any(parsed.elements.values()):
+                raise RequestError(f"Rumus '{formula}' tidak berisi unsur")
+            composition = calculate_composition(parsed.elements, molar_mass(parsed.elements))
+        else:
+            if not isinstance(percentages, dict) or not percentages:
+                raise RequestError("Field 'percentages' harus berupa objek {unsur: persen}")
+            for element, value in percentages.items():
+                if element not in massa_atom:
+                    raise RequestError(f"Unsur '{element}' tidak dikenali")
+                # bool adalah subkelas int: true/false bukan persentase; NaN/Infinity juga ditolak
+                if (isinstance(value, bool) or not isinstance(value, (int, float))
+                        or not math.isfinite(value) or value <= 0):
+                    raise RequestError(f"Persentase '{element}' harus bilangan positif")
+            if payload.get("oxygen_by_difference") is True:
+                symbols, values = oxygen_by_difference(list(percentages), [list(percentages.values())])
+                percentages = dict(zip(symbols, values[0].tolist()))
+            composition = {el: {"percentage": float(value)} for el, value in percentages.items()}
+        empirical = calculate_empirical_formula(composition)
+        return {"empirical": empirical, "formula": format_formula(empirical)}
+
+    async def handle_batch(self, payload):
+        formulas = payload.get("formulas")
+        if not isinstance(formulas, list) or not all(isinstance(f, str) for f in formulas):
+            raise RequestError("Field 'formulas' harus berupa daftar string")
+        if len(formulas) > MAX_BATCH_FORMULAS:
+            raise RequestError(f"Maksimal {MAX_BATCH_FORMULAS:,} rumus per permintaan", status=413)
+        include_composition = bool(payload.get("composition", False))
+        items = await asyncio.get_running_loop().run_in_executor(
+            None, _batch_items, [f.strip() for f in formulas], include_composition
+        )
+        return {"results": items}
+
+    async def handle_metrics(self, payload):
+        return {
+            "latency": self.latency.snapshot(),
+            "micro_batches": self.batcher.batches,
+            "micro_batched_items": self.batcher.items,
+        }
+
+    async def handle_health(self, payload):
+        return {"status": "ok", "elements": len(massa_atom)}
+
+    async def dispatch(self, method, target, body):
+        """Proses satu permintaan; kembalikan ``(status, objek JSON)``"""
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        if handler is None:
+            if any(path == url.path for _, path in self.routes):
+                return 405, {"error": "Metode tidak diizinkan"}
+            return 404, {"error": "Endpoint tidak ditemukan"}
+
+        started = time.perf_counter()
+        try:
+            if body:
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    raise RequestError("Body bukan JSON yang valid")
+                if not isinstance(payload, dict):
+                    raise RequestError("Body JSON harus berupa objek")
+            else:
+                payload = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, response = 200, await handler(payload)
+        except RequestError as exc:
+            status, response = exc.status, {"error": str(exc)}
+            if exc.position is not None:
+                response["position"] = exc.position
+        except Exception as exc:
+            status, response = 500, {"error": f"Kesalahan internal: {exc}"}
+        self.latency.record(url.path, time.perf_counter() - started)
+        return status, response
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Baris permintaan tidak valid"}, False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {"error": "Body terlalu besar"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, response = await self.dispatch(method.upper(), target, body)
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.batcher.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m molcalc.service",
+                                     description="Layanan JSON lokal molcalc.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"alamat bind (bawaan: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (bawaan: {DEFAULT_PORT})")
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW * 1000,
+                        help="jendela micro-batch dalam milidetik")
+    args = parser.parse_args(argv)
+
+    service = MolcalcService(MicroBatcher(window=args.batch_window / 1000))
+    print(f"molcalc service berjalan di http://{args.host}:{args.port}")
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Pembaca rumus dari baris teks atau CSV (hanya modul standar)."""
+import csv
+
+# Nama kolom yang dikenali sebagai kolom rumus pada file CSV
+FORMULA_COLUMNS = ("formula", "rumus", "senyawa")
+
+
+def iter_formulas(lines, csv_format=False):
+    """Hasilkan rumus dari baris teks atau CSV, lewati baris kosong"""
+    if not csv_format:
+        for line in lines:
+            formula = line.strip()
+            if formula:
+                yield formula
+        return
+
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    names = [name.strip().lower() for name in header]
+    column = next((names.index(name) for name in FORMULA_COLUMNS if name in names), None)
+    if column is None:
+        # Tanpa header yang dikenali: baris pertama adalah data, kolom pertama
+        column = 0
+        if header and header[0].strip():
+            yield header[0].strip()
+    for row in reader:
+        if len(row) > column:
+            formula = row[column].strip()
+            if formula:
+                yield formula
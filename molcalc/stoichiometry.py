@@ -0,0 +1,147 @@
+"""Stoikiometri reaksi setara: pereaksi pembatas, rendemen, dan tabel scale-up.
+
+Jumlah pereaksi disusun sebagai matriks mol N skenario × R reaktan (NaN berarti
+pereaksi berlebih/tidak diukur). Luas reaksi (extent) setiap skenario adalah
+minimum ``mol / koefisien`` atas reaktan yang diukur; reaktan yang mencapai
+minimum itu adalah pereaksi pembatas. Konsumsi, sisa, dan hasil teoretis
+didapat dari satu perkalian luar extent × koefisien, sehingga ratusan skenario
+ukuran batch dihitung sekaligus.
+"""
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+# Satuan jumlah pereaksi: (jenis, faktor ke g, mol, atau L)
+UNITS = {
+    "g": ("mass", 1.0),
+    "mg": ("mass", 1e-3),
+    "kg": ("mass", 1e3),
+    "mol": ("moles", 1.0),
+    "mmol": ("moles", 1e-3),
+    "mL": ("volume", 1e-3),
+    "L": ("volume", 1.0),
+}
+
+
+class StoichiometryTable(NamedTuple):
+    """Hasil per skenario (baris) untuk setiap reaktan dan produk (kolom)."""
+    reactants: Tuple[str, ...]
+    products: Tuple[str, ...]
+    reactant_molar_masses: np.ndarray
+    product_molar_masses: np.ndarray
+    supplied_moles: np.ndarray
+    extent: np.ndarray
+    limiting: np.ndarray
+    consumed_moles: np.ndarray
+    product_moles: np.ndarray
+
+    @property
+    def excess_moles(self):
+        """Sisa pereaksi setelah reaksi (NaN untuk pereaksi yang tidak diukur)"""
+        return self.supplied_moles - self.consumed_moles
+
+    @property
+    def supplied_masses(self):
+        return self.supplied_moles * self.reactant_molar_masses
+
+    @property
+    def consumed_masses(self):
+        return self.consumed_moles * self.reactant_molar_masses
+
+    @property
+    def excess_masses(self):
+        return self.excess_moles * self.reactant_molar_masses
+
+    @property
+    def product_masses(self):
+        """Hasil teoretis (g) setiap produk"""
+        return self.product_moles * self.product_molar_masses
+
+    def limiting_labels(self):
+        """Nama pereaksi pembatas per skenario ('' bila tidak ada reaktan yang diukur)"""
+        return [self.reactants[index] if index >= 0 else "" for index in self.limiting.tolist()]
+
+    def percent_yield(self, product, actual_masses):
+        """Rendemen (%) produk ke-``product`` dari massa aktual (g)"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.asarray(actual_masses, dtype=np.float64) / self.product_masses[:, product] * 100
+
+
+def to_moles(amount, unit, molar_mass, molarity=None):
+    """Konversi jumlah (massa, mol, atau volume larutan × molaritas) ke mol; boleh berupa array"""
+    if unit not in UNITS:
+        raise ValueError(f"Satuan tidak dikenal: {unit!r}")
+    kind, factor = UNITS[unit]
+    amount = np.asarray(amount, dtype=np.float64) * factor
+    if kind == "moles":
+        return amount
+    if kind == "volume":
+        if molarity is None:
+            raise ValueError("Volume larutan membutuhkan molaritas")
+        return amount * np.asarray(molarity, dtype=np.float64)
+    if molar_mass <= 0:
+        raise ValueError("Spesies tanpa massa (mis. elektron) tidak dapat diukur dalam gram")
+    return amount / molar_mass
+
+
+def _reaction_vectors(balanced):
+    if not balanced.ok:
+        raise ValueError(f"Reaksi belum setara: {balanced.error}")
+    split = len(balanced.reactants)
+    coefficients = np.array(balanced.coefficients, dtype=np.float64)
+    masses = np.array([species.mass for species in balanced.species], dtype=np.float64)
+    return split, coefficients, masses
+
+
+def solve_stoichiometry(balanced, supplied_moles):
+    """Pereaksi pembatas dan hasil untuk matriks mol N × R (atau satu baris R)
+
+    ``balanced`` adalah ``BalanceResult`` yang berhasil; NaN pada ``supplied_moles``
+    menandai reaktan berlebih yang tidak ikut menentukan pembatas.
+    """
+    split, coefficients, masses = _reaction_vectors(balanced)
+    supplied = np.atleast_2d(np.asarray(supplied_moles, dtype=np.float64))
+    if supplied.shape[1] != split:
+        raise ValueError(f"Dibutuhkan {split} kolom jumlah reaktan, diberikan {supplied.shape[1]}")
+    if (supplied < 0).any():
+        raise ValueError("Jumlah pereaksi tidak boleh negatif")
+
+    extents = np.where(np.isnan(supplied), np.inf, supplied / coefficients[:split])
+    limiting = extents.argmin(axis=1)
+    extent = extents[np.arange(len(extents)), limiting]
+    unmeasured = np.isinf(extent)
+    limiting[unmeasured] = -1
+    extent[unmeasured] = np.nan
+
+    consumed = extent[:, None] * coefficients[None, :split]
+    return StoichiometryTable(
+        tuple(species.label for species in balanced.reactants),
+        tuple(species.label for species in balanced.products),
+        masses[:split],
+        masses[split:],
+        supplied,
+        extent,
+        limiting,
+        consumed,
+        extent[:, None] * coefficients[None, split:],
+    )
+
+
+def scale_up(balanced, supplied_moles, factors):
+    """Resep dasar (satu baris mol reaktan) dikali setiap faktor skala sekaligus"""
+    base = np.asarray(supplied_moles, dtype=np.float64).reshape(1, -1)
+    factors = np.asarray(factors, dtype=np.float64).reshape(-1, 1)
+    if (factors < 0).any():
+        raise ValueError("Faktor skala tidak boleh negatif")
+    return solve_stoichiometry(balanced, factors * base)
+
+
+def factors_for_product(base, product, target_masses, percent_yield=100.0):
+    """Faktor skala agar produk ke-``product`` mencapai ``target_masses`` (g) pada rendemen tertentu
+
+    ``base`` adalah ``StoichiometryTable`` satu baris untuk resep dasar.
+    """
+    expected = base.product_masses[0, product] * percent_yield / 100
+    if not np.isfinite(expected) or expected <= 0:
+        raise ValueError("Resep dasar tidak menghasilkan produk; isi jumlah minimal satu reaktan")
+    return np.asarray(target_masses, dtype=np.float64) / expected
@@ -0,0 +1,142 @@
+"""Pipeline streaming untuk file rumus berukuran besar.
+
+Rumus dibaca baris demi baris, dikelompokkan menjadi potongan berukuran tetap,
+lalu setiap potongan melewati parse → massa → komposisi memakai
+``evaluate_formulas``. Hasil ditulis langsung ke file keluaran dan hanya
+ringkasan agregat serta sampel berukuran tetap yang disimpan di memori, sehingga
+pemakaian memori tidak bergantung pada ukuran input.
+"""
+import csv
+import math
+import random
+from itertools import chain, islice
+
+import numpy as np
+
+from .batch import evaluate_formulas
+from .parallel import PARALLEL_THRESHOLD, imap_evaluate
+
+DEFAULT_CHUNK_SIZE = 10000
+SAMPLE_SIZE = 1000
+MAX_ERROR_SAMPLES = 20
+
+CSV_HEADER = ("Senyawa", "Massa Molekul (g/mol)", "Jumlah Unsur", "Total Atom", "Komposisi (%)", "Error")
+
+
+def iter_chunks(iterable, size=DEFAULT_CHUNK_SIZE):
+    """Kelompokkan iterable menjadi list berukuran ``size``"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_stream(formulas, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, threshold=PARALLEL_THRESHOLD):
+    """Evaluasi rumus per potongan, hasilkan satu ``BatchResult`` per potongan"""
+    chunks = iter_chunks(formulas, chunk_size)
+    if workers > 1:
+        # Input di bawah ``threshold`` rumus tidak perlu membayar start pool proses
+        buffered = []
+        total = 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            total += len(chunk)
+            if total >= threshold:
+                yield from imap_evaluate(chain(buffered, chunks), workers)
+                return
+        chunks = iter(buffered)
+    for chunk in chunks:
+        yield evaluate_formulas(chunk)
+
+
+def result_rows(result):
+    """Baris CSV untuk satu ``BatchResult``"""
+    # Satu kali nonzero per potongan; konversi ke list agar format angka murah
+    rows, columns = np.nonzero(result.counts)
+    percentages = result.percentages()[rows, columns].tolist()
+    symbols = [result.symbols[c] for c in columns.tolist()]
+    bounds = np.searchsorted(rows, np.arange(len(result.formulas) + 1)).tolist()
+    masses = result.masses.tolist()
+    atom_counts = result.counts.sum(axis=1).tolist()
+
+    for row, formula in enumerate(result.formulas):
+        error = result.errors[row]
+        if error is not None:
+            yield (formula, "", "", "", "", error)
+            continue
+        start, end = bounds[row], bounds[row + 1]
+        composition = " ".join([f"{symbols[i]}:{percentages[i]:.4f}" for i in range(start, end)])
+        yield (formula, f"{masses[row]:.4f}", end - start, int(atom_counts[row]), composition, "")
+
+
+class StreamSummary:
+    """Agregat berjalan dan sampel reservoir dari hasil streaming."""
+
+    def __init__(self, sample_size=SAMPLE_SIZE, seed=0):
+        self.total = 0
+        self.valid = 0
+        self.mass_sum = 0.0
+        self.mass_min = math.inf
+        self.mass_max = -math.inf
+        self.percentage_sums = {}
+        self.sample = []
+        self.errors = []
+        self.error_count = 0
+        self._sample_size = sample_size
+        self._random = random.Random(seed)
+
+    @property
+    def mass_mean(self):
+        return self.mass_sum / self.valid if self.valid else math.nan
+
+    def mean_composition(self):
+        """Rata-rata persentase massa tiap unsur atas semua rumus valid"""
+        if not self.valid:
+            return {}
+        return {symbol: total / self.valid for symbol, total in self.percentage_sums.items()}
+
+    def update(self, result):
+        valid = result.valid
+        masses = result.masses[valid]
+        self.total += len(result.formulas)
+        self.valid += int(valid.sum())
+        if len(masses):
+            self.mass_sum += float(masses.sum())
+            self.mass_min = min(self.mass_min, float(masses.min()))
+            self.mass_max = max(self.mass_max, float(masses.max()))
+            sums = np.nansum(result.percentages()[valid], axis=0)
+            for symbol, total in zip(result.symbols, sums):
+                self.percentage_sums[symbol] = self.percentage_sums.get(symbol, 0.0) + float(total)
+
+        # Sampel reservoir (algoritma R) atas rumus valid
+        seen = self.valid - len(masses)
+        for row in np.flatnonzero(valid):
+            seen += 1
+            item = (result.formulas[row], float(result.masses[row]))
+            if len(self.sample) < self._sample_size:
+                self.sample.append(item)
+            else:
+                slot = self._random.randrange(seen)
+                if slot < self._sample_size:
+                    self.sample[slot] = item
+
+        for formula, error in zip(result.formulas, result.errors):
+            if error is not None:
+                self.error_count += 1
+                if len(self.errors) < MAX_ERROR_SAMPLES:
+                    self.errors.append((formula, error))
+
+
+def process_stream(formulas, out, chunk_size=DEFAULT_CHUNK_SIZE, on_chunk=None, workers=1):
+    """Tulis hasil semua rumus ke ``out`` sebagai CSV dan kembalikan ringkasannya"""
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+    summary = StreamSummary()
+    for result in evaluate_stream(formulas, chunk_size, workers):
+        writer.writerows(result_rows(result))
+        summary.update(result)
+        if on_chunk is not None:
+            on_chunk(summary)
+    return summary
@@ -0,0 +1,218 @@
+"""Kurva titrasi asam-basa dari neraca muatan, divektorkan atas seluruh volume.
+
+Setiap asam/basa pada ``data/acids_bases.csv`` dimodelkan sebagai sistem asam
+poliprotik (nilai pKa, muatan bentuk paling terprotonasi) ditambah ion penonton
+(mis. Na⁺ dari NaOH, Cl⁻ dari NH4Cl). Asam kuat ditulis dengan pKa sangat
+negatif dan basa kuat sebagai ion penonton saja, sehingga satu model mencakup
+asam/basa kuat, lemah, dan poliprotik. Tabel dikunci dengan komposisi hasil
+``parse_formula``: ``CH3COOH`` dan ``C2H4O2`` merujuk entri yang sama.
+
+pH setiap titik adalah akar neraca muatan
+
+    [H⁺] − Kw/[H⁺] + Σ C · (muatan penonton + muatan rata-rata sistem) = 0
+
+yang monoton terhadap pH, sehingga diselesaikan dengan bisection serentak untuk
+semua volume. Fraksi spesies dihitung di ruang log agar stabil untuk pKa
+ekstrem. Titik volume ditambah secara adaptif: interval dengan lompatan pH
+lebih besar dari ``max_ph_step`` dibelah dua sampai halus, sehingga titik
+berkumpul di sekitar titik ekuivalen. Koefisien aktivitas diabaikan (larutan
+encer, 25 °C).
+"""
+import csv
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+from .elements import DATA_DIR
+from .parser import parse_formula
+
+ACIDS_BASES_FILE = DATA_DIR / "acids_bases.csv"
+
+KW = 1e-14
+PH_RANGE = (-2.0, 16.0)
+BISECTION_STEPS = 50
+INITIAL_POINTS = 101
+MAX_PH_STEP = 0.05
+MAX_POINTS = 5000
+# Interval volume terkecil yang masih dibelah, relatif terhadap volume maksimum
+MIN_STEP_FRACTION = 1e-6
+# Volume titran maksimum bawaan, kelipatan volume ekuivalen terakhir
+OVERSHOOT = 1.5
+# Proton dengan pKa di luar batas ini tidak memberi lompatan pH yang terlihat
+DETECTABLE_PKA = (3.0, 11.0)
+MIN_PKA_GAP = 3.0
+
+
+class AcidBase(NamedTuple):
+    """Satu entri tabel asam/basa."""
+    formula: str
+    name: str
+    kind: str
+    pka: Tuple[float, ...]
+    charge: int
+    spectator: int
+
+    @property
+    def removed(self):
+        """Jumlah proton yang sudah lepas dari bentuk paling terprotonasi pada rumus ini"""
+        return self.spectator + self.charge
+
+    @property
+    def equivalents(self):
+        """Mol H⁺ yang dilepas (asam) atau diterima (basa) per mol senyawa"""
+        return len(self.pka) - self.removed if self.kind == "acid" else self.removed
+
+    def detectable(self, step):
+        """Apakah ekuivalen ke-``step`` (mulai 1) menghasilkan lompatan pH yang terlihat
+
+        Proton harus cukup asam/basa terhadap air dan terpisah cukup jauh dari
+        proton berikutnya; bila tidak, dua ekuivalen menyatu menjadi satu lompatan.
+        """
+        low, high = DETECTABLE_PKA
+        if self.kind == "acid":
+            index, following = self.removed + step - 1, self.removed + step
+            if index >= len(self.pka):
+                return True
+            if following >= len(self.pka):
+                return self.pka[index] < high
+            next_pka = self.pka[following]
+            return self.pka[index] < high and next_pka > low and next_pka - self.pka[index] >= MIN_PKA_GAP
+        index, following = self.removed - step, self.removed - step - 1
+        if index >= len(self.pka):
+            # Gugus OH⁻ dari basa kuat: semua menyatu dalam satu lompatan
+            return step == self.equivalents or (following < len(self.pka) and self.pka[following] < high)
+        if following < 0:
+            return self.pka[index] > low
+        next_pka = self.pka[following]
+        return self.pka[index] > low and next_pka < high and self.pka[index] - next_pka >= MIN_PKA_GAP
+
+
+class TitrationCurve(NamedTuple):
+    """Kurva titrasi: volume titran (mL) dan pH, serta titik ekuivalen."""
+    volumes: np.ndarray
+    ph: np.ndarray
+    equivalence_volumes: Tuple[float, ...]
+    equivalence_ph: Tuple[float, ...]
+
+
+def _composition_key(formula):
+    result = parse_formula(formula)
+    if not result.ok:
+        raise ValueError(result.error)
+    return tuple(sorted(result.elements.items()))
+
+
+class AcidBaseTable:
+    """Tabel asam/basa yang dicari berdasarkan komposisi rumus."""
+
+    def __init__(self, path=ACIDS_BASES_FILE):
+        self.entries = []
+        self._by_key = {}
+        with open(path, newline="", encoding="utf-8") as handle:
+            for record in csv.DictReader(handle):
+                entry = AcidBase(
+                    record["formula"],
+                    record["name"],
+                    record["kind"],
+                    tuple(float(value) for value in record["pka"].split(";") if value),
+                    int(record["charge"]),
+                    int(record["spectator"]),
+                )
+                self.entries.append(entry)
+                self._by_key[_composition_key(entry.formula)] = entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def of_kind(self, kind):
+        return [entry for entry in self.entries if entry.kind == kind]
+
+    def lookup(self, formula):
+        """Entri untuk ``formula``; ``ValueError`` bila tidak dikenal"""
+        entry = self._by_key.get(_composition_key(formula))
+        if entry is None:
+            raise ValueError(f"'{formula}' tidak ada di tabel asam/basa")
+        return entry
+
+
+ACIDS_BASES = AcidBaseTable()
+
+
+def _mean_charge(ph, system):
+    """Muatan rata-rata sistem asam poliprotik pada setiap pH"""
+    if not system.pka:
+        return np.full_like(ph, float(system.charge))
+    pka = np.asarray(system.pka)
+    n = len(pka)
+    removed = np.arange(n + 1)
+    # log10 fraksi (belum dinormalisasi) spesies yang kehilangan j proton
+    log_terms = -ph[:, None] * (n - removed) - np.concatenate([[0.0], np.cumsum(pka)])
+    weights = 10 ** (log_terms - log_terms.max(axis=1, keepdims=True))
+    return system.charge - (weights @ removed) / weights.sum(axis=1)
+
+
+def solve_ph(systems, concentrations):
+    """pH dari neraca muatan; ``concentrations`` satu larik (M) per sistem, panjang sama"""
+    concentrations = [np.asarray(c, dtype=np.float64) for c in concentrations]
+    low = np.full(concentrations[0].shape, PH_RANGE[0])
+    high = np.full(concentrations[0].shape, PH_RANGE[1])
+    for _ in range(BISECTION_STEPS):
+        mid = (low + high) / 2
+        h = 10.0 ** -mid
+        residual = h - KW / h
+        for system, concentration in zip(systems, concentrations):
+            residual += concentration * (system.spectator + _mean_charge(mid, system))
+        # Residual turun saat pH naik: positif berarti pH sebenarnya lebih tinggi
+        above = residual > 0
+        low = np.where(above, mid, low)
+        high = np.where(above, high, mid)
+    return (low + high) / 2
+
+
+def titration_curve(analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration,
+                    max_volume=None, max_ph_step=MAX_PH_STEP, max_points=MAX_POINTS):
+    """Kurva titrasi ``analyte`` (M, mL) oleh ``titrant`` (M)
+
+    ``analyte``/``titrant`` berupa rumus atau ``AcidBase``; keduanya harus
+    berlawanan jenis (asam dengan basa).
+    """
+    if isinstance(analyte, str):
+        analyte = ACIDS_BASES.lookup(analyte)
+    if isinstance(titrant, str):
+        titrant = ACIDS_BASES.lookup(titrant)
+    if analyte.kind == titrant.kind:
+        raise ValueError("Analit dan titran harus berupa pasangan asam dan basa")
+    if min(analyte_concentration, analyte_volume, titrant_concentration) <= 0:
+        raise ValueError("Konsentrasi dan volume harus positif")
+
+    analyte_moles = analyte_concentration * analyte_volume
+    steps = range(1, analyte.equivalents + 1)
+    all_volumes = [step * analyte_moles / (titrant.equivalents * titrant_concentration) for step in steps]
+    equivalence_volumes = tuple(v for step, v in zip(steps, all_volumes) if analyte.detectable(step))
+    if max_volume is None:
+        max_volume = OVERSHOOT * (equivalence_volumes or all_volumes)[-1]
+
+    def ph_at(volumes):
+        total = analyte_volume + volumes
+        return solve_ph(
+            (analyte, titrant),
+            (analyte_moles / total, titrant_concentration * volumes / total),
+        )
+
+    volumes = np.unique(np.concatenate([
+        np.linspace(0.0, max_volume, INITIAL_POINTS),
+        [v for v in equivalence_volumes if v <= max_volume],
+    ]))
+    ph = ph_at(volumes)
+    min_step = max_volume * MIN_STEP_FRACTION
+    while len(volumes) < max_points:
+        refine = np.flatnonzero((np.abs(np.diff(ph)) > max_ph_step) & (np.diff(volumes) > min_step))
+        if not len(refine):
+            break
+        refine = refine[:max_points - len(volumes)]
+        midpoints = (volumes[refine] + volumes[refine + 1]) / 2
+        volumes = np.insert(volumes, refine + 1, midpoints)
+        ph = np.insert(ph, refine + 1, ph_at(midpoints))
+
+    equivalence_ph = ph_at(np.array(equivalence_volumes)) if equivalence_volumes else ()
+    return TitrationCurve(volumes, ph, equivalence_volumes, tuple(float(p) for p in equivalence_ph))
@@ -0,0 +1,185 @@
+"""Propagasi ketidakpastian pembuatan larutan: Monte Carlo dan linear orde pertama.
+
+Setiap besaran masukan (massa timbangan, volume labu/pipet, kemurnian, massa
+atom setiap unsur) diberi nilai dan ketidakpastian beserta distribusinya:
+
+- ``normal``: ketidakpastian adalah simpangan baku;
+- ``rectangular``: ketidakpastian adalah batas toleransi ±a (u = a/√3),
+  misalnya massa atom yang dibulatkan pada tabel;
+- ``triangular``: batas toleransi ±a dengan nilai tengah paling mungkin
+  (u = a/√6), lazim untuk alat gelas volumetrik.
+
+Masukan dengan batas fisik (kemurnian tidak dapat melebihi 100%) diberi
+``maximum``; sampel Monte Carlo di atas batas itu dipotong ke batasnya.
+
+Monte Carlo mengambil ``samples`` sampel dari setiap masukan sekaligus dan
+mengevaluasi model secara tervektor; selang kepercayaan diambil dari kuantil
+sampel keluaran. Pendekatan linear (GUM) memakai koefisien sensitivitas dari
+beda hingga terpusat, dan kontribusi ``(c·u)²`` setiap masukan dipakai untuk
+mengurutkan masukan yang paling dominan.
+"""
+import math
+from typing import Callable, Dict, NamedTuple, Tuple
+
+import numpy as np
+
+from .elements import ELEMENTS
+
+DEFAULT_SAMPLES = 1_000_000
+DEFAULT_COVERAGE = 0.95
+HISTOGRAM_BINS = 60
+# Langkah beda hingga relatif terhadap ketidakpastian standar masukan
+DERIVATIVE_STEP = 1e-3
+
+_DIVISORS = {"normal": 1.0, "rectangular": math.sqrt(3), "triangular": math.sqrt(6)}
+
+
+class Input(NamedTuple):
+    """Satu besaran masukan model."""
+    name: str
+    value: float
+    uncertainty: float
+    distribution: str = "normal"
+    maximum: float = math.inf
+
+    @property
+    def standard(self):
+        """Ketidakpastian standar"""
+        return self.uncertainty / _DIVISORS[self.distribution]
+
+    def sample(self, rng, size):
+        if self.uncertainty <= 0:
+            return np.full(size, self.value)
+        if self.distribution == "normal":
+            values = rng.normal(self.value, self.uncertainty, size)
+        else:
+            low, high = self.value - self.uncertainty, self.value + self.uncertainty
+            if self.distribution == "rectangular":
+                values = rng.uniform(low, high, size)
+            else:
+                values = rng.triangular(low, self.value, high, size)
+        return np.minimum(values, self.maximum, out=values)
+
+
+class Contribution(NamedTuple):
+    """Kontribusi satu masukan pada ketidakpastian linear."""
+    name: str
+    standard_uncertainty: float
+    sensitivity: float
+    share: float
+
+
+class UncertaintyResult(NamedTuple):
+    """Ringkasan propagasi; ``contributions`` terurut dari yang paling dominan."""
+    value: float
+    mean: float
+    standard_uncertainty: float
+    interval: Tuple[float, float]
+    coverage: float
+    linear_uncertainty: float
+    contributions: Tuple[Contribution, ...]
+    histogram: Tuple[np.ndarray, np.ndarray]
+    samples: int
+
+
+def _check(inputs):
+    for item in inputs:
+        if item.distribution not in _DIVISORS:
+            raise ValueError(f"Distribusi tidak dikenal untuk {item.name}: {item.distribution!r}")
+        if item.uncertainty < 0:
+            raise ValueError(f"Ketidakpastian {item.name} tidak boleh negatif")
+        if item.value > item.maximum:
+            raise ValueError(f"Nilai {item.name} melebihi batas {item.maximum:g}")
+    if len({item.name for item in inputs}) != len(inputs):
+        raise ValueError("Nama masukan harus unik")
+
+
+def linear_contributions(model, inputs):
+    """Ketidakpastian gabungan orde pertama dan kontribusi setiap masukan"""
+    nominal = {item.name: np.array([item.value]) for item in inputs}
+    terms = []
+    for item in inputs:
+        if item.standard == 0:
+            terms.append((item, 0.0, 0.0))
+            continue
+        step = item.standard * DERIVATIVE_STEP
+        upper, lower = dict(nominal), dict(nominal)
+        upper[item.name] = np.array([item.value + step])
+        lower[item.name] = np.array([item.value - step])
+        sensitivity = float((model(upper) - model(lower))[0]) / (2 * step)
+        terms.append((item, sensitivity, (sensitivity * item.standard) ** 2))
+    variance = sum(term for _, _, term in terms)
+    contributions = sorted(
+        (Contribution(item.name, item.standard, sensitivity, term / variance if variance else 0.0)
+         for item, sensitivity, term in terms),
+        key=lambda contribution: contribution.share, reverse=True,
+    )
+    return math.sqrt(variance), tuple(contributions)
+
+
+def propagate(model: Callable[[Dict[str, np.ndarray]], np.ndarray], inputs, samples=DEFAULT_SAMPLES,
+              coverage=DEFAULT_COVERAGE, seed=None):
+    """Propagasi ``inputs`` melalui ``model`` (fungsi tervektor dict nama → larik)"""
+    inputs = tuple(inputs)
+    _check(inputs)
+    if not 0 < coverage < 1:
+        raise ValueError("Tingkat kepercayaan harus di antara 0 dan 1")
+    rng = np.random.default_rng(seed)
+    outputs = model({item.name: item.sample(rng, samples) for item in inputs})
+    tail = (1 - coverage) / 2
+    low, high = np.quantile(outputs, [tail, 1 - tail])
+    linear, contributions = linear_contributions(model, inputs)
+    return UncertaintyResult(
+        float(model({item.name: np.array([item.value]) for item in inputs})[0]),
+        float(outputs.mean()),
+        float(outputs.std(ddof=1)),
+        (float(low), float(high)),
+        coverage,
+        linear,
+        contributions,
+        np.histogram(outputs, bins=HISTOGRAM_BINS),
+        samples,
+    )
+
+
+def atomic_weight_inputs(elements):
+    """Satu masukan rektangular per unsur: massa atom ± setengah digit terakhir tabel"""
+    return [
+        Input(f"Ar({symbol})", ELEMENTS.mass[row], ELEMENTS.mass_tolerance[row], "rectangular")
+        for symbol, row in ((symbol, ELEMENTS.by_symbol[symbol]) for symbol in elements)
+    ]
+
+
+def solid_solution_model(elements, mass, balance_uncertainty, flask_volume, flask_tolerance,
+                         purity=100.0, purity_uncertainty=0.0):
+    """Model C = m · P / (M · V) untuk larutan dari padatan (g, mL, %); hasil dalam M
+
+    Kembalikan ``(model, inputs)`` untuk ``propagate``.
+    """
+    counts = {symbol: count for symbol, count in elements.items() if count}
+    inputs = [
+        Input("Massa timbang", mass, balance_uncertainty),
+        Input("Volume labu", flask_volume, flask_tolerance, "triangular"),
+        Input("Kemurnian", purity, purity_uncertainty, "rectangular", maximum=100.0),
+    ] + atomic_weight_inputs(counts)
+
+    def model(values):
+        molar = sum(values[f"Ar({symbol})"] * count for symbol, count in counts.items())
+        return values["Massa timbang"] * values["Kemurnian"] / 100 / molar / (values["Volume labu"] / 1000)
+
+    return model, inputs
+
+
+def dilution_model(stock_concentration, stock_uncertainty, pipette_volume, pipette_tolerance,
+                   flask_volume, flask_tolerance):
+    """Model C2 = C1 · V1 / V2 untuk pengenceran (M, mL); kembalikan ``(model, inputs)``"""
+    inputs = [
+        Input("Konsentrasi awal", stock_concentration, stock_uncertainty),
+        Input("Volume pipet", pipette_volume, pipette_tolerance, "triangular"),
+        Input("Volume labu", flask_volume, flask_tolerance, "triangular"),
+    ]
+
+    def model(values):
+        return values["Konsentrasi awal"] * values["Volume pipet"] / values["Volume labu"]
+
+    return model, inputs
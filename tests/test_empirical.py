@@ -0,0 +1,61 @@
+"""Rumus empiris/molekul: pencarian pengali dan oksigen dari selisih."""
+import numpy as np
+import pytest
+
+from molcalc.composition import calculate_composition, calculate_empirical_formula, format_formula, hill_order, molar_mass
+from molcalc.empirical import oxygen_by_difference, solve_empirical
+from molcalc.parser import parse_formula
+
+CASES = [
+    ("C6H12O6", "CH2O"),
+    ("C8H10N4O2", "C4H5N2O"),
+    ("P4O10", "O5P2"),
+    ("C6H6", "CH"),
+    ("Fe2O3", "Fe2O3"),
+]
+
+
+def percentages(formula, digits=2):
+    """Persen massa terukur (dibulatkan seperti laporan analisis unsur)"""
+    elements = parse_formula(formula).elements
+    composition = calculate_composition(elements, molar_mass(elements))
+    return {el: round(data["percentage"], digits) for el, data in composition.items()}
+
+
+@pytest.mark.parametrize("formula, empirical", CASES)
+def test_calculate_empirical_formula(formula, empirical):
+    composition = {el: {"percentage": value} for el, value in percentages(formula).items()}
+    assert format_formula(hill_order(calculate_empirical_formula(composition))) == empirical
+
+
+@pytest.mark.parametrize("formula, empirical", CASES)
+def test_solve_empirical_batch(formula, empirical):
+    measured = percentages(formula)
+    solved = solve_empirical(list(measured), [list(measured.values())], [molar_mass(parse_formula(formula).elements)])
+    assert solved.errors == (None,)
+    assert solved.formulas() == [empirical]
+    assert solved.formulas(molecular=True) == [format_formula(hill_order(dict(parse_formula(formula).elements)))]
+
+
+def test_solve_empirical_rows_are_independent():
+    symbols = ("C", "H", "N", "O", "P")
+    rows = [[percentages(formula).get(symbol, np.nan) for symbol in symbols] for formula, _ in CASES[:3]]
+    solved = solve_empirical(symbols, rows)
+    assert solved.formulas() == [empirical for _, empirical in CASES[:3]]
+    assert list(solved.multipliers) == [1, 1, 2]
+
+
+def test_oxygen_by_difference_fills_missing_oxygen():
+    measured = percentages("C6H12O6")
+    symbols, filled = oxygen_by_difference(["C", "H"], [[measured["C"], measured["H"]]])
+    assert symbols == ("C", "H", "O")
+    assert solve_empirical(symbols, filled).formulas() == ["CH2O"]
+
+
+def test_oxygen_by_difference_ignores_small_remainder():
+    # Benzena dengan galat pengukuran 0.3%: sisa tidak dianggap oksigen
+    symbols, filled = oxygen_by_difference(["C", "H"], [[92.0, 7.7]])
+    assert filled[0, 2] == 0.0
+    assert solve_empirical(symbols, filled).formulas() == ["CH"]
+    _, strict = oxygen_by_difference(["C", "H"], [[92.0, 7.7]], minimum=0.2)
+    assert strict[0, 2] == pytest.approx(0.3)
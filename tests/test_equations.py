@@ -0,0 +1,83 @@
+"""Penyetaraan reaksi: redoks, ionik, elektron, dan reaksi tidak tertentu."""
+import pytest
+
+from molcalc.equations import balance_equation, balance_equations, parse_species
+
+BALANCED = [
+    ("H2 + O2 -> H2O", (2, 1, 2)),
+    ("C3H8 + O2 -> CO2 + H2O", (1, 5, 3, 4)),
+    ("KMnO4 + HCl -> KCl + MnCl2 + Cl2 + H2O", (2, 16, 2, 2, 5, 8)),
+    ("Cu + HNO3 -> Cu(NO3)2 + NO + H2O", (3, 8, 3, 2, 4)),
+    ("K4Fe(CN)6 + KMnO4 + H2SO4 -> KHSO4 + Fe2(SO4)3 + MnSO4 + HNO3 + CO2 + H2O",
+     (10, 122, 299, 162, 5, 122, 60, 60, 188)),
+    ("MnO4^- + Fe{2+} + H+ -> Mn{2+} + Fe{3+} + H2O", (1, 5, 8, 1, 5, 4)),
+    ("Cr2O7^2- + I- + H+ -> Cr^3+ + I2 + H2O", (1, 6, 14, 2, 3, 7)),
+    ("Ag+ + Cl- -> AgCl(s)", (1, 1, 1)),
+    ("Fe{3+} + e- -> Fe{2+}", (1, 1, 1)),
+    ("MnO4- + 8H+ + e- -> Mn{2+} + H2O", (1, 8, 5, 1, 4)),
+    ("H2O -> H2 + O2", (2, 2, 1)),
+]
+
+
+@pytest.mark.parametrize("equation, coefficients", BALANCED)
+def test_balanced_coefficients(equation, coefficients):
+    result = balance_equation(equation)
+    assert result.ok, result.error
+    assert result.coefficients == coefficients
+
+
+@pytest.mark.parametrize("equation, _", BALANCED)
+def test_atoms_and_charge_are_conserved(equation, _):
+    result = balance_equation(equation)
+    split = len(result.reactants)
+    sides = [{}, {}]
+    for index, (coefficient, species) in enumerate(zip(result.coefficients, result.species)):
+        side = sides[index >= split]
+        for symbol, count in species.elements.items():
+            side[symbol] = side.get(symbol, 0) + coefficient * count
+        side["charge"] = side.get("charge", 0) + coefficient * species.charge
+    assert sides[0] == sides[1]
+
+
+def test_species_order_does_not_change_coefficients():
+    shuffled = balance_equation("HCl + KMnO4 -> H2O + Cl2 + MnCl2 + KCl")
+    assert shuffled.balanced == "16 HCl + 2 KMnO4 → 8 H2O + 5 Cl2 + 2 MnCl2 + 2 KCl"
+
+
+def test_underdetermined_reaction_returns_basis():
+    result = balance_equation("H2 + O2 -> H2O + H2O2")
+    assert not result.ok and "tidak tertentu" in result.error
+    assert len(result.basis) == 2
+    for vector in result.basis:
+        # H: 2a = 2c + 2d, O: 2b = c + 2d
+        a, b, c, d = vector
+        assert 2 * a == 2 * c + 2 * d and 2 * b == c + 2 * d
+
+
+@pytest.mark.parametrize("equation, message", [
+    ("H2 -> O2", "tidak dapat disetarakan"),
+    ("H2O + NaCl -> H2O", "tidak ikut bereaksi"),
+    ("H2O -> ", "tepat satu tanda panah"),
+    ("Xx + O2 -> XxO", "tidak dikenali"),
+])
+def test_errors(equation, message):
+    result = balance_equation(equation)
+    assert not result.ok and message in result.error
+
+
+@pytest.mark.parametrize("text, formula, charge", [
+    ("SO4^2-", "SO4", -2),
+    ("Fe{3+}", "Fe", 3),
+    ("Fe+3", "Fe", 3),
+    ("NH4+", "NH4", 1),
+    ("e-", "e", -1),
+    ("2H2O(l)", "H2O", 0),
+])
+def test_parse_species_charge(text, formula, charge):
+    species = parse_species(text)
+    assert (species.formula, species.charge) == (formula, charge)
+
+
+def test_balance_equations_skips_comments():
+    results = list(balance_equations(["# judul", "", "H2 + O2 -> H2O"]))
+    assert [result.balanced for result in results] == ["2 H2 + O2 → 2 H2O"]
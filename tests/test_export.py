@@ -0,0 +1,64 @@
+"""Round-trip export riwayat lintas beberapa batch."""
+import pytest
+
+from molcalc.composition import molar_mass
+from molcalc.export import collect_elements, export_history
+from molcalc.history import HistoryStore
+from molcalc.parser import parse_formula
+
+pa = pytest.importorskip("pyarrow")
+
+FORMULAS = ("H2O", "NaCl", "CuSO4·5H2O", "C6H12O6", "Fe2O3")
+COMPOSITIONS = {formula: dict(parse_formula(formula).elements) for formula in FORMULAS}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    for formula, composition in COMPOSITIONS.items():
+        store.append("sesi", formula, molar_mass(composition), composition)
+    return store
+
+
+def read_arrow(path):
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+
+def counts_by_formula(table):
+    counts = {}
+    for row in table.to_pylist():
+        counts.setdefault(row["formula"], {})[row["element"]] = row["count"]
+    return counts
+
+
+def test_arrow_long_export_round_trips(store, tmp_path):
+    path = tmp_path / "history-long.arrow"
+    with open(path, "wb") as out:
+        rows = export_history(store.iter_batches("sesi", 1), out, "arrow", "long")
+
+    table = read_arrow(path)
+    assert table.num_rows == rows == sum(len(composition) for composition in COMPOSITIONS.values())
+    assert counts_by_formula(table) == COMPOSITIONS
+    masses = dict(zip(table.column("formula").to_pylist(), table.column("mass").to_pylist()))
+    assert masses == pytest.approx({formula: molar_mass(c) for formula, c in COMPOSITIONS.items()})
+
+
+def test_arrow_wide_export_spans_batches(store, tmp_path):
+    path = tmp_path / "history-wide.arrow"
+    elements = collect_elements(store.iter_batches("sesi", 2))
+    with open(path, "wb") as out:
+        rows = export_history(store.iter_batches("sesi", 1), out, "arrow", "wide", elements)
+
+    table = read_arrow(path)
+    assert table.num_rows == rows == len(FORMULAS)
+    assert table.column("formula").to_pylist() == list(FORMULAS)
+    for row in table.to_pylist():
+        assert {el: row[el] for el in elements if row[el]} == COMPOSITIONS[row["formula"]]
+
+
+def test_parquet_long_export_round_trips(store, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "history.parquet"
+    with open(path, "wb") as out:
+        export_history(store.iter_batches("sesi", 2), out, "parquet", "long")
+    assert counts_by_formula(pq.read_table(path)) == COMPOSITIONS
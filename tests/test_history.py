@@ -0,0 +1,99 @@
+"""Riwayat SQLite: isolasi sesi, penanda hapus, paging, dan koneksi bersamaan."""
+import sqlite3
+import threading
+
+import pytest
+
+from molcalc.history import HistoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return HistoryStore(tmp_path / "history.db")
+
+
+def fill(store, session, count, formula="H2O"):
+    return [store.append(session, formula, 18.015 + i, {"H": 2, "O": 1}) for i in range(count)]
+
+
+def test_sessions_are_separate(store):
+    fill(store, "a", 3)
+    fill(store, "b", 2, "NaCl")
+    store.add_favorite("a", "H2O")
+
+    assert store.count("a") == 3 and store.count("b") == 2
+    assert {entry.formula for entry in store.page("b", 10)} == {"NaCl"}
+    assert store.favorites("b") == [] and store.favorites("a") == ["H2O"]
+    assert store.add_favorite("a", "H2O") is False
+
+
+def test_clear_hides_rows_without_deleting(store):
+    old = fill(store, "a", 3)
+    fill(store, "b", 2)
+    store.clear("a")
+
+    assert store.count("a") == 0 and store.page("a", 10) == []
+    assert store.count("b") == 2
+    new = fill(store, "a", 1)
+    assert [entry.id for entry in store.page("a", 10)] == new
+
+    connection = sqlite3.connect(store.path)
+    assert connection.execute("SELECT count(*) FROM history").fetchone()[0] == 6
+    assert connection.execute(
+        "SELECT last_id FROM history_clears WHERE session = 'a'"
+    ).fetchone()[0] >= max(old)
+
+
+@pytest.mark.parametrize("total", [0, 1, 9, 10, 11, 20, 21])
+def test_paging_at_page_boundaries(store, total):
+    ids = fill(store, "a", total)
+    size = 10
+    pages = [store.page("a", size, offset) for offset in range(0, total + size, size)]
+
+    assert all(len(page) <= size for page in pages)
+    assert [entry.id for page in pages for entry in page] == ids[::-1]
+    assert pages[-1] == []
+    assert [entry.id for entry in store.iter_entries("a", batch_size=size)] == ids
+
+
+def test_paging_after_clear_counts_only_visible_rows(store):
+    fill(store, "a", 15)
+    store.clear("a")
+    ids = fill(store, "a", 12)
+
+    assert store.count("a") == 12
+    assert [entry.id for entry in store.page("a", 10, 10)] == ids[1::-1]
+
+
+def test_concurrent_connections_in_wal_mode(store):
+    assert store._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    other = HistoryStore(store.path)
+    errors = []
+
+    def writer(target, session):
+        try:
+            fill(target, session, 200)
+        except Exception as exc:
+            errors.append(exc)
+
+    def reader():
+        try:
+            for _ in range(200):
+                store.count("w1")
+                other.page("w2", 10)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [
+        threading.Thread(target=writer, args=(store, "w1")),
+        threading.Thread(target=writer, args=(other, "w2")),
+        threading.Thread(target=reader),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert store.count("w1") == other.count("w1") == 200
+    assert store.count("w2") == other.count("w2") == 200
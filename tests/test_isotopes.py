@@ -0,0 +1,40 @@
+"""Pola isotop: kelimpahan total, massa monoisotopik, dan massa rata-rata."""
+import pytest
+
+from molcalc.composition import molar_mass
+from molcalc.isotopes import DEFAULT_THRESHOLD, _element_power, isotope_pattern
+from molcalc.parser import parse_formula
+
+LARGE = "C20000H30000N5000O6000S200"
+
+
+@pytest.mark.parametrize("formula", ["H2O", "CH4", "C254H377N65O75S6", LARGE])
+def test_total_abundance_is_one(formula):
+    assert isotope_pattern(formula).abundances.sum() == pytest.approx(1.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("symbol, count", [("C", 20000), ("S", 200), ("Cl", 1000)])
+def test_pruned_powers_keep_total_abundance(symbol, count):
+    _, probabilities, _ = _element_power(symbol, count, DEFAULT_THRESHOLD)
+    assert probabilities.sum() == pytest.approx(1.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("formula, expected", [
+    ("H2O", 18.010565),
+    ("CH4", 16.031300),
+    ("C6H12O6", 180.063388),
+])
+def test_monoisotopic_mass(formula, expected):
+    assert isotope_pattern(formula).monoisotopic_mass == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.parametrize("formula", ["C6H12O6", "C254H377N65O75S6", LARGE])
+def test_average_mass_matches_molar_mass(formula):
+    expected = molar_mass(parse_formula(formula).elements)
+    assert isotope_pattern(formula).average_mass == pytest.approx(expected, rel=1e-4)
+
+
+def test_chlorine_pattern():
+    pattern = isotope_pattern("Cl2")
+    assert list(pattern.nominal) == [70, 72, 74]
+    assert pattern.relative[1] == pytest.approx(64.0, abs=0.5)
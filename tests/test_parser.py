@@ -0,0 +1,64 @@
+"""Kesetaraan parser rumus dengan komposisi yang diketahui."""
+import pytest
+
+from molcalc.incremental import IncrementalParser
+from molcalc.parser import parse_formula
+
+KNOWN = {
+    "H2O": {"H": 2, "O": 1},
+    "C6H12O6": {"C": 6, "H": 12, "O": 6},
+    "Al2(SO4)3": {"Al": 2, "S": 3, "O": 12},
+    "Ca3(PO4)2": {"Ca": 3, "P": 2, "O": 8},
+    "K4Fe(CN)6": {"K": 4, "Fe": 1, "C": 6, "N": 6},
+    "Mg(OH)2": {"Mg": 1, "O": 2, "H": 2},
+    "CuSO4·5H2O": {"Cu": 1, "S": 1, "O": 9, "H": 10},
+    "CuSO4.5H2O": {"Cu": 1, "S": 1, "O": 9, "H": 10},
+    "Na2CO3 • 10 H2O": {"Na": 2, "C": 1, "O": 13, "H": 20},
+    "(Co(NH3)6)Cl3": {"Co": 1, "N": 6, "H": 18, "Cl": 3},
+    "Fe4(Fe(CN)6)3": {"Fe": 7, "C": 18, "N": 18},
+    "(CH3)3C(CH2(CH3)2)2": {"C": 10, "H": 25},
+    "2H2O": {"H": 4, "O": 2},
+    "3(NH4)2SO4": {"N": 6, "H": 24, "S": 3, "O": 12},
+}
+
+ERRORS = [
+    ("", "Formula kosong", 0),
+    ("Ca(OH", "Kurung buka '(' tidak ditutup", 2),
+    ("Ca(OH.H2O", "Kurung buka '(' tidak ditutup", 2),
+    ("((H2O)", "Kurung buka '(' tidak ditutup", 0),
+    ("H2O)", "Kurung tutup ')' tanpa pasangan", 3),
+    ("AmA", "Unsur 'A' tidak dikenali", 2),
+    ("HXx", "Unsur 'Xx' tidak dikenali", 1),
+    ("Al2(SO4)3Xx", "Unsur 'Xx' tidak dikenali", 9),
+    ("h2o", "Format tidak dikenali: 'h2o'", 0),
+    ("NaCl.2", "Format tidak dikenali: '2'", 5),
+    ("H2-O", "Format tidak dikenali: '-O'", 2),
+]
+
+
+@pytest.mark.parametrize("formula, expected", KNOWN.items())
+def test_known_compositions(formula, expected):
+    result = parse_formula(formula)
+    assert result.ok, result.error
+    assert dict(result.elements) == expected
+
+
+@pytest.mark.parametrize("formula, message, position", ERRORS)
+def test_errors_and_positions(formula, message, position):
+    result = parse_formula(formula)
+    assert result.error == message
+    assert result.position == position
+
+
+@pytest.mark.parametrize("formula", list(KNOWN) + [formula for formula, *_ in ERRORS])
+def test_incremental_parser_agrees(formula):
+    assert IncrementalParser(checkpoint_interval=2).parse(formula) == parse_formula(formula)
+
+
+def test_incremental_parser_resumes_after_edit():
+    parser = IncrementalParser(checkpoint_interval=4)
+    base = "C6H12O6" * 10
+    parser.parse(base)
+    assert parser.parse(base + "Na") == parse_formula(base + "Na")
+    assert parser.reused > 0 and parser.parsed < len(base)
+    assert parser.parse("Xx" + base) == parse_formula("Xx" + base)
@@ -0,0 +1,51 @@
+"""Validasi input layanan JSON (status 4xx, bukan 500)."""
+import asyncio
+import json
+
+import pytest
+
+from molcalc.service import MolcalcService
+
+
+def dispatch(path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return asyncio.run(MolcalcService().dispatch("POST", path, body))
+
+
+def test_empirical_from_formula():
+    status, response = dispatch("/empirical", {"formula": "C6H12O6"})
+    assert status == 200
+    assert response["empirical"] == {"C": 1, "H": 2, "O": 1}
+
+
+@pytest.mark.parametrize("formula", ["()", "(H)0"])
+def test_empirical_rejects_formula_without_elements(formula):
+    status, response = dispatch("/empirical", {"formula": formula})
+    assert status == 400
+    assert "tidak berisi unsur" in response["error"]
+
+
+@pytest.mark.parametrize("body", [
+    b'{"percentages": {"C": NaN}}',
+    b'{"percentages": {"C": Infinity, "H": 6.7}}',
+    b'{"percentages": {"C": true}}',
+    b'{"percentages": {"C": -1}}',
+])
+def test_empirical_rejects_invalid_percentages(body):
+    status, response = dispatch("/empirical", body)
+    assert status == 400
+    assert "bilangan positif" in response["error"]
+
+
+def test_batch_reports_parse_errors_per_formula():
+    status, response = dispatch("/batch", {"formulas": ["H2O", "Xx"]})
+    assert status == 200
+    assert [item["error"] is None for item in response["results"]] == [True, False]
+
+
+def test_empirical_oxygen_by_difference_is_opt_in():
+    percentages = {"C": 40.0, "H": 6.71}
+    status, response = dispatch("/empirical", {"percentages": percentages})
+    assert status == 200 and "O" not in response["empirical"]
+    status, response = dispatch("/empirical", {"percentages": percentages, "oxygen_by_difference": True})
+    assert status == 200 and response["formula"] == "CH2O"
@@ -0,0 +1,54 @@
+"""Kurva titrasi dari neraca muatan: pH awal, titik ekuivalen, dan tabel asam/basa."""
+import numpy as np
+import pytest
+
+from molcalc.titration import ACIDS_BASES, solve_ph, titration_curve
+
+
+@pytest.mark.parametrize("analyte, titrant, volumes, ph", [
+    ("HCl", "NaOH", (25.0,), (7.0,)),
+    ("NaOH", "HCl", (25.0,), (7.0,)),
+    ("CH3COOH", "NaOH", (25.0,), (8.72,)),
+    ("NH3", "HCl", (25.0,), (5.28,)),
+    # Ekuivalen ketiga H3PO4 (pKa 12.35) tidak terlihat dalam air
+    ("H3PO4", "NaOH", (25.0, 50.0), (4.68, 9.7)),
+    ("Na2CO3", "HCl", (25.0, 50.0), (8.34, 3.9)),
+])
+def test_equivalence_points(analyte, titrant, volumes, ph):
+    curve = titration_curve(analyte, 0.1, 25.0, titrant, 0.1)
+    assert curve.equivalence_volumes == pytest.approx(volumes)
+    assert curve.equivalence_ph == pytest.approx(ph, abs=0.1)
+
+
+@pytest.mark.parametrize("formula, concentration, expected", [
+    ("HCl", 0.1, 1.0),
+    ("NaOH", 0.01, 12.0),
+    ("CH3COOH", 0.1, 2.88),
+    ("NH3", 0.1, 11.12),
+])
+def test_initial_ph(formula, concentration, expected):
+    assert solve_ph([ACIDS_BASES.lookup(formula)], [[concentration]])[0] == pytest.approx(expected, abs=0.02)
+
+
+def test_half_equivalence_equals_pka():
+    curve = titration_curve("CH3COOH", 0.1, 25.0, "NaOH", 0.1)
+    assert np.interp(12.5, curve.volumes, curve.ph) == pytest.approx(4.76, abs=0.05)
+
+
+def test_curve_is_monotonic_and_refined_near_equivalence():
+    curve = titration_curve("HCl", 0.1, 25.0, "NaOH", 0.1)
+    assert np.all(np.diff(curve.volumes) > 0)
+    assert np.all(np.diff(curve.ph) >= -1e-9)
+    near = np.abs(curve.volumes - 25.0) < 0.5
+    assert near.sum() > 20
+    assert np.abs(np.diff(curve.ph)).max() <= 0.05 or np.diff(curve.volumes).min() < 1e-3
+
+
+def test_lookup_by_composition():
+    assert ACIDS_BASES.lookup("C2H4O2") is ACIDS_BASES.lookup("CH3COOH")
+
+
+@pytest.mark.parametrize("analyte, titrant", [("HCl", "HNO3"), ("Xx", "NaOH"), ("HCl", "NaCl")])
+def test_invalid_pairs(analyte, titrant):
+    with pytest.raises(ValueError):
+        titration_curve(analyte, 0.1, 25.0, titrant, 0.1)
@@ -0,0 +1,38 @@
+"""Propagasi ketidakpastian larutan: Monte Carlo, linear, dan batas kemurnian."""
+import numpy as np
+import pytest
+
+from molcalc.uncertainty import Input, dilution_model, propagate, solid_solution_model
+
+NACL = {"Na": 1, "Cl": 1}
+
+
+def test_purity_samples_never_exceed_100_percent():
+    _, inputs = solid_solution_model(NACL, 5.844, 0.0, 1000.0, 0.0, 99.8, 1.0)
+    purity = next(item for item in inputs if item.name == "Kemurnian")
+    samples = purity.sample(np.random.default_rng(0), 100_000)
+    assert samples.max() == 100.0
+    assert samples.min() >= 98.8
+
+
+def test_concentration_interval_respects_purity_limit():
+    model, inputs = solid_solution_model(NACL, 5.844, 0.0, 1000.0, 0.0, 99.8, 1.0)
+    inputs = [item._replace(uncertainty=0.0) if item.name.startswith("Ar(") else item for item in inputs]
+    result = propagate(model, inputs, samples=50_000, seed=1)
+    pure = result.value / 0.998
+    assert result.interval[1] <= pure * (1 + 1e-12)
+    assert result.mean < result.value
+
+
+def test_value_above_maximum_is_rejected():
+    with pytest.raises(ValueError):
+        propagate(lambda values: values["x"], [Input("x", 101.0, 1.0, maximum=100.0)], samples=10)
+
+
+def test_monte_carlo_agrees_with_linear_for_dilution():
+    model, inputs = dilution_model(0.1, 0.0005, 10.0, 0.02, 100.0, 0.1)
+    result = propagate(model, inputs, samples=200_000, seed=2)
+    assert result.value == pytest.approx(0.01)
+    assert result.standard_uncertainty == pytest.approx(result.linear_uncertainty, rel=0.02)
+    assert sum(c.share for c in result.contributions) == pytest.approx(1.0)
+    assert result.contributions[0].name == "Konsentrasi awal"
@@ -0,0 +1,27 @@
+"""Halaman aplikasi Streamlit, dimuat saat pertama kali dikunjungi.
+
+Setiap modul halaman berisi ``render()`` beserta import berat (Plotly, Pandas,
+NumPy) dan konten statisnya sendiri. Modul baru diimpor ketika menunya dibuka
+dan setelah itu dipakai ulang dari ``sys.modules``, sehingga rerun Dashboard
+tidak pernah membayar biaya halaman lain.
+"""
+import importlib
+
+# Label menu (nilai ``st.session_state.menu``) → nama modul halaman
+PAGES = {
+    "🏠 Dashboard": "dashboard",
+    "🧪 Kalkulator": "calculator",
+    "📊 Analisis": "analysis",
+    "🔍 Database": "database",
+    "📈 Visualisasi": "visualization",
+    "📚 Pembelajaran": "learning",
+    "⚗️ Laboratorium": "lab",
+    "📋 Riwayat": "history",
+    "ℹ️ Tentang": "about",
+}
+DEFAULT_PAGE = "🏠 Dashboard"
+
+
+def load_page(menu):
+    """Modul halaman untuk label menu; label yang tidak dikenal jatuh ke Dashboard"""
+    return importlib.import_module(f"{__name__}.{PAGES.get(menu, PAGES[DEFAULT_PAGE])}")
@@ -0,0 +1,248 @@
+"""Halaman Tentang: deskripsi fitur, changelog, dan statistik aplikasi."""
+import streamlit as st
+
+from molcalc.elements import ELEMENTS
+
+from .common import common_compounds, show_lottie
+from .learning import learning_modules
+
+def render():
+    st.header("ℹ️ Tentang Aplikasi")
+    
+    # Animation
+    show_lottie("about", height=250, key="about_animation")
+    
+    st.markdown("""
+    ## 🚀 Advanced Molecular Mass Calculator
+    
+    Aplikasi komprehensif untuk perhitungan dan analisis massa molekul senyawa kimia dengan berbagai fitur canggih.
+    
+    ### ✨ Fitur Utama:
+    
+    #### 🧮 Kalkulator Canggih
+    - Parsing formula otomatis dengan dukungan berbagai format
+    - Perhitungan massa molekul presisi tinggi
+    - Analisis komposisi unsur dengan persentase
+    - Dukungan senyawa hidrasi dan kompleks
+    - Penyimpanan riwayat perhitungan
+    
+    #### 📊 Analisis Mendalam
+    - Perbandingan multi-senyawa
+    - Visualisasi komposisi dengan grafik interaktif
+    - Analisis statistik massa molekul
+    - Perhitungan rumus empiris
+    
+    #### 🔍 Database Komprehensif
+    - Informasi lengkap 118 unsur kimia
+    - Filter berdasarkan kategori dan periode
+    - Pencarian unsur dengan nama atau simbol
+    - Visualisasi posisi dalam tabel periodik
+    
+    #### 📈 Visualisasi Data
+    - Grafik hubungan massa atom vs nomor atom
+    - Distribusi kategori unsur
+    - Peta panas tabel periodik
+    - Analisis tren berdasarkan periode
+    
+    #### 📚 Modul Pembelajaran
+    - Penjelasan konsep massa atom dan molekul
+    - Tutorial perhitungan step-by-step
+    - Kuis interaktif untuk latihan
+    - Contoh kasus nyata
+    
+    #### ⚗️ Laboratorium Virtual
+    - Simulasi titrasi asam-basa
+    - Kalkulator pembuatan larutan
+    - Perhitungan pengenceran
+    - Kurva titrasi interaktif
+    
+    ### 🔧 Teknologi yang Digunakan:
+    - **Streamlit** - Framework aplikasi web
+    - **Plotly** - Visualisasi data interaktif
+    - **Pandas** - Manipulasi dan analisis data
+    - **Lottie** - Animasi yang menarik
+    
+    ### 📋 Changelog:
+    
+    #### Versi 2.0 (Terbaru)
+    - ✅ Penambahan 6 menu utama
+    - ✅ Database unsur kimia yang diperluas
+    - ✅ Visualisasi data yang canggih
+    - ✅ Laboratorium virtual
+    - ✅ Modul pembelajaran interaktif
+    - ✅ Sistem riwayat dan favorit
+    - ✅ Export data ke CSV, Parquet, dan Arrow
+    - ✅ UI yang lebih modern dan responsif
+    
+    #### Versi 1.0 (Sebelumnya)
+    - ✅ Kalkulator massa molekul dasar
+    - ✅ Parsing formula sederhana
+    - ✅ Dukungan senyawa hidrasi
+    - ✅ Antarmuka yang user-friendly
+    
+    ### 🎯 Aplikasi Praktis:
+    
+    #### 🏫 Pendidikan
+    - Pembelajaran kimia di sekolah menengah
+    - Praktikum kimia virtual
+    - Pemahaman konsep massa atom dan molekul
+    - Latihan soal stoikiometri
+    
+    #### 🔬 Penelitian
+    - Analisis komposisi senyawa
+    - Persiapan larutan standar
+    - Perhitungan stoikiometri reaksi
+    - Analisis data eksperimen
+    
+    #### 🏭 Industri
+    - Quality control produk kimia
+    - Formulasi produk
+    - Perhitungan batch production
+    - Analisis bahan baku
+    
+    ### 👥 Target Pengguna:
+    - 👨‍🎓 Siswa sekolah menengah
+    - 👩‍🎓 Mahasiswa kimia
+    - 👨‍🏫 Guru dan dosen
+    - 👩‍🔬 Peneliti dan analis
+    - 👨‍💼 Praktisi industri kimia
+    
+    ### 🚀 Rencana Pengembangan:
+    - 🔄 Penambahan lebih banyak unsur
+    - 📱 Versi mobile-friendly
+    - 🌐 Dukungan multi-bahasa
+    - 🔗 Integrasi dengan database online
+    - 🤖 Fitur AI untuk prediksi sifat senyawa
+    - 💾 Penyimpanan cloud
+    - 👥 Fitur kolaborasi tim
+    
+    ### 📞 Kontak & Dukungan:
+    Jika Anda memiliki pertanyaan, saran, atau menemukan bug, silakan hubungi pengembang melalui:
+    - 📧 Email: developer@molcalc.com
+    - 🐛 Report Bug: github.com/molcalc/issues
+    - 💡 Feature Request: github.com/molcalc/discussions
+    
+    ### 📜 Lisensi:
+    Aplikasi ini dikembangkan untuk tujuan edukasi dan penelitian. Penggunaan komersial memerlukan izin khusus.
+    
+    ### 🙏 Acknowledgments:
+    - Data massa atom berdasarkan IUPAC 2021
+    - Animasi dari LottieFiles community
+    - Icon dari Lucide React
+    - Komunitas Streamlit untuk dukungan teknis
+    
+    ---
+    
+    **Versi:** 2.0.0  
+    **Terakhir diperbarui:** Mei 2025  
+    **Developer:** Advanced Chemistry Tools Team
+    """)
+    
+    # Feature showcase
+    st.markdown("### 🎥 Showcase Fitur")
+    
+    # Create tabs for different features
+    feature_tabs = st.tabs(["🧮 Kalkulator", "📊 Analisis", "🔍 Database", "📈 Visualisasi", "⚗️ Lab Virtual"])
+    
+    with feature_tabs[0]:
+        st.markdown("""
+        #### 🧮 Kalkulator Massa Molekul
+        - Input formula yang fleksibel (H2O, Al2(SO4)3, CuSO4·5H2O)
+        - Perhitungan otomatis dengan breakdown detail
+        - Analisis komposisi persentase
+        - Visualisasi pie chart komposisi
+        - Penyimpanan ke riwayat dan favorit
+        """)
+        
+        # Demo calculation
+        st.code("""
+        Input: CuSO4·5H2O
+        Output: 
+        - Massa Molekul: 249.68 g/mol
+        - Komposisi: Cu(25.4%), S(12.8%), O(61.8%)
+        - Breakdown: (1×63.5) + (1×32.1) + (9×16.0) + (10×1.0)
+        """)
+    
+    with feature_tabs[1]:
+        st.markdown("""
+        #### 📊 Analisis Multi-Senyawa
+        - Perbandingan massa molekul beberapa senyawa
+        - Grafik batang interaktif
+        - Analisis statistik (min, max, rata-rata)
+        - Stacked bar chart untuk komposisi
+        - Export hasil ke CSV
+        """)
+    
+    with feature_tabs[2]:
+        st.markdown("""
+        #### 🔍 Database Unsur Kimia
+        - Informasi lengkap 118 unsur
+        - Filter berdasarkan kategori dan periode
+        - Pencarian dengan nama atau simbol
+        - Detail posisi dalam tabel periodik
+        - Visualisasi data unsur
+        """)
+    
+    with feature_tabs[3]:
+        st.markdown("""
+        #### 📈 Visualisasi Data Canggih
+        - Scatter plot massa atom vs nomor atom
+        - Pie chart distribusi kategori unsur
+        - Heatmap tabel periodik
+        - Line chart tren massa per periode
+        - Grafik interaktif dengan Plotly
+        """)
+    
+    with feature_tabs[4]:
+        st.markdown("""
+        #### ⚗️ Laboratorium Virtual
+        - Simulasi titrasi asam-basa
+        - Kalkulator pembuatan larutan
+        - Perhitungan pengenceran (C1V1=C2V2)
+        - Kurva titrasi interaktif
+        - Prosedur langkah-demi-langkah
+        """)
+    
+    # Statistics
+    st.markdown("### 📊 Statistik Aplikasi")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            label="⚛️ Unsur Tersedia",
+            value=len(ELEMENTS),
+            delta="Tabel periodik lengkap"
+        )
+    
+    with col2:
+        st.metric(
+            label="🧪 Senyawa Umum",
+            value=len(common_compounds),
+            delta="20 senyawa"
+        )
+    
+    with col3:
+        st.metric(
+            label="📚 Modul Belajar",
+            value=len(learning_modules),
+            delta="3 modul"
+        )
+    
+    with col4:
+        st.metric(
+            label="🔬 Simulasi Lab",
+            value=4,
+            delta="4 eksperimen"
+        )
+    
+    # Final animation
+    show_lottie("empty", height=200, key="final_animation")
+    
+    st.markdown("""
+    ---
+    <div style="text-align: center; color: #666;">
+        <p>🧪 Dibuat dengan ❤️ untuk kemajuan pendidikan kimia</p>
+        <p><small>© 2025 Advanced Chemistry Tools. All rights reserved.</small></p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,413 @@
+"""Halaman Analisis: perbandingan batch, rumus empiris, dan pencarian rumus dari massa."""
+import gzip
+import io
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import numpy as np
+
+from molcalc.composition import EMPIRICAL_TOLERANCE
+from molcalc.empirical import (
+    MIN_OXYGEN_PERCENT, combustion_percentages, oxygen_by_difference, read_analysis_table, solve_empirical
+)
+from molcalc.isotopes import monoisotopic_masses
+from molcalc.parallel import default_workers, evaluate_parallel
+from molcalc.reverse import ADDUCTS, DEFAULT_RANGES, find_formulas, find_formulas_batch, read_masses
+from molcalc.sources import iter_formulas
+from molcalc.streaming import DEFAULT_CHUNK_SIZE, process_stream
+
+from .common import SessionFile, dataframe, plotly_chart
+
+def render():
+    st.header("📊 Analisis Senyawa Kimia")
+    
+    # Multi-compound comparison
+    st.markdown("### 🔬 Perbandingan Multi-Senyawa")
+    
+    compounds_to_compare = st.text_area(
+        "Masukkan rumus senyawa (satu per baris):",
+        placeholder="H2O\nNaCl\nC6H12O6\nCaCO3",
+        height=100
+    )
+    
+    if st.button("📈 Analisis Perbandingan"):
+        if compounds_to_compare:
+            formulas = [f.strip() for f in compounds_to_compare.split('\n') if f.strip()]
+            
+            # Evaluasi semua rumus sekaligus; batch besar dibagi ke semua core
+            batch = evaluate_parallel(formulas)
+            for error in batch.errors:
+                if error is not None:
+                    st.error(f"Error parsing formula: {error}")
+            
+            valid = batch.valid
+            formulas_valid = np.array(batch.formulas, dtype=object)[valid]
+            counts_valid = batch.counts[valid]
+            
+            if len(formulas_valid):
+                df_comparison = pd.DataFrame({
+                    'Senyawa': formulas_valid,
+                    'Massa Molekul (g/mol)': batch.masses[valid],
+                    'Massa Monoisotopik (u)': monoisotopic_masses(batch)[valid],
+                    'Jumlah Unsur': np.count_nonzero(counts_valid, axis=1),
+                    'Total Atom': counts_valid.sum(axis=1).astype(np.int64)
+                })
+                
+                # Data komposisi format panjang untuk stacked chart
+                rows, cols = np.nonzero(counts_valid)
+                df_composition = pd.DataFrame({
+                    'Senyawa': formulas_valid[rows],
+                    'Unsur': np.array(batch.symbols, dtype=object)[cols],
+                    'Persentase': batch.percentages()[valid][rows, cols]
+                })
+                
+                # Comparison table
+                dataframe(df_comparison, use_container_width=True)
+                
+                # Molecular mass comparison chart
+                fig_bar = px.bar(
+                    df_comparison,
+                    x='Senyawa',
+                    y='Massa Molekul (g/mol)',
+                    title='Perbandingan Massa Molekul',
+                    color='Massa Molekul (g/mol)',
+                    color_continuous_scale='viridis'
+                )
+                plotly_chart(fig_bar, use_container_width=True)
+                
+                # Composition comparison if data available
+                if not df_composition.empty:
+                    # Stacked bar chart for composition
+                    fig_stacked = px.bar(
+                        df_composition,
+                        x='Senyawa',
+                        y='Persentase',
+                        color='Unsur',
+                        title='Perbandingan Komposisi Unsur (%)',
+                        text='Persentase'
+                    )
+                    fig_stacked.update_traces(texttemplate='%{text:.1f}%', textposition='inside')
+                    plotly_chart(fig_stacked, use_container_width=True)
+                
+                # Statistical analysis
+                st.markdown("### 📊 Analisis Statistik")
+                col1, col2, col3, col4 = st.columns(4)
+                
+                masses = df_comparison['Massa Molekul (g/mol)']
+                
+                with col1:
+                    st.metric("Massa Tertinggi", f"{masses.max():.2f} g/mol")
+                with col2:
+                    st.metric("Massa Terendah", f"{masses.min():.2f} g/mol")
+                with col3:
+                    st.metric("Rata-rata", f"{masses.mean():.2f} g/mol")
+                with col4:
+                    st.metric("Selisih", f"{masses.max() - masses.min():.2f} g/mol")
+    
+    # Bulk file mode: diproses per potongan, hasil ditulis langsung ke file
+    st.markdown("### 📁 Analisis File Massal")
+    st.markdown("Unggah file CSV (kolom `formula`/`rumus`/`senyawa` atau kolom pertama) "
+                "atau file teks dengan satu rumus per baris.")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        bulk_file = st.file_uploader("Pilih file rumus:", type=["csv", "txt"], key="bulk_file")
+    with col2:
+        chunk_size = st.select_slider(
+            "Ukuran potongan:",
+            options=[1000, 5000, 10000, 50000],
+            value=DEFAULT_CHUNK_SIZE
+        )
+        use_all_cores = st.checkbox(
+            f"⚙️ Multi-core ({default_workers()} core)",
+            value=default_workers() > 1,
+            help="File besar dibagi ke pool proses; file kecil tetap diproses langsung."
+        )
+    
+    if bulk_file is not None and st.button("🚀 Proses File"):
+        previous = st.session_state.pop("bulk_result", None)
+        if previous:
+            previous["file"].release()
+        
+        progress = st.progress(0.0, text="Memproses file...")
+        file_size = max(bulk_file.size, 1)
+        
+        def report_progress(summary):
+            progress.progress(
+                min(bulk_file.tell() / file_size, 1.0),
+                text=f"{summary.total:,} rumus diproses"
+            )
+        
+        # Hasil tetap di file sementara; session state hanya menyimpan path-nya
+        with tempfile.NamedTemporaryFile(suffix=".csv.gz", delete=False) as output:
+            try:
+                with gzip.open(output, "wt", compresslevel=1, newline="", encoding="utf-8") as out:
+                    lines = io.TextIOWrapper(bulk_file, encoding="utf-8", errors="replace")
+                    formulas = iter_formulas(lines, csv_format=bulk_file.name.lower().endswith(".csv"))
+                    bulk_summary = process_stream(
+                        formulas, out, chunk_size,
+                        on_chunk=report_progress,
+                        workers=default_workers() if use_all_cores else 1
+                    )
+                    lines.detach()
+            except BaseException:
+                output.close()
+                os.remove(output.name)
+                raise
+        
+        progress.progress(1.0, text=f"✅ Selesai: {bulk_summary.total:,} rumus")
+        st.session_state.bulk_result = {
+            "file": SessionFile(output.name), "summary": bulk_summary, "name": bulk_file.name
+        }
+    
+    bulk_result = st.session_state.get("bulk_result")
+    if bulk_result:
+        bulk_summary = bulk_result["summary"]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Rumus", f"{bulk_summary.total:,}")
+        with col2:
+            st.metric("Valid", f"{bulk_summary.valid:,}")
+        with col3:
+            st.metric("Gagal", f"{bulk_summary.error_count:,}")
+        with col4:
+            st.metric("Rata-rata", f"{bulk_summary.mass_mean:.2f} g/mol")
+        
+        if bulk_summary.valid:
+            st.caption(f"Massa terendah {bulk_summary.mass_min:.2f} g/mol · "
+                       f"tertinggi {bulk_summary.mass_max:.2f} g/mol")
+            
+            # Grafik hanya dari sampel reservoir dan agregat, bukan semua baris
+            df_sample = pd.DataFrame(bulk_summary.sample, columns=['Senyawa', 'Massa Molekul (g/mol)'])
+            fig_hist = px.histogram(
+                df_sample,
+                x='Massa Molekul (g/mol)',
+                nbins=50,
+                title=f'Distribusi Massa Molekul (sampel {len(df_sample):,} rumus)'
+            )
+            plotly_chart(fig_hist, use_container_width=True)
+            
+            mean_composition = sorted(bulk_summary.mean_composition().items(), key=lambda item: -item[1])
+            fig_mean = px.bar(
+                x=[symbol for symbol, _ in mean_composition],
+                y=[value for _, value in mean_composition],
+                labels={'x': 'Unsur', 'y': 'Persentase Rata-rata (%)'},
+                title='Rata-rata Komposisi Massa Unsur'
+            )
+            plotly_chart(fig_mean, use_container_width=True)
+        
+        if bulk_summary.errors:
+            with st.expander(f"⚠️ Contoh rumus gagal ({bulk_summary.error_count:,} total)"):
+                dataframe(pd.DataFrame(bulk_summary.errors, columns=['Senyawa', 'Error']),
+                             use_container_width=True)
+        
+        result_file = bulk_result["file"]
+        if not result_file.exists:
+            st.caption("✅ File hasil sudah diunduh dan dihapus dari server.")
+        elif st.button("📦 Siapkan Download Hasil", key="bulk_prepare"):
+            # Isi file dibaca hanya saat diminta dan dihapus setelah tombol download diklik
+            with result_file.open() as handle:
+                st.download_button(
+                    label="💾 Download Hasil (CSV.GZ)",
+                    data=handle,
+                    file_name=f"{os.path.splitext(bulk_result['name'])[0]}_hasil.csv.gz",
+                    mime="application/gzip",
+                    on_click=result_file.release
+                )
+    
+    # Reverse lookup: massa terukur → rumus kandidat
+    st.markdown("### 🎯 Cari Rumus dari Massa")
+    
+    element_ranges = st.text_input(
+        "Rentang unsur:", value=DEFAULT_RANGES,
+        help="Format: C0-40 H0-80 ... (Cl2 berarti 0–2 atom Cl)"
+    )
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        target_mass = st.number_input("Massa terukur (m/z):", min_value=0.0, value=180.0634, step=0.0001, format="%.4f")
+    with col2:
+        tolerance_unit = st.radio("Satuan toleransi:", ["ppm", "mDa"], horizontal=True)
+        tolerance = st.number_input("Toleransi:", min_value=0.01, value=5.0 if tolerance_unit == "ppm" else 2.0, step=0.5)
+    with col3:
+        ion_type = st.selectbox("Jenis ion:", list(ADDUCTS))
+        mass_mode = st.selectbox(
+            "Jenis massa:", ["monoisotopic", "average"],
+            format_func={"monoisotopic": "Monoisotopik", "average": "Rata-rata"}.get
+        )
+    with col4:
+        # Filter DBE opsional: butuh valensi setiap unsur, jadi bisa dimatikan untuk logam dsb.
+        use_dbe = st.checkbox(
+            "Terapkan filter DBE", value=True,
+            help="Matikan bila rentang unsur berisi unsur tanpa valensi baku (mis. Fe)."
+        )
+        dbe_range = st.slider("Rentang DBE:", -1.0, 40.0, (0.0, 40.0), step=0.5, disabled=not use_dbe)
+        integer_dbe = st.checkbox("Hanya DBE bulat", value=True, disabled=not use_dbe)
+    
+    lookup_options = dict(
+        tolerance=tolerance, unit=tolerance_unit, mode=mass_mode, ion=ion_type,
+        dbe_range=dbe_range if use_dbe else None, integer_dbe=integer_dbe and use_dbe
+    )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        run_lookup = st.button("🔎 Cari Kandidat")
+    with col2:
+        masses_file = st.file_uploader("Atau unggah daftar massa (satu per baris):", type=["csv", "txt"], key="masses_file")
+    
+    if run_lookup:
+        try:
+            candidates = find_formulas(target_mass, element_ranges, **lookup_options)
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+        else:
+            if candidates:
+                st.success(f"✅ {len(candidates):,} kandidat ditemukan")
+                dataframe(pd.DataFrame({
+                    "Rumus": [c.formula for c in candidates],
+                    "Massa (u)": [round(c.mass, 5) for c in candidates],
+                    "Galat (mDa)": [round(c.error_mda, 3) for c in candidates],
+                    "Galat (ppm)": [round(c.error_ppm, 2) for c in candidates],
+                    "DBE": [c.dbe for c in candidates]
+                }).head(500), use_container_width=True, hide_index=True)
+            else:
+                st.info("Tidak ada rumus dalam toleransi dan rentang unsur yang dipilih.")
+    
+    if masses_file is not None and st.button("🔎 Cari untuk Semua Massa"):
+        lines = io.TextIOWrapper(masses_file, encoding="utf-8", errors="replace")
+        measured = list(read_masses(lines))
+        lines.detach()
+        try:
+            results = find_formulas_batch(
+                [mass for mass, error in measured if error is None], element_ranges, **lookup_options
+            )
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+        else:
+            results = iter(results)
+            batch_rows = []
+            for mass, error in measured:
+                candidates, error = next(results) if error is None else ([], error)
+                best = candidates[0] if candidates else None
+                batch_rows.append({
+                    "Massa Terukur": mass,
+                    "Kandidat Terbaik": best.formula if best else "",
+                    "Galat (ppm)": round(best.error_ppm, 2) if best else None,
+                    "Jumlah Kandidat": len(candidates),
+                    "Kandidat Lain": ", ".join(c.formula for c in candidates[1:6]),
+                    "Error": error or ""
+                })
+            df_lookup = pd.DataFrame(batch_rows)
+            dataframe(df_lookup, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="💾 Download Hasil (CSV)",
+                data=df_lookup.to_csv(index=False),
+                file_name="kandidat_rumus.csv",
+                mime="text/csv"
+            )
+    
+    # Rumus empiris/molekul dari hasil analisis unsur
+    st.markdown("### 🧾 Rumus Empiris & Molekul")
+    
+    analysis_mode = st.radio("Data analisis:", ["Persen massa", "Analisis pembakaran"], horizontal=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        if analysis_mode == "Persen massa":
+            percent_text = st.text_input(
+                "Persen massa unsur:", value="C 40.00, H 6.71, O 53.29",
+                help="Format: simbol dan persen, dipisah koma."
+            )
+        else:
+            sample_mg = st.number_input("Massa sampel (mg):", min_value=0.001, value=5.00, step=0.1)
+            co2_mg = st.number_input("Massa CO₂ (mg):", min_value=0.0, value=7.33, step=0.1)
+            h2o_mg = st.number_input("Massa H₂O (mg):", min_value=0.0, value=3.00, step=0.1)
+            percent_text = st.text_input(
+                "Persen unsur lain (opsional):", value="",
+                help="Mis. N 12.5, S 3.1."
+            )
+    with col2:
+        known_molar_mass = st.number_input(
+            "Massa molar (g/mol, 0 = tidak diketahui):", min_value=0.0, value=180.16, step=0.01
+        )
+        empirical_tolerance = st.slider("Toleransi rasio:", 0.01, 0.3, EMPIRICAL_TOLERANCE, step=0.01)
+        # Opt-in: pada sampel tanpa oksigen, galat pengukuran akan terbaca sebagai O
+        oxygen_from_remainder = st.checkbox(
+            "Hitung O dari selisih 100%", value=False,
+            help="Aktifkan hanya bila sampel diketahui mengandung oksigen yang tidak diukur langsung."
+        )
+    
+    if st.button("🧾 Tentukan Rumus"):
+        try:
+            entries = [item.split() for item in percent_text.replace(";", ",").split(",") if item.strip()]
+            symbols = [entry[0] for entry in entries]
+            values = [float(entry[1]) for entry in entries]
+            if analysis_mode == "Analisis pembakaran":
+                carbon, hydrogen = combustion_percentages(sample_mg, co2_mg, h2o_mg)
+                symbols, values = ["C", "H"] + symbols, [float(carbon), float(hydrogen)] + values
+            if oxygen_from_remainder:
+                symbols, percentages = oxygen_by_difference(symbols, [values])
+            else:
+                percentages = np.array([values], dtype=np.float64)
+            solved = solve_empirical(
+                symbols, percentages, [known_molar_mass or np.nan], tolerance=empirical_tolerance
+            )
+        except (IndexError, ValueError) as exc:
+            st.error(f"❌ Input tidak valid: {exc}")
+        else:
+            if not solved.counts[0].any():
+                st.error(f"❌ {solved.errors[0]}")
+            else:
+                if solved.errors[0]:
+                    st.warning(f"⚠️ {solved.errors[0]}")
+                remainder = 100 - np.nansum(percentages[0])
+                if not oxygen_from_remainder and remainder >= MIN_OXYGEN_PERCENT:
+                    st.info(f"ℹ️ Sisa {remainder:.2f}% tidak dihitung. Aktifkan \"Hitung O dari selisih 100%\" "
+                            "bila sampel mengandung oksigen.")
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Rumus Empiris", solved.formulas()[0])
+                col2.metric("Massa Empiris", f"{solved.empirical_masses[0]:.3f} g/mol")
+                col3.metric("Pengali Rasio", f"×{solved.multipliers[0]}")
+                if known_molar_mass:
+                    col4.metric("Rumus Molekul", solved.formulas(molecular=True)[0])
+                dataframe(pd.DataFrame({
+                    "Unsur": symbols,
+                    "Persen (%)": np.round(percentages[0], 2),
+                    "Jumlah Atom": solved.counts[0]
+                }), use_container_width=True, hide_index=True)
+    
+    analysis_file = st.file_uploader(
+        "Atau unggah CSV analisis unsur (kolom unsur dalam %, atau sample_mg/co2_mg/h2o_mg; opsional molar_mass, name):",
+        type=["csv"], key="analysis_file"
+    )
+    if analysis_file is not None and st.button("🧾 Tentukan Rumus untuk Semua Sampel"):
+        lines = io.TextIOWrapper(analysis_file, encoding="utf-8", errors="replace")
+        try:
+            names, symbols, percentages, molar_masses = read_analysis_table(lines)
+            if oxygen_from_remainder:
+                symbols, percentages = oxygen_by_difference(symbols, percentages)
+            solved = solve_empirical(symbols, percentages, molar_masses, tolerance=empirical_tolerance)
+        except ValueError as exc:
+            st.error(f"❌ {exc}")
+        else:
+            df_empirical = pd.DataFrame({
+                "Sampel": names,
+                "Rumus Empiris": solved.formulas(),
+                "Massa Empiris": np.round(solved.empirical_masses, 3),
+                "Pengali": solved.multipliers,
+                "Simpangan": np.round(solved.deviations, 3),
+            })
+            if solved.molecular_counts is not None:
+                df_empirical["Rumus Molekul"] = solved.formulas(molecular=True)
+            df_empirical["Error"] = [error or "" for error in solved.errors]
+            dataframe(df_empirical, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="💾 Download Hasil (CSV)",
+                data=df_empirical.to_csv(index=False),
+                file_name="rumus_empiris.csv",
+                mime="text/csv"
+            )
+        finally:
+            lines.detach()
@@ -0,0 +1,270 @@
+"""Halaman Kalkulator: massa molekul, komposisi, dan pola isotop."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from st_keyup import st_keyup
+
+from molcalc import batch
+from molcalc.composition import calculate_composition, hill_order, molar_mass
+from molcalc.elements import ELEMENTS, massa_atom
+from molcalc.incremental import IncrementalParser
+from molcalc.isotopes import isotope_pattern
+from molcalc.profiling import PROFILER
+
+from .common import common_compounds, dataframe, fragment, history, parse_formula, plotly_chart, show_lottie
+
+# Karakter di kiri/kanan posisi kesalahan yang ditampilkan di pratinjau
+PREVIEW_CONTEXT = 30
+# Jeda setelah ketikan terakhir sebelum nilai input dikirim ke server (ms)
+PREVIEW_DEBOUNCE_MS = 250
+
+# Fungsi inti dicatat sebagai span saat rerun diprofilkan
+calculate_composition = PROFILER.timed("calculate_composition")(calculate_composition)
+evaluate_formulas = PROFILER.timed("evaluate_formulas")(batch.evaluate_formulas)
+
+# Input manual dan pratinjaunya berjalan sebagai fragmen. st_keyup mengirim nilainya saat
+# diketik (di-debounce PREVIEW_DEBOUNCE_MS), jadi setiap jeda ketikan hanya me-rerun bagian
+# ini, dan parser inkremental per sesi hanya memproses bagian rumus yang berubah
+@fragment("calculator.preview")
+def formula_field():
+    """Input rumus dengan pratinjau langsung massa, jumlah atom, dan posisi kesalahan"""
+    formula = st_keyup(
+        "Masukkan rumus kimia:",
+        value=st.session_state.get('quick_formula', ''),
+        placeholder="Contoh: H2O, Al2(SO4)3, CuSO4·5H2O",
+        key="manual_formula",
+        debounce=PREVIEW_DEBOUNCE_MS
+    ) or ""
+    if not formula.strip():
+        return formula
+    
+    if "formula_preview" not in st.session_state:
+        st.session_state.formula_preview = IncrementalParser()
+    preview = st.session_state.formula_preview
+    with PROFILER.span("formula_preview"):
+        result = preview.parse(formula)
+    
+    if result.ok:
+        counts = hill_order(result.elements)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Massa (pratinjau)", f"{molar_mass(counts):.4f} g/mol")
+        with col2:
+            st.metric("Total Atom", f"{sum(counts.values()):,}")
+        with col3:
+            st.metric("Jumlah Unsur", len(counts))
+        st.caption(" · ".join(f"{el}: {count:,}" for el, count in counts.items()))
+    else:
+        # Potongan rumus (sudah dinormalisasi) di sekitar kesalahan dengan penanda ^
+        start = max(result.position - PREVIEW_CONTEXT, 0)
+        prefix = "…" if start else ""
+        snippet = prefix + result.formula[start:result.position + PREVIEW_CONTEXT]
+        st.error(f"❌ {result.error} (karakter ke-{result.position + 1})")
+        st.code(f"{snippet}\n{' ' * (result.position - start + len(prefix))}^", language=None)
+    st.caption(f"⚡ Diparse ulang {preview.parsed:,} dari {len(result.formula):,} karakter")
+    return formula
+
+# Panel hasil berjalan sebagai fragmen: tombol favorit hanya me-rerun panel ini,
+# dan hasil tetap tampil selama interaksi lain di halaman
+@fragment("calculator.result")
+def result_panel(show_detailed, show_composition, show_isotopes):
+    """Tampilkan hasil perhitungan terakhir dari ``st.session_state.calculation``"""
+    history_store, history_session = history()
+    calculation = st.session_state.calculation
+    formula_input, total_mass, parsed = calculation["formula"], calculation["mass"], calculation["composition"]
+    
+    # Display results
+    st.markdown("---")
+    st.markdown("### 🎯 Hasil Perhitungan")
+    
+    # Main result card
+    st.markdown(f"""
+    <div class="success-card">
+        <h3>🧪 {formula_input}</h3>
+        <h2>Massa Molekul: {total_mass:.4f} g/mol</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Detailed breakdown
+    if show_detailed:
+        st.markdown("### 📋 Rincian Perhitungan")
+        detail_parts = []
+    
+        for element, count in parsed.items():
+            element_mass = massa_atom[element]
+            subtotal = element_mass * count
+            element_name = ELEMENTS.name_of(element)
+    
+            detail_parts.append({
+                'Unsur': f"{element} ({element_name})",
+                'Jumlah Atom': count,
+                'Massa Atom (g/mol)': f"{element_mass:.4f}",
+                'Kontribusi (g/mol)': f"{subtotal:.4f}",
+                'Formula': f"{count} × {element_mass:.4f}"
+            })
+    
+        df_detail = pd.DataFrame(detail_parts)
+        dataframe(df_detail, use_container_width=True)
+    
+        # Mathematical expression
+        math_expr = " + ".join([f"({row['Formula']})" for _, row in df_detail.iterrows()])
+        st.markdown(f"**Mr({formula_input}) = {math_expr} = {total_mass:.4f} g/mol**")
+    
+    # Composition analysis
+    if show_composition or show_isotopes:
+        chart_columns = st.columns(2) if show_composition and show_isotopes else [st.container()]
+    
+    if show_composition:
+        with chart_columns[0]:
+            st.markdown("### 🔬 Analisis Komposisi")
+            composition = calculate_composition(parsed, total_mass)
+    
+            comp_data = []
+            for element, data in composition.items():
+                element_name = ELEMENTS.name_of(element)
+                comp_data.append({
+                    'Unsur': f"{element} ({element_name})",
+                    'Massa (g/mol)': f"{data['mass']:.4f}",
+                    'Persentase (%)': f"{data['percentage']:.2f}%"
+                })
+    
+            df_comp = pd.DataFrame(comp_data)
+            dataframe(df_comp, use_container_width=True)
+    
+            # Pie chart
+            fig_pie = px.pie(
+                values=[data['percentage'] for data in composition.values()],
+                names=[f"{el} ({ELEMENTS.name_of(el)})" for el in composition.keys()],
+                title="Komposisi Massa Unsur"
+            )
+            plotly_chart(fig_pie, use_container_width=True)
+    
+    if show_isotopes:
+        with chart_columns[-1]:
+            st.markdown("### ⚛️ Pola Isotop")
+            pattern = isotope_pattern(formula_input)
+    
+            col_mono, col_top = st.columns(2)
+            with col_mono:
+                st.metric("Massa Monoisotopik", f"{pattern.monoisotopic_mass:.5f} u")
+            with col_top:
+                st.metric("Puncak Tertinggi", f"{pattern.most_abundant_mass:.4f} u")
+    
+            # Puncak di bawah 0.1% dari puncak tertinggi tidak diplot
+            shown = pattern.relative >= 0.1
+            fig_isotope = go.Figure(go.Bar(
+                x=pattern.masses[shown],
+                y=pattern.relative[shown],
+                width=0.15,
+                hovertemplate="m/z %{x:.4f}<br>%{y:.2f}%<extra></extra>"
+            ))
+            fig_isotope.update_layout(
+                title="Distribusi Isotop",
+                xaxis_title="Massa (u)",
+                yaxis_title="Kelimpahan Relatif (%)",
+                showlegend=False
+            )
+            plotly_chart(fig_isotope, use_container_width=True)
+    
+            dataframe(pd.DataFrame({
+                "Massa Nominal": pattern.nominal[shown],
+                "Massa Centroid (u)": pattern.masses[shown].round(5),
+                "Kelimpahan (%)": (pattern.abundances[shown] * 100).round(4),
+                "Relatif (%)": pattern.relative[shown].round(2)
+            }), use_container_width=True, hide_index=True)
+    
+    if calculation["saved"]:
+        st.success("✅ Hasil perhitungan disimpan ke riwayat!")
+    
+    # Add to favorites option
+    if st.button("⭐ Tambahkan ke Favorit"):
+        if history_store.add_favorite(history_session, formula_input):
+            st.success("⭐ Ditambahkan ke senyawa favorit!")
+        else:
+            st.info("ℹ️ Senyawa sudah ada di favorit!")
+
+def render():
+    history_store, history_session = history()
+    st.header("🧪 Kalkulator Massa Molekul Advanced")
+    
+    # Animation
+    show_lottie("calculator", height=200, key="calculator_animation")
+    
+    # Input form dengan tabs
+    tab1, tab2, tab3 = st.tabs(["💡 Input Manual", "🎯 Pilih Senyawa", "⚡ Input Cepat"])
+    
+    with tab1:
+        st.markdown("""
+        📌 **Petunjuk Lengkap:**
+        - Unsur: `H`, `O`, `Ca`, etc.
+        - Senyawa: `H2O`, `NaCl`, `C6H12O6`
+        - Kelompok: `Al2(SO4)3`, `Ca(OH)2`
+        - Hidrasi: `CuSO4·5H2O`, `MgSO4·7H2O`
+        - Koefisien: `2NaCl`, `3H2SO4`
+        """)
+        
+        formula_input = formula_field()
+    
+    with tab2:
+        compound_name = st.selectbox("Pilih senyawa umum:", list(common_compounds.keys()))
+        if compound_name:
+            formula_input = common_compounds[compound_name]
+            st.info(f"Formula: **{formula_input}**")
+    
+    with tab3:
+        col1, col2 = st.columns(2)
+        with col1:
+            elements_list = list(massa_atom.keys())
+            element1 = st.selectbox("Unsur 1:", [""] + elements_list)
+            count1 = st.number_input("Jumlah 1:", min_value=0, value=1)
+        
+        with col2:
+            element2 = st.selectbox("Unsur 2:", [""] + elements_list)
+            count2 = st.number_input("Jumlah 2:", min_value=0, value=0)
+        
+        if element1:
+            formula_parts = []
+            if count1 > 0:
+                formula_parts.append(f"{element1}{count1 if count1 > 1 else ''}")
+            if element2 and count2 > 0:
+                formula_parts.append(f"{element2}{count2 if count2 > 1 else ''}")
+            formula_input = "".join(formula_parts)
+            if formula_input:
+                st.info(f"Formula: **{formula_input}**")
+    
+    # Calculation options
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        show_detailed = st.checkbox("📝 Tampilkan Detail", value=True)
+    with col2:
+        show_composition = st.checkbox("📊 Hitung Komposisi", value=True)
+    with col3:
+        show_isotopes = st.checkbox("⚛️ Pola Isotop", value=True)
+    with col4:
+        save_calculation = st.checkbox("💾 Simpan Hasil", value=True)
+    
+    # Calculate button: hasil disimpan di session state dan ditampilkan oleh fragmen
+    if st.button("🔬 Hitung Massa Molekul", type="primary"):
+        if formula_input:
+            parsed = parse_formula(formula_input)
+            
+            if parsed:
+                # Calculate molecular mass
+                total_mass = float(evaluate_formulas([formula_input]).masses[0])
+                st.session_state.calculation = {
+                    "formula": formula_input, "mass": total_mass, "composition": parsed, "saved": save_calculation
+                }
+                
+                # Save to history
+                if save_calculation:
+                    history_store.append(history_session, formula_input, total_mass, parsed)
+            
+            else:
+                st.session_state.pop("calculation", None)
+                st.error("❌ Gagal menganalisis formula. Periksa format penulisan!")
+        else:
+            st.warning("⚠️ Silakan masukkan rumus kimia terlebih dahulu!")
+    
+    if "calculation" in st.session_state:
+        result_panel(show_detailed, show_composition, show_isotopes)
@@ -0,0 +1,138 @@
+"""Bantuan bersama halaman: animasi Lottie, riwayat, dan parsing rumus.
+
+Modul ini sengaja ringan (tanpa Plotly/Pandas/NumPy) karena sidebar memakainya
+di setiap rerun.
+"""
+import os
+import weakref
+from contextlib import suppress
+from functools import wraps
+
+import streamlit as st
+
+from lottie_assets import LottieCache
+from molcalc import parser as formula_parser
+from molcalc.history import HistoryStore
+from molcalc.profiling import PROFILER
+
+# Predefined compounds database
+common_compounds = {
+    "Air": "H2O",
+    "Garam Dapur": "NaCl",
+    "Gula": "C12H22O11",
+    "Asam Sulfat": "H2SO4",
+    "Amonia": "NH3",
+    "Metana": "CH4",
+    "Etanol": "C2H5OH",
+    "Asam Asetat": "CH3COOH",
+    "Kalsium Karbonat": "CaCO3",
+    "Sodium Bikarbonat": "NaHCO3",
+    "Aluminium Sulfat": "Al2(SO4)3",
+    "Tembaga Sulfat Pentahidrat": "CuSO4·5H2O",
+    "Magnesium Sulfat Heptahidrat": "MgSO4·7H2O",
+    "Asam Klorida": "HCl",
+    "Natrium Hidroksida": "NaOH",
+    "Kalsium Klorida": "CaCl2",
+    "Kalium Permanganat": "KMnO4",
+    "Besi(III) Oksida": "Fe2O3",
+    "Karbon Dioksida": "CO2",
+    "Nitrogen Dioksida": "NO2"
+}
+
+# Grafik dan tabel diukur di tempat pemanggilan (bukan dengan menambal modul streamlit)
+plotly_chart = PROFILER.timed("st.plotly_chart")(st.plotly_chart)
+dataframe = PROFILER.timed("st.dataframe")(st.dataframe)
+
+# Cache animasi Lottie: dibuat sekali per proses server dan langsung prefetch di latar
+@st.cache_resource
+def get_lottie_cache():
+    cache = LottieCache()
+    cache.prefetch()
+    return cache
+
+def load_lottie(name: str):
+    """Ambil animasi dari cache tanpa menunggu jaringan"""
+    return get_lottie_cache().get(name)
+
+def show_lottie(name: str, height: int, key: str):
+    """Tampilkan animasi bila tersedia; komponen streamlit_lottie baru diimpor saat dibutuhkan"""
+    animation = load_lottie(name)
+    if animation:
+        from streamlit_lottie import st_lottie
+        st_lottie(animation, height=height, key=key)
+
+def fragment(name: str):
+    """``st.experimental_fragment`` yang ikut diprofilkan.
+
+    Saat skrip berjalan penuh, fragmen menjadi span biasa; rerun fragmen saja
+    (interaksi di dalamnya) dicatat sebagai rerun tersendiri berlabel ``fragment:<nama>``.
+    """
+    def decorate(func):
+        @wraps(func)
+        def body(*args, **kwargs):
+            if PROFILER.active:
+                with PROFILER.span(f"fragment:{name}"):
+                    return func(*args, **kwargs)
+            PROFILER.begin_run(
+                f"fragment:{name}", st.session_state.get("profiling", False),
+                session=st.session_state.get("history_session")
+            )
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.end_run()
+        return st.experimental_fragment(body)
+    return decorate
+
+def take_file(path: str) -> bytes:
+    """Baca isi file sementara lalu hapus filenya (juga saat pembacaan gagal)"""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read()
+    finally:
+        os.remove(path)
+
+def _remove_file(path: str):
+    with suppress(FileNotFoundError):
+        os.remove(path)
+
+class SessionFile:
+    """File sementara milik satu sesi, disimpan di session state sebagai path saja.
+
+    File dihapus saat ``release()`` dipanggil atau saat objek ini ikut dibuang
+    bersama session state (sesi ditutup), jadi isinya tidak pernah ditahan di memori.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+
+    @property
+    def exists(self) -> bool:
+        return self._finalizer.alive and os.path.exists(self.path)
+
+    def open(self):
+        return open(self.path, "rb")
+
+    def release(self):
+        """Hapus filenya sekarang (aman dipanggil berulang)"""
+        self._finalizer()
+
+# Riwayat dan favorit disimpan di SQLite, dipakai bersama oleh semua sesi
+@st.cache_resource
+def get_history_store():
+    return HistoryStore()
+
+def history():
+    """(penyimpanan riwayat, ID sesi riwayat) untuk sesi ini"""
+    return get_history_store(), st.session_state.history_session
+
+# Fungsi parsing rumus kimia (mesin parsing ada di molcalc.parser)
+@PROFILER.timed("parse_formula")
+def parse_formula(formula):
+    """Parse rumus kimia dengan dukungan untuk berbagai format"""
+    result = formula_parser.parse_formula(formula)
+    if not result.ok:
+        st.error(f"Error parsing formula: {result.error}")
+        return None
+    return dict(result.elements)
@@ -0,0 +1,58 @@
+"""Halaman Dashboard: ringkasan riwayat dan statistik unsur."""
+import streamlit as st
+
+from molcalc.elements import ELEMENTS
+
+from .common import history, show_lottie
+
+def render():
+    history_store, history_session = history()
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Total Perhitungan", history_store.count(history_session))
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Senyawa Favorit", history_store.favorite_count(history_session))
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Database Unsur", len(ELEMENTS))
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Dashboard animations
+    show_lottie("dashboard", height=300, key="dashboard_main")
+    
+    st.markdown("### 🚀 Fitur Unggulan")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        **🧮 Kalkulator Canggih:**
+        - Parsing formula otomatis
+        - Dukungan senyawa hidrasi
+        - Perhitungan komposisi
+        - Analisis massa molekul
+        """)
+    
+    with col2:
+        st.markdown("""
+        **📊 Analisis Mendalam:**
+        - Visualisasi komposisi
+        - Grafik interaktif
+        - Perbandingan senyawa
+        - Export data
+        """)
+    
+    # Recent calculations
+    recent = history_store.recent(history_session, 5)
+    if recent:
+        st.markdown("### 📈 Perhitungan Terakhir")
+        for calc in recent:
+            with st.expander(f"{calc.formula} - {calc.mass:.2f} g/mol"):
+                st.write(f"**Waktu:** {calc.timestamp}")
+                st.write(f"**Komposisi:** {calc.composition}")
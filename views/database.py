@@ -0,0 +1,139 @@
+"""Halaman Database: pencarian dan filter tabel unsur."""
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+
+from molcalc.elements import ELEMENTS
+from molcalc.search import element_index
+
+from .common import dataframe, fragment, plotly_chart
+
+# Hasil filter halaman Database di-cache per (kata kunci, kategori, periode, versi tabel)
+@st.cache_data(show_spinner=False, max_entries=512)
+def filter_elements(search_term: str, category_filter: str, period_filter, version: str):
+    """Kembalikan (DataFrame unsur, apakah hasil dari pencocokan fuzzy)"""
+    rows = range(len(ELEMENTS))
+    if category_filter != "Semua":
+        rows = ELEMENTS.by_category[category_filter]
+    if period_filter != "Semua":
+        in_period = set(ELEMENTS.by_period[period_filter])
+        rows = [row for row in rows if row in in_period]
+
+    fuzzy = False
+    if search_term:
+        allowed = set(rows)
+        index = element_index()
+        rows = [row for row, _ in index.search(search_term) if row in allowed]
+        if not rows:
+            rows = [row for row in index.suggest(search_term) if row in allowed]
+            fuzzy = bool(rows)
+
+    columns = ELEMENTS.columns(rows)
+    df_elements = pd.DataFrame({
+        "Simbol": columns["symbol"],
+        "Nama": columns["name"],
+        "Nomor Atom": columns["number"],
+        "Massa Atom": columns["mass"],
+        "Golongan": pd.array(columns["group"], dtype="Int64"),
+        "Periode": columns["period"],
+        "Kategori": columns["category"],
+        "Elektronegativitas": columns["electronegativity"],
+        "Jari-jari Atom (pm)": columns["atomic_radius"],
+        "Jari-jari Kovalen (pm)": columns["covalent_radius"]
+    })
+    return df_elements, fuzzy
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def element_position_figure(symbol: str, version: str):
+    """Grafik posisi unsur dalam tabel periodik"""
+    element_info = ELEMENTS.row(symbol)
+    fig_element = go.Figure()
+    fig_element.add_trace(go.Scatter(
+        # Lantanida/aktinida ditempatkan di sel golongan 3
+        x=[element_info['group'] or 3],
+        y=[element_info['period']],
+        mode='markers+text',
+        marker=dict(size=50, color='blue'),
+        text=[symbol],
+        textposition='middle center',
+        name=element_info['name']
+    ))
+    fig_element.update_layout(
+        title=f"Posisi {element_info['name']} dalam Tabel Periodik",
+        xaxis_title="Golongan",
+        yaxis_title="Periode",
+        showlegend=False
+    )
+    return fig_element
+
+# Detail unsur berjalan sebagai fragmen: memilih unsur lain tidak merender ulang
+# filter dan tabel unsur
+@fragment("database.detail")
+def element_detail(symbols):
+    """Kartu data, isotop, dan posisi tabel periodik untuk unsur yang dipilih"""
+    st.markdown("### 🔬 Detail Unsur")
+    selected_element = st.selectbox("Pilih unsur untuk detail:", symbols)
+    
+    if selected_element:
+        element_info = ELEMENTS.row(selected_element)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            **🧪 {element_info['name']} ({selected_element})**
+            - **Nomor Atom:** {element_info['number']}
+            - **Massa Atom:** {element_info['mass']} u
+            - **Golongan:** {element_info['group'] or '-'}
+            - **Periode:** {element_info['period']}
+            - **Kategori:** {element_info['category']}
+            - **Elektronegativitas:** {element_info['electronegativity'] or '-'}
+            - **Jari-jari Kovalen:** {element_info['covalent_radius'] or '-'} pm
+            """)
+            isotopes = ELEMENTS.isotopes(selected_element)
+            if isotopes:
+                st.markdown("**Isotop:** " + ", ".join(
+                    f"{selected_element}-{iso.mass_number} ({iso.abundance * 100:.4g}%)"
+                    for iso in isotopes
+                ))
+        
+        with col2:
+            plotly_chart(
+                element_position_figure(selected_element, ELEMENTS.version),
+                use_container_width=True
+            )
+
+def render():
+    st.header("🔍 Database Unsur Kimia")
+    
+    # Search and filter options
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        search_term = st.text_input("🔍 Cari unsur:", placeholder="Nama atau simbol unsur")
+    
+    with col2:
+        category_filter = st.selectbox(
+            "📂 Filter kategori:",
+            ["Semua"] + list(ELEMENTS.categories)
+        )
+    
+    with col3:
+        period_filter = st.selectbox(
+            "🔢 Filter periode:",
+            ["Semua"] + list(ELEMENTS.periods)
+        )
+    
+    df_elements, fuzzy_match = filter_elements(
+        search_term.strip().lower(), category_filter, period_filter, ELEMENTS.version
+    )
+    
+    if len(df_elements):
+        if fuzzy_match:
+            st.info(f"Tidak ada yang cocok persis dengan '{search_term}'. Mungkin maksud Anda:")
+        dataframe(df_elements, use_container_width=True)
+        
+        element_detail(df_elements["Simbol"].tolist())
+    
+    else:
+        st.info("Tidak ada unsur yang sesuai dengan filter yang dipilih.")
@@ -0,0 +1,163 @@
+"""Halaman Riwayat: daftar berhalaman, favorit, dan ekspor riwayat."""
+import io
+import math
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+
+from molcalc.elements import ELEMENTS
+from molcalc.export import FORMATS as EXPORT_FORMATS, collect_elements, export_history
+
+from .common import dataframe, fragment, history, show_lottie, take_file
+
+# Daftar riwayat berjalan sebagai fragmen: filter, paginasi, dan tombol per entri
+# hanya me-rerun bagian ini, bukan sidebar dan seluruh halaman
+@fragment("history.entries")
+def history_entries(total_history):
+    """Filter, tabel satu halaman riwayat, dan detail perhitungan yang dipilih"""
+    history_store, history_session = history()
+    # Filter dan paginasi dijalankan di database; hanya satu halaman yang dimuat
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        formula_filter = st.text_input("🔍 Filter rumus:", placeholder="Contoh: H2O").strip() or None
+    with col2:
+        page_size = st.selectbox("Baris per halaman:", [10, 25, 50, 100])
+    with col3:
+        if st.button("🗑️ Hapus Semua Riwayat"):
+            history_store.clear(history_session)
+            st.success("Riwayat berhasil dihapus!")
+            st.experimental_rerun()
+    
+    matched = history_store.count(history_session, formula_filter) if formula_filter else total_history
+    page_count = max(1, math.ceil(matched / page_size))
+    page_number = st.number_input(
+        f"Halaman (dari {page_count}):", min_value=1, max_value=page_count, value=1, step=1,
+        key=f"history_page_{formula_filter}_{page_size}_{page_count}"
+    )
+    entries = history_store.page(history_session, page_size, (page_number - 1) * page_size, formula_filter)
+    
+    if entries:
+        # Nomor urut: perhitungan terbaru bernomor terbesar
+        first_number = matched - (page_number - 1) * page_size
+        numbers = range(first_number, first_number - len(entries), -1)
+        dataframe(pd.DataFrame({
+            "No": numbers,
+            "Formula": [calc.formula for calc in entries],
+            "Massa Molekul (g/mol)": [round(calc.mass, 4) for calc in entries],
+            "Jumlah Unsur": [len(calc.composition) for calc in entries],
+            "Total Atom": [sum(calc.composition.values()) for calc in entries],
+            "Waktu": [calc.timestamp for calc in entries]
+        }), use_container_width=True, hide_index=True)
+        
+        # Detail hanya dirender untuk satu perhitungan yang dipilih
+        labels = {
+            calc.id: f"#{number}: {calc.formula} - {calc.mass:.4f} g/mol"
+            for number, calc in zip(numbers, entries)
+        }
+        selected_id = st.selectbox(
+            "🔎 Lihat detail perhitungan:", list(labels), index=None,
+            format_func=labels.get, placeholder="Pilih perhitungan di halaman ini"
+        )
+        
+        if selected_id is not None:
+            calc = next(entry for entry in entries if entry.id == selected_id)
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown(f"""
+                **Formula:** {calc.formula}  
+                **Massa Molekul:** {calc.mass:.4f} g/mol  
+                **Waktu:** {calc.timestamp}
+                """)
+            
+            with col2:
+                st.markdown("**Komposisi:**")
+                dataframe(pd.DataFrame({
+                    "Unsur": [f"{el} ({ELEMENTS.name_of(el, el)})" for el in calc.composition],
+                    "Jumlah Atom": list(calc.composition.values())
+                }), use_container_width=True, hide_index=True)
+            
+            # Option to recalculate or add to favorites
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("🔄 Hitung Ulang", key="recalc_selected"):
+                    st.session_state.quick_formula = calc.formula
+                    st.session_state.menu = "🧪 Kalkulator"
+                    st.experimental_rerun()
+            
+            with col2:
+                if st.button("⭐ Tambah ke Favorit", key="fav_selected"):
+                    if history_store.add_favorite(history_session, calc.formula):
+                        st.success("Ditambahkan ke favorit!")
+    else:
+        st.info("Tidak ada perhitungan yang sesuai dengan filter.")
+
+def render():
+    history_store, history_session = history()
+    st.header("📋 Riwayat Perhitungan")
+    
+    total_history = history_store.count(history_session)
+    if total_history:
+        st.markdown(f"### 📊 Total Perhitungan: {total_history}")
+        
+        history_entries(total_history)
+        
+        # Export functionality: riwayat ditulis per batch ke file sementara
+        st.markdown("### 📤 Export Riwayat")
+        col1, col2 = st.columns(2)
+        with col1:
+            export_format = st.selectbox(
+                "Format:", list(EXPORT_FORMATS), format_func=lambda fmt: EXPORT_FORMATS[fmt]["label"]
+            )
+        with col2:
+            export_layout = st.radio(
+                "Komposisi:", ["wide", "long"], horizontal=True,
+                format_func={"wide": "Satu kolom per unsur", "long": "Satu baris per unsur"}.get
+            )
+        
+        if st.button("📤 Export Riwayat"):
+            st.session_state.pop("history_export", None)
+            
+            export_info = EXPORT_FORMATS[export_format]
+            elements = ()
+            if export_layout == "wide":
+                elements = collect_elements(history_store.iter_batches(history_session))
+            # File sementara hanya hidup selama export; isinya dipindah ke session state
+            with tempfile.NamedTemporaryFile(suffix=export_info["extension"], delete=False) as output:
+                try:
+                    if export_format == "csv":
+                        out = io.TextIOWrapper(output, encoding="utf-8", newline="")
+                        exported_rows = export_history(
+                            history_store.iter_batches(history_session), out, export_format, export_layout, elements
+                        )
+                        out.detach()
+                    else:
+                        exported_rows = export_history(
+                            history_store.iter_batches(history_session), output, export_format, export_layout, elements
+                        )
+                except BaseException:
+                    output.close()
+                    os.remove(output.name)
+                    raise
+            st.session_state.history_export = {
+                "data": take_file(output.name), "format": export_format, "rows": exported_rows
+            }
+        
+        history_export = st.session_state.get("history_export")
+        if history_export:
+            export_info = EXPORT_FORMATS[history_export["format"]]
+            st.caption(f"{history_export['rows']:,} baris · {len(history_export['data']) / 1024:.1f} KB")
+            st.download_button(
+                label=f"💾 Download {export_info['label']}",
+                data=history_export["data"],
+                file_name=f"calculation_history{export_info['extension']}",
+                mime=export_info["mime"]
+            )
+    
+    else:
+        st.info("Belum ada riwayat perhitungan. Mulai dengan menggunakan kalkulator!")
+        
+        # Animation for empty state
+        show_lottie("empty", height=200, key="empty_history")
@@ -0,0 +1,395 @@
+"""Halaman Laboratorium: titrasi, pembuatan larutan, dan stoikiometri reaksi."""
+import io
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import numpy as np
+
+from molcalc import batch
+from molcalc.equations import balance_equation, balance_equations
+from molcalc.profiling import PROFILER
+from molcalc.stoichiometry import UNITS as STOICHIOMETRY_UNITS, factors_for_product, scale_up, solve_stoichiometry, to_moles
+from molcalc.titration import ACIDS_BASES, titration_curve
+from molcalc.uncertainty import dilution_model, propagate, solid_solution_model
+
+from .common import dataframe, parse_formula, plotly_chart
+
+# Fungsi inti dicatat sebagai span (dan counter panggilan) saat rerun diprofilkan
+balance_equation = PROFILER.timed("balance_equation")(balance_equation)
+evaluate_formulas = PROFILER.timed("evaluate_formulas")(batch.evaluate_formulas)
+
+def show_uncertainty(result):
+    """Tampilkan hasil ``propagate``: selang kepercayaan, histogram, dan peringkat sensitivitas"""
+    st.markdown("### 📏 Ketidakpastian Konsentrasi")
+    low, high = result.interval
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Konsentrasi (M)", f"{result.value:.5f}")
+    with col2:
+        st.metric("u Monte Carlo (M)", f"{result.standard_uncertainty:.2e}")
+    with col3:
+        st.metric("u Linear (M)", f"{result.linear_uncertainty:.2e}")
+    with col4:
+        st.metric(f"Selang {result.coverage:.0%}", f"{low:.5f} – {high:.5f}")
+    
+    counts, edges = result.histogram
+    fig_mc = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, marker_color='#667eea'))
+    fig_mc.add_vline(x=low, line_dash="dash", line_color="red")
+    fig_mc.add_vline(x=high, line_dash="dash", line_color="red")
+    fig_mc.update_layout(
+        title=f'Distribusi Monte Carlo ({result.samples:,} sampel)',
+        xaxis_title='Konsentrasi (M)', yaxis_title='Frekuensi', bargap=0
+    )
+    plotly_chart(fig_mc, use_container_width=True)
+    
+    st.markdown("**Peringkat Sensitivitas**")
+    dataframe(pd.DataFrame({
+        "Masukan": [c.name for c in result.contributions],
+        "u Standar": [c.standard_uncertainty for c in result.contributions],
+        "Koefisien Sensitivitas": [c.sensitivity for c in result.contributions],
+        "Kontribusi (%)": [round(c.share * 100, 2) for c in result.contributions]
+    }), use_container_width=True, hide_index=True)
+
+def render():
+    st.header("⚗️ Laboratorium Virtual")
+    
+    # Virtual lab simulations
+    lab_type = st.selectbox(
+        "Pilih simulasi laboratorium:",
+        ["Titrasi Asam-Basa", "Pembuatan Larutan", "Analisis Kualitatif", "Reaksi Stoikiometri"]
+    )
+    
+    if lab_type == "Titrasi Asam-Basa":
+        st.markdown("### 🧪 Simulasi Titrasi Asam-Basa")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**Analit**")
+            analyte_kind = st.radio("Jenis analit:", ["acid", "base"], horizontal=True,
+                                    format_func={"acid": "Asam", "base": "Basa"}.get)
+            analyte_formula = st.selectbox(
+                "Pilih analit:", [entry.formula for entry in ACIDS_BASES.of_kind(analyte_kind)],
+                format_func=lambda formula: f"{formula} ({ACIDS_BASES.lookup(formula).name})"
+            )
+            analyte_concentration = st.number_input("Konsentrasi analit (M):", min_value=0.001, max_value=2.0, value=0.1)
+            analyte_volume = st.number_input("Volume analit (mL):", min_value=1.0, max_value=100.0, value=25.0)
+        
+        with col2:
+            st.markdown("**Titran**")
+            titrant_kind = "base" if analyte_kind == "acid" else "acid"
+            titrant_formula = st.selectbox(
+                "Pilih titran:", [entry.formula for entry in ACIDS_BASES.of_kind(titrant_kind)],
+                format_func=lambda formula: f"{formula} ({ACIDS_BASES.lookup(formula).name})"
+            )
+            titrant_concentration = st.number_input("Konsentrasi titran (M):", min_value=0.001, max_value=2.0, value=0.1)
+        
+        if st.button("🔬 Hitung Titrasi"):
+            analyte = ACIDS_BASES.lookup(analyte_formula)
+            titrant = ACIDS_BASES.lookup(titrant_formula)
+            curve = titration_curve(analyte, analyte_concentration, analyte_volume, titrant, titrant_concentration)
+            analyte_moles = analyte_concentration * analyte_volume / 1000
+            
+            # Results
+            st.markdown("### 📊 Hasil Titrasi")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Mol Analit", f"{analyte_moles:.4f}")
+            with col2:
+                st.metric("pH Awal", f"{curve.ph[0]:.2f}")
+            if curve.equivalence_volumes:
+                with col3:
+                    st.metric("Volume Ekuivalen (mL)", f"{curve.equivalence_volumes[-1]:.2f}")
+                with col4:
+                    st.metric("pH Ekuivalen", f"{curve.equivalence_ph[-1]:.2f}")
+            
+            fig_titration = go.Figure()
+            fig_titration.add_trace(go.Scattergl(
+                x=curve.volumes,
+                y=curve.ph,
+                mode='lines',
+                name='Kurva Titrasi',
+                line=dict(color='blue', width=3)
+            ))
+            
+            # Mark equivalence points
+            fig_titration.add_trace(go.Scattergl(
+                x=curve.equivalence_volumes,
+                y=curve.equivalence_ph,
+                mode='markers',
+                name='Titik Ekuivalen',
+                marker=dict(color='red', size=10)
+            ))
+            
+            fig_titration.update_layout(
+                title=f'Kurva Titrasi {analyte.formula} dengan {titrant.formula}',
+                xaxis_title=f'Volume {titrant.formula} (mL)',
+                yaxis_title='pH',
+                yaxis=dict(range=[0, 14])
+            )
+            
+            plotly_chart(fig_titration, use_container_width=True)
+            
+            if curve.equivalence_volumes:
+                dataframe(pd.DataFrame({
+                    "Titik Ekuivalen": range(1, len(curve.equivalence_volumes) + 1),
+                    "Volume Titran (mL)": np.round(curve.equivalence_volumes, 2),
+                    "pH": np.round(curve.equivalence_ph, 2)
+                }), use_container_width=True, hide_index=True)
+            st.caption(f"{len(curve.volumes):,} titik, dirapatkan otomatis di sekitar titik ekuivalen.")
+    
+    elif lab_type == "Pembuatan Larutan":
+        st.markdown("### ⚗️ Kalkulator Pembuatan Larutan")
+        
+        solution_type = st.radio("Jenis larutan:", ["Dari padatan", "Pengenceran larutan"])
+        
+        if solution_type == "Dari padatan":
+            compound = st.text_input("Rumus senyawa:", placeholder="NaCl, H2SO4, etc.")
+            target_concentration = st.number_input("Konsentrasi target (M):", min_value=0.001, value=0.1)
+            target_volume = st.number_input("Volume target (L):", min_value=0.001, value=0.1)
+            
+            with st.expander("📏 Ketidakpastian (QA)"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    balance_uncertainty = st.number_input("u timbangan (g):", min_value=0.0, value=0.0001, format="%.5f")
+                    flask_tolerance = st.number_input("Toleransi labu ukur (± mL):", min_value=0.0, value=0.08, format="%.3f")
+                with col2:
+                    purity = st.number_input("Kemurnian (%):", min_value=0.1, max_value=100.0, value=100.0)
+                    purity_tolerance = st.number_input("Toleransi kemurnian (± %):", min_value=0.0, value=0.0)
+                with col3:
+                    mc_samples = st.select_slider("Sampel Monte Carlo:", [10_000, 100_000, 1_000_000], value=1_000_000)
+                    mc_coverage = st.select_slider("Tingkat kepercayaan:", [0.90, 0.95, 0.99], value=0.95)
+            
+            if compound and st.button("📊 Hitung Massa"):
+                parsed = parse_formula(compound)
+                if parsed:
+                    mr = float(evaluate_formulas([compound]).masses[0])
+                    
+                    # Calculate required mass (dikoreksi kemurnian)
+                    moles_needed = target_concentration * target_volume
+                    mass_needed = moles_needed * mr / (purity / 100)
+                    
+                    st.markdown("### 📋 Hasil Perhitungan")
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.metric("Massa Molekul", f"{mr:.2f} g/mol")
+                    with col2:
+                        st.metric("Mol Dibutuhkan", f"{moles_needed:.4f} mol")
+                    with col3:
+                        st.metric("Massa Dibutuhkan", f"{mass_needed:.4f} g")
+                    
+                    st.markdown(f"""
+                    ### 🧪 Prosedur Pembuatan:
+                    1. Timbang **{mass_needed:.4f} g** {compound}
+                    2. Larutkan dalam sedikit air suling
+                    3. Pindahkan ke labu ukur {target_volume*1000:.0f} mL
+                    4. Encerkan dengan air suling hingga tanda batas
+                    5. Homogenkan larutan
+                    """)
+                    
+                    model, inputs = solid_solution_model(
+                        parsed, mass_needed, balance_uncertainty, target_volume * 1000, flask_tolerance,
+                        purity, purity_tolerance
+                    )
+                    show_uncertainty(propagate(model, inputs, mc_samples, mc_coverage))
+        
+        else:  # Pengenceran
+            initial_concentration = st.number_input("Konsentrasi awal (M):", min_value=0.001, value=1.0)
+            final_concentration = st.number_input("Konsentrasi akhir (M):", min_value=0.001, value=0.1)
+            final_volume = st.number_input("Volume akhir (mL):", min_value=1.0, value=100.0)
+            
+            with st.expander("📏 Ketidakpastian (QA)"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    stock_uncertainty = st.number_input("u konsentrasi awal (M):", min_value=0.0, value=0.002, format="%.4f")
+                    pipette_tolerance = st.number_input("Toleransi pipet/buret (± mL):", min_value=0.0, value=0.03, format="%.3f")
+                with col2:
+                    flask_tolerance = st.number_input("Toleransi labu ukur (± mL):", min_value=0.0, value=0.08, format="%.3f")
+                with col3:
+                    mc_samples = st.select_slider("Sampel Monte Carlo:", [10_000, 100_000, 1_000_000], value=1_000_000)
+                    mc_coverage = st.select_slider("Tingkat kepercayaan:", [0.90, 0.95, 0.99], value=0.95)
+            
+            if st.button("📊 Hitung Pengenceran"):
+                # Using C1V1 = C2V2
+                initial_volume = (final_concentration * final_volume) / initial_concentration
+                water_needed = final_volume - initial_volume
+                
+                st.markdown("### 📋 Hasil Perhitungan")
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric("Volume Awal", f"{initial_volume:.2f} mL")
+                with col2:
+                    st.metric("Air Dibutuhkan", f"{water_needed:.2f} mL")
+                with col3:
+                    st.metric("Faktor Pengenceran", f"{initial_concentration/final_concentration:.1f}x")
+                
+                st.markdown(f"""
+                ### 🧪 Prosedur Pengenceran:
+                1. Pipet **{initial_volume:.2f} mL** larutan awal
+                2. Masukkan ke dalam labu ukur {final_volume:.0f} mL
+                3. Tambahkan air suling hingga tanda batas
+                4. Homogenkan larutan
+                """)
+                
+                model, inputs = dilution_model(
+                    initial_concentration, stock_uncertainty, initial_volume, pipette_tolerance,
+                    final_volume, flask_tolerance
+                )
+                show_uncertainty(propagate(model, inputs, mc_samples, mc_coverage))
+    
+    elif lab_type == "Reaksi Stoikiometri":
+        st.markdown("### ⚖️ Penyetaraan Persamaan Reaksi")
+        
+        equation = st.text_input(
+            "Persamaan reaksi:", value="KMnO4 + HCl -> KCl + MnCl2 + H2O + Cl2",
+            help="Pisahkan spesies dengan ' + ' dan sisi dengan '->'. Ion: Fe^3+, SO4^2-, NH4+; elektron: e-"
+        )
+        
+        # Penyetaraan memakai cache ruang nol, cukup murah untuk setiap rerun
+        balanced = balance_equation(equation) if equation else None
+        if balanced is not None and not balanced.ok:
+            st.error(f"❌ {balanced.error}")
+            if balanced.basis:
+                st.markdown("Kombinasi koefisien independen (setiap baris adalah reaksi setara tersendiri):")
+                dataframe(pd.DataFrame(
+                    list(balanced.basis), columns=[species.label for species in balanced.species]
+                ), use_container_width=True, hide_index=True)
+        elif balanced is not None:
+            st.success(f"✅ {balanced.balanced}")
+            species_rows = []
+            for coefficient, species in zip(balanced.coefficients, balanced.species):
+                species_rows.append({
+                    "Spesies": species.label,
+                    "Peran": "Reaktan" if len(species_rows) < len(balanced.reactants) else "Produk",
+                    "Koefisien": coefficient,
+                    "Muatan": species.charge,
+                    "Massa Molar (g/mol)": round(species.mass, 3),
+                    "Massa (g)": round(coefficient * species.mass, 3)
+                })
+            df_species = pd.DataFrame(species_rows)
+            dataframe(df_species, use_container_width=True, hide_index=True)
+            
+            reactant_mass = df_species.loc[df_species["Peran"] == "Reaktan", "Massa (g)"].sum()
+            product_mass = df_species.loc[df_species["Peran"] == "Produk", "Massa (g)"].sum()
+            col1, col2 = st.columns(2)
+            col1.metric("Massa Reaktan", f"{reactant_mass:.3f} g")
+            col2.metric("Massa Produk", f"{product_mass:.3f} g")
+            
+            # Pereaksi pembatas dan rendemen
+            st.markdown("### 🧮 Pereaksi Pembatas & Rendemen")
+            st.caption("Jumlah 0 berarti pereaksi berlebih (tidak diukur).")
+            supplied = []
+            try:
+                for index, species in enumerate(balanced.reactants):
+                    col1, col2, col3 = st.columns([2, 1, 1])
+                    with col1:
+                        amount = st.number_input(
+                            f"Jumlah {species.label}:", min_value=0.0, value=10.0 if index == 0 else 0.0,
+                            key=f"reagent_amount_{index}_{species.label}"
+                        )
+                    with col2:
+                        unit = st.selectbox(
+                            "Satuan:", list(STOICHIOMETRY_UNITS), key=f"reagent_unit_{index}_{species.label}"
+                        )
+                    with col3:
+                        molarity = st.number_input(
+                            "Molaritas (M):", min_value=0.0, value=0.1, key=f"reagent_molarity_{index}_{species.label}",
+                            disabled=STOICHIOMETRY_UNITS[unit][0] != "volume"
+                        )
+                    supplied.append(float(to_moles(amount, unit, species.mass, molarity)) if amount else np.nan)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    product_index = st.selectbox(
+                        "Produk utama:", range(len(balanced.products)),
+                        format_func=lambda i: balanced.products[i].label
+                    )
+                with col2:
+                    actual_mass = st.number_input("Massa produk aktual (g, 0 = belum ada):", min_value=0.0, value=0.0)
+                
+                table = solve_stoichiometry(balanced, supplied)
+            except ValueError as exc:
+                st.error(f"❌ {exc}")
+                table = None
+            
+            if table is not None and table.limiting[0] < 0:
+                st.info("Isi jumlah minimal satu reaktan untuk menentukan pereaksi pembatas.")
+            elif table is not None:
+                col1, col2, col3, col4 = st.columns(4)
+                col1.metric("Pereaksi Pembatas", table.limiting_labels()[0])
+                col2.metric("Luas Reaksi", f"{table.extent[0]:.4g} mol")
+                col3.metric("Hasil Teoretis", f"{table.product_masses[0, product_index]:.4g} g")
+                if actual_mass:
+                    col4.metric("Rendemen", f"{table.percent_yield(product_index, actual_mass)[0]:.1f}%")
+                
+                dataframe(pd.DataFrame({
+                    "Spesies": table.reactants + table.products,
+                    "Peran": ["Reaktan"] * len(table.reactants) + ["Produk"] * len(table.products),
+                    "Tersedia (mol)": np.concatenate([table.supplied_moles[0], np.full(len(table.products), np.nan)]),
+                    "Bereaksi/Terbentuk (mol)": np.concatenate([table.consumed_moles[0], table.product_moles[0]]),
+                    "Bereaksi/Terbentuk (g)": np.concatenate([table.consumed_masses[0], table.product_masses[0]]),
+                    "Sisa (g)": np.concatenate([table.excess_masses[0], np.full(len(table.products), np.nan)])
+                }).round(4), use_container_width=True, hide_index=True)
+                
+                # Scale-up: semua ukuran batch dihitung dalam satu operasi matriks
+                st.markdown("### 📈 Tabel Scale-up")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    batch_min = st.number_input("Target produk terkecil (g):", min_value=0.001, value=100.0)
+                with col2:
+                    batch_max = st.number_input("Target produk terbesar (g):", min_value=0.001, value=10000.0)
+                with col3:
+                    batch_count = st.number_input("Jumlah skenario:", min_value=1, max_value=10000, value=100)
+                with col4:
+                    expected_yield = st.slider("Rendemen diharapkan (%):", 1, 100, 90)
+                
+                targets = np.linspace(batch_min, batch_max, int(batch_count))
+                try:
+                    factors = factors_for_product(table, product_index, targets, expected_yield)
+                except ValueError as exc:
+                    st.error(f"❌ {exc}")
+                else:
+                    scaled = scale_up(balanced, table.supplied_moles[0], factors)
+                    df_scale = pd.DataFrame({f"Target {table.products[product_index]} (g)": targets})
+                    for column, label in enumerate(table.reactants):
+                        df_scale[f"{label} (g)"] = scaled.supplied_masses[:, column]
+                        df_scale[f"Sisa {label} (g)"] = scaled.excess_masses[:, column]
+                    df_scale["Hasil Teoretis (g)"] = scaled.product_masses[:, product_index]
+                    df_scale = df_scale.dropna(axis=1, how="all").round(3)
+                    dataframe(df_scale, use_container_width=True, hide_index=True)
+                    st.download_button(
+                        label="💾 Download Tabel Scale-up (CSV)",
+                        data=df_scale.to_csv(index=False),
+                        file_name="scale_up.csv",
+                        mime="text/csv"
+                    )
+        
+        equations_file = st.file_uploader(
+            "Atau unggah daftar persamaan (satu per baris):", type=["txt", "csv"], key="equations_file"
+        )
+        if equations_file is not None and st.button("⚖️ Setarakan Semua"):
+            lines = io.TextIOWrapper(equations_file, encoding="utf-8", errors="replace")
+            balanced_rows = [
+                {
+                    "Persamaan": result.equation,
+                    "Setara": result.balanced,
+                    "Koefisien": " ".join(map(str, result.coefficients)),
+                    "Error": result.error or ""
+                }
+                for result in balance_equations(lines)
+            ]
+            lines.detach()
+            df_balanced = pd.DataFrame(balanced_rows, columns=["Persamaan", "Setara", "Koefisien", "Error"])
+            failed = int((df_balanced["Error"] != "").sum())
+            st.info(f"📊 {len(df_balanced):,} persamaan, {failed:,} gagal disetarakan")
+            dataframe(df_balanced, use_container_width=True, hide_index=True)
+            st.download_button(
+                label="💾 Download Hasil (CSV)",
+                data=df_balanced.to_csv(index=False),
+                file_name="persamaan_setara.csv",
+                mime="text/csv"
+            )
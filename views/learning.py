@@ -0,0 +1,122 @@
+"""Halaman Pembelajaran: modul konsep dan kuis interaktif."""
+import streamlit as st
+
+# Learning modules
+learning_modules = {
+    "Dasar-dasar Massa Atom": {
+        "content": """
+        ## 🔬 Massa Atom Relatif (Ar)
+        
+        **Definisi:** Massa atom relatif adalah perbandingan massa rata-rata satu atom unsur terhadap 1/12 massa satu atom karbon-12.
+        
+        ### 🔑 Konsep Penting:
+        - Ar tidak memiliki satuan (tanpa dimensi)
+        - Nilai Ar berbeda untuk setiap unsur
+        - Ar menunjukkan seberapa berat atom suatu unsur dibandingkan dengan standar
+        
+        ### 📊 Contoh:
+        - Ar(H) = 1.008 → Atom hidrogen 1.008 kali lebih berat dari 1/12 atom C-12
+        - Ar(O) = 16.00 → Atom oksigen 16 kali lebih berat dari 1/12 atom C-12
+        
+        ### 🧮 Perhitungan:
+        Ar = (Massa atom unsur) / (1/12 × massa atom C-12)
+        """,
+        "quiz": [
+            {"question": "Apa yang dimaksud dengan massa atom relatif?", "answer": "Perbandingan massa atom terhadap 1/12 massa atom C-12"},
+            {"question": "Mengapa Ar tidak memiliki satuan?", "answer": "Karena merupakan perbandingan (rasio) antara dua massa"}
+        ]
+    },
+    "Perhitungan Massa Molekul": {
+        "content": """
+        ## ⚗️ Massa Molekul Relatif (Mr)
+        
+        **Definisi:** Massa molekul relatif adalah jumlah dari semua massa atom relatif unsur-unsur penyusun molekul.
+        
+        ### 🔢 Rumus:
+        Mr = Σ (Ar × jumlah atom)
+        
+        ### 🌟 Langkah Perhitungan:
+        1. Identifikasi semua unsur dalam molekul
+        2. Hitung jumlah atom setiap unsur
+        3. Kalikan Ar dengan jumlah atom
+        4. Jumlahkan semua hasil
+        
+        ### 📝 Contoh Perhitungan:
+        **H₂SO₄ (Asam Sulfat)**
+        - H: 2 × 1.008 = 2.016
+        - S: 1 × 32.06 = 32.06
+        - O: 4 × 16.00 = 64.00
+        - **Mr = 2.016 + 32.06 + 64.00 = 98.076**
+        
+        ### 🔬 Aplikasi:
+        - Menghitung konsentrasi larutan
+        - Stoikiometri reaksi kimia
+        - Menentukan rumus molekul
+        """,
+        "quiz": [
+            {"question": "Bagaimana cara menghitung Mr H₂O?", "answer": "Mr = (2 × 1.008) + (1 × 16.00) = 18.016"},
+            {"question": "Apa perbedaan Ar dan Mr?", "answer": "Ar untuk atom tunggal, Mr untuk molekul/senyawa"}
+        ]
+    },
+    "Senyawa Hidrasi": {
+        "content": """
+        ## 💧 Senyawa Hidrasi
+        
+        **Definisi:** Senyawa hidrasi adalah kristal yang mengandung molekul air (H₂O) dalam struktur kristalnya.
+        
+        ### 🔍 Ciri-ciri:
+        - Ditulis dengan tanda titik (·) atau bullet (•)
+        - Air kristal dapat dilepaskan dengan pemanasan
+        - Mempengaruhi massa molekul total
+        
+        ### 📋 Contoh Umum:
+        - **CuSO₄·5H₂O** (Tembaga sulfat pentahidrat)
+        - **MgSO₄·7H₂O** (Magnesium sulfat heptahidrat)
+        - **Na₂CO₃·10H₂O** (Natrium karbonat dekahidrat)
+        
+        ### 🧮 Perhitungan:
+        **CuSO₄·5H₂O**
+        - CuSO₄: Mr = 63.5 + 32.1 + (4×16) = 159.6
+        - 5H₂O: Mr = 5 × 18.016 = 90.08
+        - **Total Mr = 159.6 + 90.08 = 249.68**
+        
+        ### ⚗️ Kegunaan:
+        - Industri farmasi
+        - Pembuatan pupuk
+        - Proses dehidrasi/hidrasi
+        """,
+        "quiz": [
+            {"question": "Apa yang dimaksud dengan senyawa hidrasi?", "answer": "Senyawa yang mengandung molekul air dalam struktur kristalnya"},
+            {"question": "Bagaimana menghitung Mr CaCl₂·2H₂O?", "answer": "Mr = (40+2×35.5) + (2×18) = 111 + 36 = 147"}
+        ]
+    }
+}
+
+def render():
+    st.header("📚 Modul Pembelajaran Kimia")
+    
+    # Module selector
+    selected_module = st.selectbox("Pilih modul pembelajaran:", list(learning_modules.keys()))
+    
+    if selected_module:
+        module = learning_modules[selected_module]
+        
+        # Display content
+        st.markdown(module["content"])
+        
+        # Interactive quiz
+        st.markdown("### 🧠 Kuis Interaktif")
+        
+        for i, quiz_item in enumerate(module["quiz"]):
+            with st.expander(f"Pertanyaan {i+1}: {quiz_item['question']}"):
+                user_answer = st.text_area(f"Jawaban Anda:", key=f"quiz_{selected_module}_{i}")
+                
+                if st.button(f"Lihat Jawaban", key=f"answer_{selected_module}_{i}"):
+                    st.success(f"**Jawaban:** {quiz_item['answer']}")
+                    
+                    # Simple answer checking
+                    if user_answer.lower().strip() in quiz_item['answer'].lower():
+                        st.balloons()
+                        st.success("🎉 Jawaban Anda benar!")
+                    else:
+                        st.info("💡 Coba bandingkan jawaban Anda dengan jawaban yang benar.")
@@ -0,0 +1,123 @@
+"""Halaman Visualisasi: grafik tabel periodik yang dibangun sekali per versi data."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from molcalc.elements import ELEMENTS
+
+from .common import dataframe, plotly_chart
+
+# Dataset dan grafik halaman Visualisasi: dibangun sekali per versi tabel unsur dan
+# dipakai bersama oleh semua sesi (cache_resource tidak menyalin objek)
+def _viz_mass_vs_number():
+    df_viz = pd.DataFrame({
+        'Simbol': ELEMENTS.symbol,
+        'Nomor Atom': ELEMENTS.number,
+        'Massa Atom': ELEMENTS.mass,
+        'Kategori': ELEMENTS.category,
+        'Periode': ELEMENTS.period
+    })
+    
+    fig_scatter = px.scatter(
+        df_viz,
+        x='Nomor Atom',
+        y='Massa Atom',
+        color='Kategori',
+        size='Periode',
+        hover_data=['Simbol'],
+        title='Hubungan Massa Atom dan Nomor Atom'
+    )
+    return (fig_scatter,), None
+
+def _viz_category_distribution():
+    category_count = {category: len(rows) for category, rows in ELEMENTS.by_category.items()}
+    
+    fig_pie = px.pie(
+        values=list(category_count.values()),
+        names=list(category_count.keys()),
+        title='Distribusi Unsur Berdasarkan Kategori'
+    )
+    fig_bar = px.bar(
+        x=list(category_count.keys()),
+        y=list(category_count.values()),
+        title='Jumlah Unsur per Kategori'
+    )
+    return (fig_pie, fig_bar), None
+
+def _viz_periodic_heatmap():
+    # Lantanida dan aktinida (tanpa golongan) tidak masuk peta golongan × periode
+    rows = [row for row, group in enumerate(ELEMENTS.group) if group]
+    columns = ELEMENTS.columns(rows)
+    df_heatmap = pd.DataFrame({
+        'Golongan': columns['group'],
+        'Periode': columns['period'],
+        'Massa': columns['mass'],
+        'Simbol': columns['symbol']
+    })
+    pivot_table = df_heatmap.pivot(index='Periode', columns='Golongan', values='Massa')
+    
+    fig_heatmap = px.imshow(
+        pivot_table,
+        title='Peta Panas Massa Atom dalam Tabel Periodik',
+        labels=dict(x="Golongan", y="Periode", color="Massa Atom")
+    )
+    return (fig_heatmap,), None
+
+def _viz_period_analysis():
+    period_stats = []
+    for period in ELEMENTS.periods:
+        masses = [ELEMENTS.mass[row] for row in ELEMENTS.by_period[period]]
+        period_stats.append({
+            'Periode': period,
+            'Jumlah Unsur': len(masses),
+            'Massa Rata-rata': sum(masses) / len(masses),
+            'Massa Minimum': min(masses),
+            'Massa Maksimum': max(masses)
+        })
+    df_period = pd.DataFrame(period_stats)
+    
+    fig_lines = go.Figure()
+    for column, name, color in (('Massa Rata-rata', 'Rata-rata', 'blue'),
+                                ('Massa Maksimum', 'Maksimum', 'red'),
+                                ('Massa Minimum', 'Minimum', 'green')):
+        fig_lines.add_trace(go.Scatter(
+            x=df_period['Periode'],
+            y=df_period[column],
+            mode='lines+markers',
+            name=name,
+            line=dict(color=color)
+        ))
+    fig_lines.update_layout(
+        title='Tren Massa Atom Berdasarkan Periode',
+        xaxis_title='Periode',
+        yaxis_title='Massa Atom (u)'
+    )
+    return (fig_lines,), df_period
+
+VISUALIZATIONS = {
+    "Massa Atom vs Nomor Atom": _viz_mass_vs_number,
+    "Distribusi Kategori": _viz_category_distribution,
+    "Peta Panas Tabel Periodik": _viz_periodic_heatmap,
+    "Analisis Periode": _viz_period_analysis,
+}
+
+@st.cache_resource(show_spinner=False)
+def build_visualization(viz_type: str, version: str):
+    """(grafik, tabel atau None) untuk satu jenis visualisasi; kunci ``version`` membatalkan cache saat data unsur berubah"""
+    return VISUALIZATIONS[viz_type]()
+
+def render():
+    st.header("📈 Visualisasi Data Kimia")
+    
+    # Visualization options
+    viz_type = st.selectbox(
+        "Pilih jenis visualisasi:",
+        list(VISUALIZATIONS)
+    )
+    
+    figures, table = build_visualization(viz_type, ELEMENTS.version)
+    for figure in figures:
+        plotly_chart(figure, use_container_width=True)
+    if table is not None:
+        dataframe(table, use_container_width=True)